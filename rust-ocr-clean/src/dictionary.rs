@@ -13,6 +13,9 @@ use zspell::Dictionary;
 /// Global dictionary instances (loaded once, reused)
 static DICTIONARIES: OnceLock<MultiLangDict> = OnceLock::new();
 
+/// Language codes for the bits of language_mask (bit i is MASK_LANGUAGES[i])
+pub const MASK_LANGUAGES: [&str; 4] = ["en", "de", "fr", "la"];
+
 /// Multi-language dictionary container
 pub struct MultiLangDict {
     english: Option<Dictionary>,
@@ -41,11 +44,7 @@ impl MultiLangDict {
             return true;
         }
         // Try lowercase
-        let lower = word.to_lowercase();
-        if lower != word && self.check_exact(&lower) {
-            return true;
-        }
-        false
+        with_lowercase(word, |lower| lower != word && self.check_exact(lower))
     }
 
     fn check_exact(&self, word: &str) -> bool {
@@ -73,6 +72,43 @@ impl MultiLangDict {
         false
     }
 
+    /// Bit mask of the MASK_LANGUAGES dictionaries that know a word
+    /// Matches exact or lowercase forms as check() does, without allocating for
+    /// words that are already lowercase or short ASCII.
+    pub fn language_mask(&self, word: &str) -> u8 {
+        let mask = self.exact_language_mask(word);
+        with_lowercase(word, |lower| {
+            if lower != word {
+                mask | self.exact_language_mask(lower)
+            } else {
+                mask
+            }
+        })
+    }
+
+    fn exact_language_mask(&self, word: &str) -> u8 {
+        let mut mask = 0;
+        if let Some(ref d) = self.english {
+            if d.check_word(word) {
+                mask |= 1;
+            }
+        }
+        if let Some(ref d) = self.german {
+            if d.check_word(word) {
+                mask |= 2;
+            }
+        }
+        if let Some(ref d) = self.french {
+            if d.check_word(word) {
+                mask |= 4;
+            }
+        }
+        if self.latin.contains(word) {
+            mask |= 8;
+        }
+        mask
+    }
+
     /// Check which language(s) a word belongs to (for debugging)
     pub fn check_languages(&self, word: &str) -> Vec<&'static str> {
         let mut langs = Vec::new();
@@ -115,6 +151,31 @@ impl MultiLangDict {
     }
 }
 
+/// Longest ASCII word lowercased on the stack by with_lowercase
+const STACK_LOWERCASE_LEN: usize = 64;
+
+/// Call f with the lowercase form of word, allocating only when needed
+/// Already-lowercase words are passed through as is, and short ASCII words are
+/// case-folded into a stack buffer; anything else goes through to_lowercase.
+pub fn with_lowercase<R>(word: &str, f: impl FnOnce(&str) -> R) -> R {
+    if word.is_ascii() {
+        if !word.bytes().any(|b| b.is_ascii_uppercase()) {
+            return f(word);
+        }
+        if word.len() <= STACK_LOWERCASE_LEN {
+            let mut buf = [0u8; STACK_LOWERCASE_LEN];
+            let lower = &mut buf[..word.len()];
+            lower.copy_from_slice(word.as_bytes());
+            lower.make_ascii_lowercase();
+            // ASCII case folding keeps the bytes valid UTF-8
+            if let Ok(lower) = std::str::from_utf8(lower) {
+                return f(lower);
+            }
+        }
+    }
+    f(&word.to_lowercase())
+}
+
 /// Load a simple word list file (one word per line)
 fn load_wordlist(dict_dir: &Path, filename: &str, label: &str) -> HashSet<String> {
     let wordlist_path = dict_dir.join(filename);
@@ -224,6 +285,15 @@ pub fn word_languages(word: &str) -> Vec<&'static str> {
     }
 }
 
+/// Languages whose dictionaries know a word, as a MASK_LANGUAGES bit mask
+/// (0 if dictionaries are not loaded)
+pub fn language_mask(word: &str) -> u8 {
+    match DICTIONARIES.get() {
+        Some(dict) => dict.language_mask(word),
+        None => 0,
+    }
+}
+
 /// Check if dictionaries are loaded
 pub fn dictionaries_loaded() -> bool {
     DICTIONARIES.get().is_some()
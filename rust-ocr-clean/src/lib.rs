@@ -4,9 +4,11 @@ use lazy_static::lazy_static;
 use unicode_normalization::UnicodeNormalization;
 use whatlang::{detect, Lang};
 use rayon::prelude::*;
-use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::sync::Arc;
+use std::sync::atomic::{AtomicBool, AtomicU64, AtomicUsize, Ordering};
 
 mod dictionary;
+mod symspell;
 
 // Pre-compile all OCR patterns at module load time
 // Each pattern is: (regex, replacement, optional_context_regex, category)
@@ -1296,6 +1298,47 @@ lazy_static! {
     };
 }
 
+// Patterns that indicate garbage OCR (not fixable, flag for review)
+// Matched case-insensitively
+lazy_static! {
+    static ref GARBAGE_PATTERNS: Vec<(&'static str, Regex)> = {
+        [
+            r"[^\x00-\x7F]{10,}",          // Long runs of non-ASCII
+            r"[bcdfghjklmnpqrstvwxz]{6,}",  // Long consonant runs
+            r"\d{2,}[a-z]+\d{2,}",          // Numbers mixed into words oddly
+            r"[|l1I]{5,}",                  // Pipe/l/1/I confusion runs
+        ]
+        .iter()
+        .map(|p| (*p, Regex::new(&format!("(?i){}", p)).unwrap()))
+        .collect()
+    };
+}
+
+/// A document is flagged for a garbage pattern once it has more matches than this
+const GARBAGE_MATCH_THRESHOLD: usize = 5;
+
+/// Check text for unfixable garbage patterns
+/// Returns: Vec of (pattern, count) for each flagged pattern. Counting stops once a
+/// pattern passes the threshold, so count is capped at GARBAGE_MATCH_THRESHOLD + 1.
+fn check_garbage_internal(text: &str) -> Vec<(String, u64)> {
+    let mut issues = Vec::new();
+    for (pattern, regex) in GARBAGE_PATTERNS.iter() {
+        let count = regex.find_iter(text).take(GARBAGE_MATCH_THRESHOLD + 1).count();
+        if count > GARBAGE_MATCH_THRESHOLD {
+            issues.push((pattern.to_string(), count as u64));
+        }
+    }
+    issues
+}
+
+/// Check text for unfixable garbage patterns
+/// Returns: list of (pattern, count) for each pattern matching more than
+/// GARBAGE_MATCH_THRESHOLD times (count capped at threshold + 1)
+#[pyfunction]
+fn check_garbage(py: Python<'_>, text: &str) -> Vec<(String, u64)> {
+    py.detach(|| check_garbage_internal(text))
+}
+
 /// Result of OCR cleanup with category breakdown
 #[pyclass]
 #[derive(Clone)]
@@ -1306,6 +1349,8 @@ pub struct CleanupResult {
     pub total_substitutions: u64,
     #[pyo3(get)]
     pub substitutions_by_category: std::collections::HashMap<String, u64>,
+    #[pyo3(get)]
+    pub garbage_issues: Vec<(String, u64)>,
 }
 
 /// Get the number of loaded OCR patterns (for debugging)
@@ -1324,11 +1369,13 @@ fn clean_text(text: String) -> PyResult<(String, u64)> {
 /// Clean OCR errors in text and return detailed category breakdown
 #[pyfunction]
 fn clean_text_with_categories(text: String) -> PyResult<CleanupResult> {
+    let garbage_issues = check_garbage_internal(&text);
     let (result, subs, categories) = clean_text_internal(&text);
     Ok(CleanupResult {
         text: result,
         total_substitutions: subs,
         substitutions_by_category: categories,
+        garbage_issues,
     })
 }
 
@@ -1396,47 +1443,30 @@ fn count_context_patterns_batch(file_paths: Vec<String>) -> PyResult<std::collec
 
 /// Clean a single file, reading and writing entirely in Rust
 /// Pipeline: strip boilerplate -> OCR cleanup -> write output
-/// Returns: (was_modified, substitution_count, bytes_read, categories, boilerplate_regions)
-/// where categories is a HashMap of category_name -> count
-/// and boilerplate_regions is a list of (category, pattern_name, start_line, end_line, char_count)
+/// Returns: (was_modified, substitution_count, bytes_read, categories, boilerplate_regions, garbage_issues, chars_read)
+/// where categories is a HashMap of category_name -> count,
+/// boilerplate_regions is a list of (category, pattern_name, start_line, end_line, char_count),
+/// garbage_issues is a list of (pattern, count) for flagged garbage patterns
+/// and chars_read is the decoded length of the input text
 #[pyfunction]
-fn clean_file_to_file(input_path: String, output_path: String) -> PyResult<(bool, u64, u64, std::collections::HashMap<String, u64>, Vec<(String, String, usize, usize, usize)>)> {
-    use std::fs;
-    use std::path::Path;
-
-    // Read file
-    let content = fs::read_to_string(&input_path)
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Failed to read {}: {}", input_path, e)))?;
-    
-    let bytes_read = content.len() as u64;
-    
-    // Step 1: Strip boilerplate (digitization notices, library stamps, etc.)
-    let (stripped_content, boilerplate_regions) = strip_boilerplate_internal(&content);
+fn clean_file_to_file(py: Python<'_>, input_path: String, output_path: String) -> PyResult<(bool, u64, u64, std::collections::HashMap<String, u64>, Vec<(String, String, usize, usize, usize)>, Vec<(String, u64)>, u64)> {
+    // Read, clean and write without holding the GIL. Only this single-file path
+    // reports chars_read, so the batch path skips the extra count.
+    let ((was_modified, subs, bytes_read, categories, boilerplate_regions, garbage_issues), chars_read) = py
+        .detach(|| {
+            let content = read_input_file(&input_path)?;
+            let chars_read = content.chars().count() as u64;
+            clean_content_to_file(&content, &output_path).map(|result| (result, chars_read))
+        })
+        .map_err(pyo3::exceptions::PyIOError::new_err)?;
     
     // Convert boilerplate regions to tuple format for Python
     let boilerplate_tuples: Vec<(String, String, usize, usize, usize)> = boilerplate_regions
         .iter()
         .map(|r| (r.category.clone(), r.pattern_name.clone(), r.start_line, r.end_line, r.char_count))
         .collect();
-    
-    // Step 2: OCR cleanup on stripped content
-    let (cleaned, subs, categories) = clean_text_internal(&stripped_content);
-    
-    // Document was modified if we stripped boilerplate OR made OCR substitutions
-    let was_modified = !boilerplate_regions.is_empty() || subs > 0;
-
-    // Ensure parent directory exists
-    let out_path = Path::new(&output_path);
-    if let Some(parent) = out_path.parent() {
-        fs::create_dir_all(parent)
-            .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Failed to create directory: {}", e)))?;
-    }
-
-    // Write output
-    fs::write(out_path, &cleaned)
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Failed to write {}: {}", output_path, e)))?;
 
-    Ok((was_modified, subs, bytes_read, categories, boilerplate_tuples))
+    Ok((was_modified, subs, bytes_read, categories, boilerplate_tuples, garbage_issues, chars_read))
 }
 
 /// Statistics for a batch of files processed in parallel
@@ -1459,6 +1489,10 @@ struct BatchStats {
     boilerplate_files: usize,
     #[pyo3(get)]
     boilerplate_chars: u64,
+    #[pyo3(get)]
+    files_flagged: usize,
+    #[pyo3(get)]
+    substitutions_by_category: std::collections::HashMap<String, u64>,
 }
 
 #[pymethods]
@@ -1472,25 +1506,41 @@ impl BatchStats {
     }
 }
 
+/// Thread count used when a caller passes none: one per available CPU core
+fn default_num_threads() -> usize {
+    std::thread::available_parallelism().map_or(1, |n| n.get())
+}
+
 /// Process multiple files in parallel using Rayon
 /// 
 /// Args:
-///     file_pairs: List of (input_path, output_path) tuples
-///     num_threads: Number of threads to use (default: 24)
+///     input_paths: List of input file paths
+///     output_paths: List of output file paths, parallel to input_paths
+///     num_threads: Number of threads to use (default: all CPU cores)
 /// 
 /// Returns:
 ///     BatchStats with aggregated statistics
 #[pyfunction]
-#[pyo3(signature = (file_pairs, num_threads=None))]
+#[pyo3(signature = (input_paths, output_paths, num_threads=None))]
 fn clean_batch_parallel(
-    file_pairs: Vec<(String, String)>,
+    py: Python<'_>,
+    input_paths: Vec<String>,
+    output_paths: Vec<String>,
     num_threads: Option<usize>,
 ) -> PyResult<BatchStats> {
     use std::fs;
     use std::path::Path;
-    use std::collections::HashSet;
+    use std::collections::{HashMap, HashSet};
+    
+    if input_paths.len() != output_paths.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "input_paths and output_paths differ in length ({} vs {})",
+            input_paths.len(),
+            output_paths.len()
+        )));
+    }
     
-    let threads = num_threads.unwrap_or(24);
+    let threads = num_threads.unwrap_or_else(default_num_threads);
     
     // Configure thread pool (only if not already set)
     rayon::ThreadPoolBuilder::new()
@@ -1499,9 +1549,9 @@ fn clean_batch_parallel(
         .ok(); // Ignore error if already initialized
     
     // Pre-create all output directories (single-threaded to avoid races)
-    let output_dirs: HashSet<_> = file_pairs
+    let output_dirs: HashSet<_> = output_paths
         .iter()
-        .filter_map(|(_, output)| Path::new(output).parent().map(|p| p.to_path_buf()))
+        .filter_map(|output| Path::new(output).parent().map(|p| p.to_path_buf()))
         .collect();
     
     for dir in &output_dirs {
@@ -1517,34 +1567,56 @@ fn clean_batch_parallel(
     let long_s_fixes = AtomicU64::new(0);
     let boilerplate_files = AtomicUsize::new(0);
     let boilerplate_chars = AtomicU64::new(0);
-    
-    // Process files in parallel
-    file_pairs.par_iter().for_each(|(input_path, output_path)| {
-        match clean_file_internal(input_path, output_path) {
-            Ok((was_modified, subs, bytes, categories, bp_regions)) => {
-                files_processed.fetch_add(1, Ordering::Relaxed);
-                total_bytes.fetch_add(bytes, Ordering::Relaxed);
-                total_substitutions.fetch_add(subs, Ordering::Relaxed);
-                
-                if was_modified {
-                    files_modified.fetch_add(1, Ordering::Relaxed);
-                }
-                
-                if let Some(ls) = categories.get("long_s") {
-                    long_s_fixes.fetch_add(*ls, Ordering::Relaxed);
+    let files_flagged = AtomicUsize::new(0);
+    
+    // Process files in parallel, without holding the GIL. Category counts are
+    // folded per worker and merged once, rather than shared behind a lock.
+    let substitutions_by_category = py.detach(|| {
+        input_paths
+            .par_iter()
+            .zip(output_paths.par_iter())
+            .fold(HashMap::new, |mut category_totals: HashMap<String, u64>, (input_path, output_path)| {
+                match clean_file_internal(input_path, output_path) {
+                    Ok((was_modified, subs, bytes, categories, bp_regions, garbage_issues)) => {
+                        files_processed.fetch_add(1, Ordering::Relaxed);
+                        total_bytes.fetch_add(bytes, Ordering::Relaxed);
+                        total_substitutions.fetch_add(subs, Ordering::Relaxed);
+                        
+                        if was_modified {
+                            files_modified.fetch_add(1, Ordering::Relaxed);
+                        }
+                        
+                        if let Some(ls) = categories.get("long_s") {
+                            long_s_fixes.fetch_add(*ls, Ordering::Relaxed);
+                        }
+                        
+                        if !bp_regions.is_empty() {
+                            boilerplate_files.fetch_add(1, Ordering::Relaxed);
+                            let bp_chars: usize = bp_regions.iter().map(|r| r.char_count).sum();
+                            boilerplate_chars.fetch_add(bp_chars as u64, Ordering::Relaxed);
+                        }
+                        
+                        if !garbage_issues.is_empty() {
+                            files_flagged.fetch_add(1, Ordering::Relaxed);
+                        }
+                        
+                        for (category, count) in categories {
+                            *category_totals.entry(category).or_insert(0) += count;
+                        }
+                    }
+                    Err(e) => {
+                        files_failed.fetch_add(1, Ordering::Relaxed);
+                        eprintln!("Error processing {}: {}", input_path, e);
+                    }
                 }
-                
-                if !bp_regions.is_empty() {
-                    boilerplate_files.fetch_add(1, Ordering::Relaxed);
-                    let bp_chars: usize = bp_regions.iter().map(|r| r.char_count).sum();
-                    boilerplate_chars.fetch_add(bp_chars as u64, Ordering::Relaxed);
+                category_totals
+            })
+            .reduce(HashMap::new, |mut merged, partial| {
+                for (category, count) in partial {
+                    *merged.entry(category).or_insert(0) += count;
                 }
-            }
-            Err(e) => {
-                files_failed.fetch_add(1, Ordering::Relaxed);
-                eprintln!("Error processing {}: {}", input_path, e);
-            }
-        }
+                merged
+            })
     });
     
     Ok(BatchStats {
@@ -1556,6 +1628,8 @@ fn clean_batch_parallel(
         long_s_fixes: long_s_fixes.load(Ordering::Relaxed),
         boilerplate_files: boilerplate_files.load(Ordering::Relaxed),
         boilerplate_chars: boilerplate_chars.load(Ordering::Relaxed),
+        files_flagged: files_flagged.load(Ordering::Relaxed),
+        substitutions_by_category,
     })
 }
 
@@ -1563,18 +1637,33 @@ fn clean_batch_parallel(
 fn clean_file_internal(
     input_path: &str,
     output_path: &str,
-) -> Result<(bool, u64, u64, std::collections::HashMap<String, u64>, Vec<StrippedRegion>), String> {
+) -> Result<(bool, u64, u64, std::collections::HashMap<String, u64>, Vec<StrippedRegion>, Vec<(String, u64)>), String> {
+    let content = read_input_file(input_path)?;
+    clean_content_to_file(&content, output_path)
+}
+
+/// Read an input file for the file cleaners
+fn read_input_file(input_path: &str) -> Result<String, String> {
+    std::fs::read_to_string(input_path)
+        .map_err(|e| format!("Failed to read {}: {}", input_path, e))
+}
+
+/// Clean already-read file content and write it to output_path
+/// Returns the same tuple as clean_file_internal.
+fn clean_content_to_file(
+    content: &str,
+    output_path: &str,
+) -> Result<(bool, u64, u64, std::collections::HashMap<String, u64>, Vec<StrippedRegion>, Vec<(String, u64)>), String> {
     use std::fs;
     use std::path::Path;
     
-    // Read file
-    let content = fs::read_to_string(input_path)
-        .map_err(|e| format!("Failed to read {}: {}", input_path, e))?;
-    
     let bytes_read = content.len() as u64;
     
+    // Flag unfixable garbage on the original text
+    let garbage_issues = check_garbage_internal(content);
+    
     // Step 1: Strip boilerplate
-    let (stripped_content, boilerplate_regions) = strip_boilerplate_internal(&content);
+    let (stripped_content, boilerplate_regions) = strip_boilerplate_internal(content);
     
     // Step 2: OCR cleanup
     let (cleaned, subs, categories) = clean_text_internal(&stripped_content);
@@ -1592,7 +1681,35 @@ fn clean_file_internal(
     fs::write(out_path, &cleaned)
         .map_err(|e| format!("Failed to write {}: {}", output_path, e))?;
     
-    Ok((was_modified, subs, bytes_read, categories, boilerplate_regions))
+    Ok((was_modified, subs, bytes_read, categories, boilerplate_regions, garbage_issues))
+}
+
+/// Replacer that counts the matches it replaces
+/// Each replacement is written straight into the output: literal replacements are
+/// appended as-is and `$` templates are expanded in place, so nothing is allocated
+/// per match. no_expansion is left as None on purpose: regex's literal fast path
+/// never calls replace_append, so its matches could not be counted.
+struct CountingReplacer<'r> {
+    rep: &'r str,
+    literal: bool,
+    count: u64,
+}
+
+impl<'r> CountingReplacer<'r> {
+    fn new(rep: &'r str) -> Self {
+        CountingReplacer { rep, literal: !rep.contains('$'), count: 0 }
+    }
+}
+
+impl regex::Replacer for CountingReplacer<'_> {
+    fn replace_append(&mut self, caps: &regex::Captures<'_>, dst: &mut String) {
+        self.count += 1;
+        if self.literal {
+            dst.push_str(self.rep);
+        } else {
+            caps.expand(self.rep, dst);
+        }
+    }
 }
 
 /// Internal clean function (not exposed to Python, avoids string copies)
@@ -1625,12 +1742,14 @@ fn clean_text_internal(text: &str) -> (String, u64, std::collections::HashMap<St
                 *category_counts.entry(category.to_string()).or_insert(0) += match_count;
             }
         } else {
-            // Direct replacement
-            let before_count = pattern.find_iter(&result).count();
-            if before_count > 0 {
-                result = pattern.replace_all(&result, *replacement).into_owned();
-                total_subs += before_count as u64;
-                *category_counts.entry(category.to_string()).or_insert(0) += before_count as u64;
+            // Direct replacement - count and replace in a single scan
+            let mut replacer = CountingReplacer::new(replacement);
+            let replaced = pattern.replace_all(&result, regex::Replacer::by_ref(&mut replacer));
+            let match_count = replacer.count;
+            if match_count > 0 {
+                result = replaced.into_owned();
+                total_subs += match_count;
+                *category_counts.entry(category.to_string()).or_insert(0) += match_count;
             }
         }
     }
@@ -1638,6 +1757,341 @@ fn clean_text_internal(text: &str) -> (String, u64, std::collections::HashMap<St
     (result, total_subs, category_counts)
 }
 
+// =============================================================================
+// File Discovery
+// =============================================================================
+
+/// Case-sensitive fnmatch-style match of a file name against a glob pattern
+/// Supports *, ?, [seq] and [!seq]; an unterminated [ matches literally
+fn glob_match(pattern: &[char], name: &[char]) -> bool {
+    let (mut p, mut n) = (0, 0);
+    // Position of the last * in the pattern and the name position it is trying
+    let mut backtrack: Option<(usize, usize)> = None;
+    
+    while n < name.len() {
+        if p < pattern.len() {
+            match pattern[p] {
+                '*' => {
+                    backtrack = Some((p, n));
+                    p += 1;
+                    continue;
+                }
+                '?' => {
+                    p += 1;
+                    n += 1;
+                    continue;
+                }
+                '[' => match glob_class(pattern, p, name[n]) {
+                    Some((true, next)) => {
+                        p = next;
+                        n += 1;
+                        continue;
+                    }
+                    Some((false, _)) => {}
+                    None if name[n] == '[' => {
+                        p += 1;
+                        n += 1;
+                        continue;
+                    }
+                    None => {}
+                },
+                c if c == name[n] => {
+                    p += 1;
+                    n += 1;
+                    continue;
+                }
+                _ => {}
+            }
+        }
+        // Mismatch: let the last * absorb one more character
+        match backtrack {
+            Some((star_p, star_n)) => {
+                p = star_p + 1;
+                n = star_n + 1;
+                backtrack = Some((star_p, star_n + 1));
+            }
+            None => return false,
+        }
+    }
+    
+    while p < pattern.len() && pattern[p] == '*' {
+        p += 1;
+    }
+    p == pattern.len()
+}
+
+/// Match c against the [...] class starting at pattern[start]
+/// Returns None if the class is unterminated, else (matched, index after the closing ])
+fn glob_class(pattern: &[char], start: usize, c: char) -> Option<(bool, usize)> {
+    let mut i = start + 1;
+    let negate = i < pattern.len() && pattern[i] == '!';
+    if negate {
+        i += 1;
+    }
+    let class_start = i;
+    let mut matched = false;
+    
+    while i < pattern.len() {
+        // A ] right after [ or [! is a literal member
+        if pattern[i] == ']' && i > class_start {
+            return Some((matched != negate, i + 1));
+        }
+        if i + 2 < pattern.len() && pattern[i + 1] == '-' && pattern[i + 2] != ']' {
+            if pattern[i] <= c && c <= pattern[i + 2] {
+                matched = true;
+            }
+            i += 3;
+        } else {
+            if pattern[i] == c {
+                matched = true;
+            }
+            i += 1;
+        }
+    }
+    None
+}
+
+/// Return the entry's path if it is a file (or symlink to one) whose name matches pattern
+fn matching_file_path(
+    entry: &std::fs::DirEntry,
+    file_type: &std::fs::FileType,
+    pattern: &[char],
+) -> Option<String> {
+    let name: Vec<char> = entry.file_name().to_str()?.chars().collect();
+    if !glob_match(pattern, &name) {
+        return None;
+    }
+    
+    let path = entry.path();
+    // Symlinks count if they point at a regular file
+    if file_type.is_file() || (file_type.is_symlink() && path.is_file()) {
+        path.to_str().map(|p| p.to_string())
+    } else {
+        None
+    }
+}
+
+/// Recursively collect files under dir whose names match pattern
+/// Subdirectories are walked in parallel; symlinked directories are not followed
+/// and unreadable directories are skipped.
+fn find_files_in(dir: &std::path::Path, pattern: &[char]) -> Vec<String> {
+    let entries = match std::fs::read_dir(dir) {
+        Ok(entries) => entries,
+        Err(_) => return Vec::new(),
+    };
+    
+    let mut files = Vec::new();
+    let mut subdirs = Vec::new();
+    
+    for entry in entries.flatten() {
+        let file_type = match entry.file_type() {
+            Ok(t) => t,
+            Err(_) => continue,
+        };
+        if file_type.is_dir() {
+            subdirs.push(entry.path());
+            continue;
+        }
+        if let Some(path_str) = matching_file_path(&entry, &file_type, pattern) {
+            files.push(path_str);
+        }
+    }
+    
+    let nested: Vec<Vec<String>> = subdirs
+        .par_iter()
+        .map(|subdir| find_files_in(subdir, pattern))
+        .collect();
+    for mut sub_files in nested {
+        files.append(&mut sub_files);
+    }
+    
+    files
+}
+
+/// Recursively find files under root whose names match a glob pattern (e.g. "*.txt")
+/// Directories are walked in parallel with Rayon.
+/// 
+/// Args:
+///     root: Directory to search
+///     pattern: fnmatch-style file name pattern
+///     num_threads: Number of threads to use (default: all CPU cores)
+/// 
+/// Returns:
+///     List of matching file paths
+#[pyfunction]
+#[pyo3(signature = (root, pattern, num_threads=None))]
+fn find_files(py: Python<'_>, root: &str, pattern: &str, num_threads: Option<usize>) -> PyResult<Vec<String>> {
+    let threads = num_threads.unwrap_or_else(default_num_threads);
+    
+    // Configure thread pool (only if not already set)
+    rayon::ThreadPoolBuilder::new()
+        .num_threads(threads)
+        .build_global()
+        .ok();
+    
+    let pattern: Vec<char> = pattern.chars().collect();
+    Ok(py.detach(|| find_files_in(std::path::Path::new(root), &pattern)))
+}
+
+// =============================================================================
+// Corpus Analysis
+// =============================================================================
+
+/// Call visit for each file under dir whose name matches pattern
+/// Same matching rules as find_files_in, but walks sequentially and keeps no list.
+fn visit_files_in(dir: &std::path::Path, pattern: &[char], visit: &mut dyn FnMut(String)) {
+    let entries = match std::fs::read_dir(dir) {
+        Ok(entries) => entries,
+        Err(_) => return,
+    };
+    
+    for entry in entries.flatten() {
+        let file_type = match entry.file_type() {
+            Ok(t) => t,
+            Err(_) => continue,
+        };
+        if file_type.is_dir() {
+            visit_files_in(&entry.path(), pattern, visit);
+        } else if let Some(path_str) = matching_file_path(&entry, &file_type, pattern) {
+            visit(path_str);
+        }
+    }
+}
+
+/// SplitMix64 step, used to drive reservoir sampling without an RNG dependency
+fn splitmix64(state: &mut u64) -> u64 {
+    *state = state.wrapping_add(0x9E37_79B9_7F4A_7C15);
+    let mut z = *state;
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+    z ^ (z >> 31)
+}
+
+/// Uniformly sample up to sample_size matching files in a single walk (Algorithm R)
+fn reservoir_sample_files(root: &str, pattern: &[char], sample_size: usize, seed: u64) -> Vec<String> {
+    let mut reservoir: Vec<String> = Vec::with_capacity(sample_size.min(1 << 16));
+    let mut seen: u64 = 0;
+    let mut state = seed;
+    
+    visit_files_in(std::path::Path::new(root), pattern, &mut |path| {
+        if reservoir.len() < sample_size {
+            reservoir.push(path);
+        } else {
+            let j = (splitmix64(&mut state) % (seen + 1)) as usize;
+            if j < sample_size {
+                reservoir[j] = path;
+            }
+        }
+        seen += 1;
+    });
+    
+    reservoir
+}
+
+/// OCR error summary for a sample of a corpus
+#[pyclass]
+#[derive(Clone)]
+struct CorpusAnalysis {
+    #[pyo3(get)]
+    files_analyzed: usize,
+    #[pyo3(get)]
+    total_words: u64,
+    #[pyo3(get)]
+    error_counts: std::collections::HashMap<String, u64>,
+    #[pyo3(get)]
+    garbage_files: Vec<String>,
+}
+
+#[pymethods]
+impl CorpusAnalysis {
+    fn __repr__(&self) -> String {
+        format!(
+            "CorpusAnalysis(files={}, words={}, garbage_files={})",
+            self.files_analyzed, self.total_words, self.garbage_files.len()
+        )
+    }
+}
+
+/// Analyze a random sample of a corpus for OCR errors without modifying it
+/// 
+/// Files are reservoir-sampled during a single directory walk, then analyzed
+/// in parallel with Rayon. Unreadable files are skipped.
+/// 
+/// Args:
+///     root: Directory to search
+///     pattern: fnmatch-style file name pattern (e.g. "*.txt")
+///     sample_size: Maximum number of files to analyze
+///     seed: Sampling seed (default: random)
+///     num_threads: Number of threads to use (default: all CPU cores)
+/// 
+/// Returns:
+///     CorpusAnalysis with word count, error counts by category and garbage files
+#[pyfunction]
+#[pyo3(signature = (root, pattern, sample_size, seed=None, num_threads=None))]
+fn analyze_corpus(
+    py: Python<'_>,
+    root: String,
+    pattern: String,
+    sample_size: usize,
+    seed: Option<u64>,
+    num_threads: Option<usize>,
+) -> PyResult<CorpusAnalysis> {
+    use std::collections::HashMap;
+    
+    let threads = num_threads.unwrap_or_else(default_num_threads);
+    
+    // Configure thread pool (only if not already set)
+    rayon::ThreadPoolBuilder::new()
+        .num_threads(threads)
+        .build_global()
+        .ok();
+    
+    let seed = seed.unwrap_or_else(|| {
+        std::time::SystemTime::now()
+            .duration_since(std::time::UNIX_EPOCH)
+            .map(|d| d.as_nanos() as u64)
+            .unwrap_or(0)
+    });
+    let pattern: Vec<char> = pattern.chars().collect();
+    
+    // Walk, sample and analyze without holding the GIL
+    let (sample, results) = py.detach(|| {
+        let sample = reservoir_sample_files(&root, &pattern, sample_size, seed);
+        
+        // (path index, words, categories, has_garbage) per readable file, in sample order
+        let results: Vec<(usize, u64, HashMap<String, u64>, bool)> = sample
+            .par_iter()
+            .enumerate()
+            .filter_map(|(idx, path)| {
+                let bytes = std::fs::read(path).ok()?;
+                let content = String::from_utf8_lossy(&bytes);
+                let words = content.split_whitespace().count() as u64;
+                let has_garbage = !check_garbage_internal(&content).is_empty();
+                let (_cleaned, _subs, categories) = clean_text_internal(&content);
+                Some((idx, words, categories, has_garbage))
+            })
+            .collect();
+        (sample, results)
+    });
+    
+    let mut analysis = CorpusAnalysis {
+        files_analyzed: sample.len(),
+        total_words: 0,
+        error_counts: HashMap::new(),
+        garbage_files: Vec::new(),
+    };
+    for (idx, words, categories, has_garbage) in results {
+        analysis.total_words += words;
+        for (category, count) in categories {
+            *analysis.error_counts.entry(category).or_insert(0) += count;
+        }
+        if has_garbage {
+            analysis.garbage_files.push(sample[idx].clone());
+        }
+    }
+    Ok(analysis)
+}
+
 // =============================================================================
 // Vocabulary Extraction
 // =============================================================================
@@ -1900,10 +2354,15 @@ fn extract_vocab_from_file(
     
     for cap in WORD_PATTERN.find_iter(&content) {
         let word = cap.as_str();
+        // Skip short words (<3 chars) and common words; they are most tokens, so they
+        // are rejected before a lowercase copy is allocated
+        if word.len() < 3 || dictionary::with_lowercase(word, |lower| SKIP_WORDS.contains(lower)) {
+            continue;
+        }
         let word_lower = word.to_lowercase();
         
-        // Skip common words, short words (<3 chars), whitelisted words, and Roman numerals
-        if word.len() < 3 || SKIP_WORDS.contains(word_lower.as_str()) || is_whitelisted(&word_lower) || ROMAN_NUMERAL_PATTERN.is_match(word) {
+        // Skip whitelisted words and Roman numerals
+        if is_whitelisted(&word_lower) || ROMAN_NUMERAL_PATTERN.is_match(word) {
             continue;
         }
         
@@ -1965,10 +2424,15 @@ fn extract_vocab_batch(
         
         for cap in WORD_PATTERN.find_iter(&content) {
             let word = cap.as_str();
+            // Skip short words (<3 chars) and common words; they are most tokens, so they
+            // are rejected before a lowercase copy is allocated
+            if word.len() < 3 || dictionary::with_lowercase(word, |lower| SKIP_WORDS.contains(lower)) {
+                continue;
+            }
             let word_lower = word.to_lowercase();
             
-            // Skip common words, short words (<3 chars), whitelisted words, and Roman numerals
-            if word.len() < 3 || SKIP_WORDS.contains(word_lower.as_str()) || is_whitelisted(&word_lower) || ROMAN_NUMERAL_PATTERN.is_match(word) {
+            // Skip whitelisted words and Roman numerals
+            if is_whitelisted(&word_lower) || ROMAN_NUMERAL_PATTERN.is_match(word) {
                 continue;
             }
             
@@ -2036,7 +2500,7 @@ fn extract_vocab_batch_parallel(
 ) -> PyResult<(VocabBatchStats, std::collections::HashMap<String, (String, u64, bool, bool, String, String)>)> {
     use std::collections::HashMap;
     
-    let threads = num_threads.unwrap_or(24);
+    let threads = num_threads.unwrap_or_else(default_num_threads);
     
     // Configure thread pool
     rayon::ThreadPoolBuilder::new()
@@ -2066,10 +2530,15 @@ fn extract_vocab_batch_parallel(
             
             for cap in WORD_PATTERN.find_iter(&content) {
                 let word = cap.as_str();
+                // Skip short words (<3 chars) and common words; they are most tokens, so they
+                // are rejected before a lowercase copy is allocated
+                if word.len() < 3 || dictionary::with_lowercase(word, |lower| SKIP_WORDS.contains(lower)) {
+                    continue;
+                }
                 let word_lower = word.to_lowercase();
                 
-                // Skip common words, short words (<3 chars), whitelisted words, and Roman numerals
-                if word.len() < 3 || SKIP_WORDS.contains(word_lower.as_str()) || is_whitelisted(&word_lower) || ROMAN_NUMERAL_PATTERN.is_match(word) {
+                // Skip whitelisted words and Roman numerals
+                if is_whitelisted(&word_lower) || ROMAN_NUMERAL_PATTERN.is_match(word) {
                     continue;
                 }
                 
@@ -2433,7 +2902,7 @@ fn triage_batch_parallel(
     num_threads: Option<usize>,
     lang_confidence_threshold: Option<f64>,
 ) -> PyResult<(Vec<TriageResultWithLang>, TriageBatchStats)> {
-    let threads = num_threads.unwrap_or(24);
+    let threads = num_threads.unwrap_or_else(default_num_threads);
     let lang_threshold = lang_confidence_threshold.unwrap_or(0.5);
     
     // Configure thread pool
@@ -2533,12 +3002,21 @@ fn triage_batch_parallel(
     Ok((results, stats))
 }
 
+/// Leading slice of text used for language detection (first 10k chars, no copy)
+fn lang_sample(text: &str) -> &str {
+    match text.char_indices().nth(10000) {
+        Some((end, _)) => &text[..end],
+        None => text,
+    }
+}
+
 /// Internal language detection (reusable, not exposed to Python)
 fn detect_language_internal(text: &str, threshold: f64) -> LangDetectResult {
     // Use first 10k chars for speed
-    let sample: String = text.chars().take(10000).collect();
+    let sample = lang_sample(text);
     
     if sample.len() < 20 {
+        // Too short to determine, assume English
         return LangDetectResult {
             is_english: true,
             detected_lang: "unknown".to_string(),
@@ -2546,7 +3024,7 @@ fn detect_language_internal(text: &str, threshold: f64) -> LangDetectResult {
         };
     }
     
-    match detect(&sample) {
+    match detect(sample) {
         Some(info) => {
             let is_english = info.lang() == Lang::Eng && info.confidence() >= threshold;
             LangDetectResult {
@@ -2555,11 +3033,14 @@ fn detect_language_internal(text: &str, threshold: f64) -> LangDetectResult {
                 confidence: info.confidence(),
             }
         }
-        None => LangDetectResult {
-            is_english: true,
-            detected_lang: "unknown".to_string(),
-            confidence: 0.0,
-        },
+        None => {
+            // Detection failed, assume English to avoid blocking
+            LangDetectResult {
+                is_english: true,
+                detected_lang: "unknown".to_string(),
+                confidence: 0.0,
+            }
+        }
     }
 }
 
@@ -2677,49 +3158,49 @@ pub struct LangDetectResult {
 /// Detect if text is English using whatlang
 /// Returns (is_english, detected_language_code, confidence)
 #[pyfunction]
-fn detect_language(text: &str, confidence_threshold: Option<f64>) -> LangDetectResult {
+fn detect_language(py: Python<'_>, text: &str, confidence_threshold: Option<f64>) -> LangDetectResult {
     let threshold = confidence_threshold.unwrap_or(0.5);
-    
-    // Use first 10k chars for speed
-    let sample: String = text.chars().take(10000).collect();
-    
-    if sample.len() < 20 {
-        // Too short to determine, assume English
-        return LangDetectResult {
-            is_english: true,
-            detected_lang: "unknown".to_string(),
-            confidence: 0.0,
-        };
-    }
-    
-    match detect(&sample) {
-        Some(info) => {
-            let is_english = info.lang() == Lang::Eng && info.confidence() >= threshold;
-            LangDetectResult {
-                is_english,
-                detected_lang: format!("{:?}", info.lang()).to_lowercase(),
-                confidence: info.confidence(),
-            }
-        }
-        None => {
-            // Detection failed, assume English to avoid blocking
-            LangDetectResult {
-                is_english: true,
-                detected_lang: "unknown".to_string(),
-                confidence: 0.0,
-            }
-        }
+    py.detach(|| detect_language_internal(text, threshold))
+}
+
+/// Detect language from a file
+#[pyfunction]
+fn detect_language_file(py: Python<'_>, path: &str, confidence_threshold: Option<f64>) -> PyResult<LangDetectResult> {
+    let threshold = confidence_threshold.unwrap_or(0.5);
+    // Read and detect without holding the GIL
+    py.detach(|| {
+        let head = read_head(path, LANG_DETECT_HEAD_BYTES)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to read file: {}", e)))?;
+        Ok(detect_language_internal(&head, threshold))
+    })
+}
+
+/// Enough bytes to cover the 10k-char language detection sample (4 bytes max per char)
+const LANG_DETECT_HEAD_BYTES: u64 = 40_000;
+
+/// Read at most max_bytes from the start of a file as UTF-8
+/// A multi-byte character cut off at the end of the head is dropped; other invalid
+/// sequences are replaced with U+FFFD.
+fn read_head(path: &str, max_bytes: u64) -> std::io::Result<String> {
+    use std::io::Read;
+    
+    let mut buf = Vec::new();
+    std::fs::File::open(path)?.take(max_bytes).read_to_end(&mut buf)?;
+    
+    match String::from_utf8(buf) {
+        Ok(text) => Ok(text),
+        Err(e) => {
+            let mut bytes = e.into_bytes();
+            if let Err(utf8_err) = std::str::from_utf8(&bytes) {
+                if utf8_err.error_len().is_none() {
+                    bytes.truncate(utf8_err.valid_up_to());
+                }
+            }
+            Ok(String::from_utf8_lossy(&bytes).into_owned())
+        }
     }
 }
 
-/// Detect language from a file
-#[pyfunction]
-fn detect_language_file(path: &str, confidence_threshold: Option<f64>) -> PyResult<LangDetectResult> {
-    let content = std::fs::read_to_string(path)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to read file: {}", e)))?;
-    Ok(detect_language(&content, confidence_threshold))
-}
-
 // =============================================================================
 // Unicode Normalization (ftfy-equivalent)
 // =============================================================================
@@ -2959,11 +3440,229 @@ fn word_languages(word: &str) -> Vec<&'static str> {
     dictionary::word_languages(word)
 }
 
+/// word_languages for many words in one call, checked in parallel without the GIL
+/// A word is known (is_known_word) exactly when its list is non-empty.
+#[pyfunction]
+fn known_word_languages(py: Python<'_>, words: Vec<String>) -> Vec<Vec<&'static str>> {
+    py.detach(|| words.par_iter().map(|word| dictionary::word_languages(word)).collect())
+}
+
 #[pyfunction]
 fn dictionaries_loaded() -> bool {
     dictionary::dictionaries_loaded()
 }
 
+// =============================================================================
+// OCR Quality Scoring
+// =============================================================================
+
+// Supplementary known words from ocr_score's Dictionary (stored lowercase)
+static SCORE_WORDS: std::sync::LazyLock<std::sync::RwLock<std::collections::HashSet<String>>> =
+    std::sync::LazyLock::new(|| std::sync::RwLock::new(std::collections::HashSet::new()));
+
+/// Number of most frequent unknown words returned by score_words
+const SCORE_SAMPLE_UNKNOWN: usize = 20;
+
+/// Set the supplementary known words used by score_words (replaces any previous set)
+#[pyfunction]
+fn init_score_words(words: Vec<String>) -> PyResult<usize> {
+    let mut score_words = SCORE_WORDS.write().map_err(|e| {
+        pyo3::exceptions::PyRuntimeError::new_err(format!("Failed to acquire score words lock: {}", e))
+    })?;
+    score_words.clear();
+    for word in &words {
+        score_words.insert(word.to_lowercase());
+    }
+    Ok(score_words.len())
+}
+
+/// Roman numerals and ordinals (mirrors is_number_like in ocr_score.py)
+fn is_number_like_word(word: &str) -> bool {
+    if word.is_empty() {
+        return false;
+    }
+    if word
+        .chars()
+        .all(|c| matches!(c.to_ascii_lowercase(), 'i' | 'v' | 'x' | 'l' | 'c' | 'd' | 'm'))
+    {
+        return true;
+    }
+    let digits_end = word.find(|c: char| !c.is_ascii_digit()).unwrap_or(word.len());
+    digits_end > 0
+        && matches!(
+            word[digits_end..].to_ascii_lowercase().as_str(),
+            "st" | "nd" | "rd" | "th"
+        )
+}
+
+/// Unfixable OCR noise (mirrors GARBAGE_RE in ocr_score.py): 5+ consonants,
+/// 4+ vowels, 4+ repeats of one character, or 3+ consecutive symbols, in one pass
+fn is_garbage_word(word: &str) -> bool {
+    // Every pattern needs at least 3 characters (byte length bounds char count)
+    if word.len() < 3 {
+        return false;
+    }
+    let mut consonants = 0;
+    let mut vowels = 0;
+    let mut repeats = 0;
+    let mut symbols = 0;
+    let mut prev: Option<char> = None;
+    
+    for c in word.chars() {
+        let lower = c.to_ascii_lowercase();
+        consonants = if "bcdfghjklmnpqrstvwxz".contains(lower) { consonants + 1 } else { 0 };
+        vowels = if "aeiou".contains(lower) { vowels + 1 } else { 0 };
+        repeats = if c != '\n' && prev == Some(c) { repeats + 1 } else { 1 };
+        symbols = if !c.is_ascii_alphabetic() && !c.is_whitespace() { symbols + 1 } else { 0 };
+        if consonants >= 5 || vowels >= 4 || repeats >= 4 || symbols >= 3 {
+            return true;
+        }
+        prev = Some(c);
+    }
+    false
+}
+
+/// Leading words whose dictionary languages are tallied for the dominant language
+const SCORE_LANG_SAMPLE_WORDS: usize = 1000;
+
+/// Classify words for OCR quality (shared by the score_* entry points)
+/// Number-like words are skipped, then each word is counted as garbage or, failing
+/// the supplementary word set and the multi-language dictionaries, as unknown.
+/// Ties in the sample keep first-seen order, like Counter.most_common.
+/// The dominant language is the en/de/fr/la dictionary that recognised the most of
+/// the leading words, tallied in the same loop (first listed wins ties; "unknown"
+/// if none matched).
+fn score_word_slice(words: &[&str]) -> (usize, usize, Vec<String>, String) {
+    use std::cmp::Reverse;
+    use std::collections::{BinaryHeap, HashMap};
+    
+    let score_words = match SCORE_WORDS.read() {
+        Ok(guard) => guard,
+        Err(poisoned) => poisoned.into_inner(),
+    };
+    
+    let mut unknown_count = 0;
+    let mut garbage_count = 0;
+    // word -> (count, first-seen rank)
+    let mut unknown: HashMap<&str, (usize, usize)> = HashMap::new();
+    // Per-language dictionary matches over the first SCORE_LANG_SAMPLE_WORDS words
+    let mut lang_counts = [0usize; dictionary::MASK_LANGUAGES.len()];
+    let mut lang_words = 0;
+    
+    for &word in words {
+        if is_number_like_word(word) {
+            continue;
+        }
+        if is_garbage_word(word) {
+            garbage_count += 1;
+            continue;
+        }
+        // Sampled words look up every language (which also answers is_known_word
+        // for them); later words stop at the first dictionary that knows them
+        let mut known = false;
+        if lang_words < SCORE_LANG_SAMPLE_WORDS {
+            lang_words += 1;
+            let mask = dictionary::language_mask(word);
+            for (i, count) in lang_counts.iter_mut().enumerate() {
+                if mask & (1 << i) != 0 {
+                    *count += 1;
+                }
+            }
+            known = mask != 0;
+        }
+        if known
+            || dictionary::with_lowercase(word, |lower| score_words.contains(lower))
+            || dictionary::is_known_word(word)
+        {
+            continue;
+        }
+        unknown_count += 1;
+        let rank = unknown.len();
+        unknown.entry(word).or_insert((0, rank)).0 += 1;
+    }
+    
+    // Bounded min-heap keeps the top SCORE_SAMPLE_UNKNOWN by (count desc, rank asc)
+    // without sorting every distinct unknown word
+    let mut top: BinaryHeap<Reverse<(usize, Reverse<usize>, &str)>> =
+        BinaryHeap::with_capacity(SCORE_SAMPLE_UNKNOWN + 1);
+    for (word, (count, rank)) in unknown {
+        top.push(Reverse((count, Reverse(rank), word)));
+        if top.len() > SCORE_SAMPLE_UNKNOWN {
+            top.pop();
+        }
+    }
+    let sample = top
+        .into_sorted_vec()
+        .into_iter()
+        .map(|Reverse((_, _, word))| word.to_string())
+        .collect();
+    
+    let mut language = "unknown";
+    let mut best = 0;
+    for (code, &count) in dictionary::MASK_LANGUAGES.iter().zip(&lang_counts) {
+        if count > best {
+            best = count;
+            language = *code;
+        }
+    }
+    let language = language.to_string();
+    
+    (unknown_count, garbage_count, sample, language)
+}
+
+/// Score extracted words for OCR quality in one call
+/// Returns: (unknown_count, garbage_count, most frequent unknown words, dominant language)
+#[pyfunction]
+fn score_words(py: Python<'_>, words: Vec<String>) -> (usize, usize, Vec<String>, String) {
+    py.detach(|| {
+        let refs: Vec<&str> = words.iter().map(String::as_str).collect();
+        score_word_slice(&refs)
+    })
+}
+
+/// Extract scoring words from raw text bytes (mirrors extract_words in ocr_score.py)
+/// Letters-only words with an optional contraction; single letters other than
+/// a/i/o are dropped. The pattern is ASCII-only, so invalid UTF-8 elsewhere in
+/// the text never splits or joins words.
+fn extract_score_words(text: &[u8]) -> Vec<&str> {
+    lazy_static! {
+        static ref SCORE_WORD_RE: regex::bytes::Regex =
+            regex::bytes::Regex::new(r"[a-zA-Z]+(?:'[a-zA-Z]+)?").unwrap();
+    }
+    
+    SCORE_WORD_RE
+        .find_iter(text)
+        .filter_map(|m| std::str::from_utf8(m.as_bytes()).ok())
+        .filter(|word| word.len() > 1 || matches!(*word, "a" | "i" | "o" | "A" | "I" | "O"))
+        .collect()
+}
+
+/// Extract words from text and score them in one call
+/// Returns: (total_words, unknown_count, garbage_count, most frequent unknown words,
+///           dominant language)
+#[pyfunction]
+fn score_text_words(py: Python<'_>, text: &str) -> (usize, usize, usize, Vec<String>, String) {
+    py.detach(|| {
+        let words = extract_score_words(text.as_bytes());
+        let (unknown, garbage, sample, language) = score_word_slice(&words);
+        (words.len(), unknown, garbage, sample, language)
+    })
+}
+
+/// Read a file, extract its words and score them in one call (no UTF-8 decode)
+/// Returns: (total_words, unknown_count, garbage_count, most frequent unknown words,
+///           dominant language)
+#[pyfunction]
+fn score_file_words(py: Python<'_>, path: &str) -> PyResult<(usize, usize, usize, Vec<String>, String)> {
+    py.detach(|| {
+        let bytes = std::fs::read(path)
+            .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Failed to read {}: {}", path, e)))?;
+        let words = extract_score_words(&bytes);
+        let (unknown, garbage, sample, language) = score_word_slice(&words);
+        Ok((words.len(), unknown, garbage, sample, language))
+    })
+}
+
 // =============================================================================
 // BOILERPLATE STRIPPING
 // =============================================================================
@@ -3598,10 +4297,90 @@ fn unwrap_lines_batch(input_dir: &str, output_dir: &str) -> PyResult<(u64, u64,
 // NOISE WORD STRIPPING
 // ============================================================================
 
+/// Noise words packed into one sorted byte buffer and found by binary search
+/// Several times smaller than a HashSet<String> (no per-word allocation or table
+/// slack), so large noise lists stay cache-resident while stripping.
+struct PackedWords {
+    bytes: Box<[u8]>,
+    /// Start of each word in bytes, followed by the end of the last word
+    offsets: Box<[u32]>,
+}
+
+impl PackedWords {
+    fn new(words: std::collections::HashSet<String>) -> Self {
+        let mut words: Vec<String> = words.into_iter().collect();
+        words.sort_unstable();
+        let mut bytes = Vec::with_capacity(words.iter().map(String::len).sum());
+        let mut offsets = Vec::with_capacity(words.len() + 1);
+        for word in &words {
+            offsets.push(bytes.len() as u32);
+            bytes.extend_from_slice(word.as_bytes());
+        }
+        offsets.push(bytes.len() as u32);
+        PackedWords {
+            bytes: bytes.into_boxed_slice(),
+            offsets: offsets.into_boxed_slice(),
+        }
+    }
+    
+    fn len(&self) -> usize {
+        self.offsets.len() - 1
+    }
+    
+    fn word(&self, i: usize) -> &[u8] {
+        &self.bytes[self.offsets[i] as usize..self.offsets[i + 1] as usize]
+    }
+    
+    fn contains(&self, word: &str) -> bool {
+        let word = word.as_bytes();
+        let (mut lo, mut hi) = (0, self.len());
+        while lo < hi {
+            let mid = lo + (hi - lo) / 2;
+            match self.word(mid).cmp(word) {
+                std::cmp::Ordering::Less => lo = mid + 1,
+                std::cmp::Ordering::Greater => hi = mid,
+                std::cmp::Ordering::Equal => return true,
+            }
+        }
+        false
+    }
+}
+
+/// Backing store for the global noise word set
+enum NoiseWords {
+    Hashed(std::collections::HashSet<String>),
+    Packed(PackedWords),
+}
+
+impl NoiseWords {
+    fn len(&self) -> usize {
+        match self {
+            NoiseWords::Hashed(words) => words.len(),
+            NoiseWords::Packed(words) => words.len(),
+        }
+    }
+    
+    fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+    
+    /// Check a lowercase word
+    fn contains(&self, word: &str) -> bool {
+        match self {
+            NoiseWords::Hashed(words) => words.contains(word),
+            NoiseWords::Packed(words) => words.contains(word),
+        }
+    }
+}
+
 lazy_static! {
     /// Global set of noise words to strip (populated from vocab candidates file)
-    static ref NOISE_WORDS: std::sync::RwLock<std::collections::HashSet<String>> = 
-        std::sync::RwLock::new(std::collections::HashSet::new());
+    static ref NOISE_WORDS: std::sync::RwLock<NoiseWords> = 
+        std::sync::RwLock::new(NoiseWords::Hashed(std::collections::HashSet::new()));
+    
+    /// What NOISE_WORDS was loaded from, so repeated inits with the same inputs are skipped
+    static ref NOISE_WORDS_SOURCE: std::sync::Mutex<Option<NoiseWordsSource>> =
+        std::sync::Mutex::new(None);
     
     /// Regex for matching word boundaries
     static ref WORD_BOUNDARY_RE: Regex = 
@@ -3611,12 +4390,11 @@ lazy_static! {
     static ref MULTI_SPACE_RE: Regex = Regex::new(r"  +").unwrap();
 }
 
-/// Initialize noise word set from vocab candidates file.
-/// Filters to only G (garbage) and R (repeated) categories by default.
-/// Returns the count of noise words loaded.
-#[pyfunction]
-#[pyo3(signature = (vocab_path, categories=None))]
-fn init_noise_words(vocab_path: &str, categories: Option<Vec<String>>) -> PyResult<usize> {
+/// Read the lowercase noise words of the given categories from a vocab candidates file
+fn read_noise_words(
+    vocab_path: &str,
+    categories: Option<Vec<String>>,
+) -> PyResult<std::collections::HashSet<String>> {
     let content = std::fs::read_to_string(vocab_path)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(
             format!("Failed to read vocab file: {}", e)
@@ -3650,11 +4428,70 @@ fn init_noise_words(vocab_path: &str, categories: Option<Vec<String>>) -> PyResu
         }
     }
     
+    Ok(words)
+}
+
+/// Vocab path, its mtime, sorted categories and whether the packed backend was used
+type NoiseWordsSource = (std::path::PathBuf, std::time::SystemTime, Vec<String>, bool);
+
+/// Load NOISE_WORDS unless it already holds this vocab file (unchanged on disk),
+/// categories and backend. Returns the count of noise words loaded.
+fn load_noise_words(vocab_path: &str, categories: Option<Vec<String>>, compact: bool) -> PyResult<usize> {
+    let mut key_categories = categories
+        .clone()
+        .unwrap_or_else(|| vec!["G".to_string(), "R".to_string()]);
+    key_categories.sort_unstable();
+    key_categories.dedup();
+    let source = std::fs::metadata(vocab_path)
+        .and_then(|meta| meta.modified())
+        .ok()
+        .map(|mtime| (std::path::PathBuf::from(vocab_path), mtime, key_categories, compact));
+    
+    let mut loaded = NOISE_WORDS_SOURCE.lock().unwrap();
+    if source.is_some() && *loaded == source {
+        return Ok(NOISE_WORDS.read().unwrap().len());
+    }
+    
+    let words = read_noise_words(vocab_path, categories)?;
+    let words = if compact {
+        NoiseWords::Packed(PackedWords::new(words))
+    } else {
+        NoiseWords::Hashed(words)
+    };
     let count = words.len();
     *NOISE_WORDS.write().unwrap() = words;
+    *loaded = source;
     Ok(count)
 }
 
+/// Initialize noise word set from vocab candidates file.
+/// Filters to only G (garbage) and R (repeated) categories by default.
+/// Calling again with the same unchanged file and categories reuses the loaded set.
+/// Returns the count of noise words loaded.
+#[pyfunction]
+#[pyo3(signature = (vocab_path, categories=None))]
+fn init_noise_words(vocab_path: &str, categories: Option<Vec<String>>) -> PyResult<usize> {
+    load_noise_words(vocab_path, categories, false)
+}
+
+/// Initialize noise word set like init_noise_words, stored as a packed sorted table
+/// Uses a fraction of the memory for large lists at the cost of a binary search
+/// per lookup instead of a hash probe.
+/// Returns the count of noise words loaded.
+#[pyfunction]
+#[pyo3(signature = (vocab_path, categories=None))]
+fn init_noise_words_compact(vocab_path: &str, categories: Option<Vec<String>>) -> PyResult<usize> {
+    load_noise_words(vocab_path, categories, true)
+}
+
+/// Unload the noise word set (strip functions then leave text unchanged)
+#[pyfunction]
+fn clear_noise_words() {
+    let mut loaded = NOISE_WORDS_SOURCE.lock().unwrap();
+    *NOISE_WORDS.write().unwrap() = NoiseWords::Hashed(std::collections::HashSet::new());
+    *loaded = None;
+}
+
 /// Get the count of currently loaded noise words
 #[pyfunction]
 fn noise_words_count() -> usize {
@@ -3677,12 +4514,11 @@ fn strip_noise_words(text: &str) -> (String, usize) {
     for cap in WORD_BOUNDARY_RE.captures_iter(text) {
         let m = cap.get(0).unwrap();
         let word = m.as_str();
-        let word_lower = word.to_lowercase();
         
         // Copy text before this word
         result.push_str(&text[last_end..m.start()]);
         
-        if noise_words.contains(&word_lower) {
+        if dictionary::with_lowercase(word, |lower| noise_words.contains(lower)) {
             // Skip this word (replace with single space to avoid word collision)
             result.push(' ');
             stripped += 1;
@@ -3703,6 +4539,41 @@ fn strip_noise_words(text: &str) -> (String, usize) {
     (collapsed.to_string(), stripped)
 }
 
+/// Count the noise words in a file without building the cleaned text
+/// The file is streamed line by line (words never span a newline), so memory stays
+/// bounded by the longest line. Counts match strip_noise_file's words_stripped.
+#[pyfunction]
+fn count_noise_words_file(py: Python<'_>, input_path: &str) -> PyResult<usize> {
+    use std::io::BufRead;
+    
+    let read_error = |e: std::io::Error| {
+        PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to read file: {}", e))
+    };
+    let file = std::fs::File::open(input_path).map_err(read_error)?;
+    
+    py.detach(|| {
+        let noise_words = NOISE_WORDS.read().unwrap();
+        if noise_words.is_empty() {
+            return Ok(0);
+        }
+        
+        let mut reader = std::io::BufReader::with_capacity(1 << 20, file);
+        let mut line = String::new();
+        let mut count = 0;
+        loop {
+            line.clear();
+            if reader.read_line(&mut line).map_err(read_error)? == 0 {
+                break;
+            }
+            count += WORD_BOUNDARY_RE
+                .find_iter(&line)
+                .filter(|m| dictionary::with_lowercase(m.as_str(), |lower| noise_words.contains(lower)))
+                .count();
+        }
+        Ok(count)
+    })
+}
+
 /// Strip noise words from a file and write to output.
 /// Returns (was_modified, words_stripped, bytes_processed)
 #[pyfunction]
@@ -3728,6 +4599,28 @@ fn strip_noise_file(input_path: &str, output_path: &str) -> PyResult<(bool, usiz
     Ok((stripped > 0, stripped, bytes))
 }
 
+/// Read a whole file into buf, replacing its contents
+/// Batch workers keep one buffer across files, saving an allocation per file, and
+/// reading to EOF skips the size lookup std::fs::read makes (one syscall per file).
+fn read_file_into(path: &str, buf: &mut Vec<u8>) -> std::io::Result<()> {
+    use std::io::Read;
+    
+    buf.clear();
+    std::fs::File::open(path)?.read_to_end(buf)?;
+    Ok(())
+}
+
+/// Create each distinct parent directory of paths once
+fn create_parent_dirs(paths: &[String]) {
+    let dirs: std::collections::HashSet<&std::path::Path> = paths
+        .iter()
+        .filter_map(|path| std::path::Path::new(path).parent())
+        .collect();
+    for dir in dirs {
+        std::fs::create_dir_all(dir).ok();
+    }
+}
+
 /// Statistics from batch noise stripping
 #[pyclass]
 #[derive(Clone)]
@@ -3743,14 +4636,28 @@ pub struct StripBatchStats {
 }
 
 /// Batch strip noise words with Rayon parallelization.
-/// Takes a list of (input_path, output_path) tuples.
+/// Takes parallel lists of input and output paths (two flat lists convert across
+/// the FFI boundary more cheaply than (input, output) tuples); output_paths=None
+/// strips the inputs in place.
 #[pyfunction]
+#[pyo3(signature = (input_paths, output_paths, num_threads))]
 fn strip_noise_batch_parallel(
-    file_pairs: Vec<(String, String)>,
+    input_paths: Vec<String>,
+    output_paths: Option<Vec<String>>,
     num_threads: usize,
 ) -> PyResult<StripBatchStats> {
     use std::sync::atomic::{AtomicU64, Ordering};
     
+    if let Some(outputs) = output_paths.as_ref() {
+        if outputs.len() != input_paths.len() {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "input_paths and output_paths differ in length ({} vs {})",
+                input_paths.len(),
+                outputs.len()
+            )));
+        }
+    }
+    
     // Configure thread pool
     let pool = rayon::ThreadPoolBuilder::new()
         .num_threads(num_threads)
@@ -3764,10 +4671,17 @@ fn strip_noise_batch_parallel(
     let total_stripped = AtomicU64::new(0);
     let total_bytes = AtomicU64::new(0);
     
+    if let Some(outputs) = output_paths.as_ref() {
+        create_parent_dirs(outputs);
+    }
+    
     pool.install(|| {
-        file_pairs.par_iter().for_each(|(input_path, output_path)| {
+        input_paths.par_iter().enumerate().for_each_init(Vec::new, |buf, (i, input_path)| {
             // Read file
-            let content = match std::fs::read_to_string(input_path) {
+            if read_file_into(input_path, buf).is_err() {
+                return;
+            }
+            let content = match std::str::from_utf8(buf) {
                 Ok(c) => c,
                 Err(_) => return,
             };
@@ -3776,15 +4690,14 @@ fn strip_noise_batch_parallel(
             total_bytes.fetch_add(bytes as u64, Ordering::Relaxed);
             
             // Strip noise
-            let (cleaned, stripped) = strip_noise_words(&content);
-            
-            // Ensure parent directory exists
-            if let Some(parent) = std::path::Path::new(output_path.as_str()).parent() {
-                std::fs::create_dir_all(parent).ok();
-            }
+            let (cleaned, stripped) = strip_noise_words(content);
             
-            // Write output
-            if std::fs::write(output_path, &cleaned).is_ok() {
+            // Write output (an unchanged file stripped in place is left alone)
+            let written = match output_paths.as_ref() {
+                Some(outputs) => std::fs::write(&outputs[i], &cleaned).is_ok(),
+                None => cleaned == content || std::fs::write(input_path, &cleaned).is_ok(),
+            };
+            if written {
                 files_processed.fetch_add(1, Ordering::Relaxed);
                 if stripped > 0 {
                     files_modified.fetch_add(1, Ordering::Relaxed);
@@ -3803,15 +4716,28 @@ fn strip_noise_batch_parallel(
 }
 
 /// Batch strip noise words with per-file logging.
+/// Paths are passed as in strip_noise_batch_parallel.
 /// Returns (StripBatchStats, Vec<(path, words_stripped)>) for modified files only.
 #[pyfunction]
+#[pyo3(signature = (input_paths, output_paths, num_threads))]
 fn strip_noise_batch_parallel_logged(
-    file_pairs: Vec<(String, String)>,
+    input_paths: Vec<String>,
+    output_paths: Option<Vec<String>>,
     num_threads: usize,
 ) -> PyResult<(StripBatchStats, Vec<(String, u64)>)> {
     use std::sync::atomic::{AtomicU64, Ordering};
     use std::sync::Mutex;
     
+    if let Some(outputs) = output_paths.as_ref() {
+        if outputs.len() != input_paths.len() {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "input_paths and output_paths differ in length ({} vs {})",
+                input_paths.len(),
+                outputs.len()
+            )));
+        }
+    }
+    
     // Configure thread pool
     let pool = rayon::ThreadPoolBuilder::new()
         .num_threads(num_threads)
@@ -3826,10 +4752,17 @@ fn strip_noise_batch_parallel_logged(
     let total_bytes = AtomicU64::new(0);
     let modified_files: Mutex<Vec<(String, u64)>> = Mutex::new(Vec::new());
     
+    if let Some(outputs) = output_paths.as_ref() {
+        create_parent_dirs(outputs);
+    }
+    
     pool.install(|| {
-        file_pairs.par_iter().for_each(|(input_path, output_path)| {
+        input_paths.par_iter().enumerate().for_each_init(Vec::new, |buf, (i, input_path)| {
             // Read file
-            let content = match std::fs::read_to_string(input_path) {
+            if read_file_into(input_path, buf).is_err() {
+                return;
+            }
+            let content = match std::str::from_utf8(buf) {
                 Ok(c) => c,
                 Err(_) => return,
             };
@@ -3838,15 +4771,14 @@ fn strip_noise_batch_parallel_logged(
             total_bytes.fetch_add(bytes as u64, Ordering::Relaxed);
             
             // Strip noise
-            let (cleaned, stripped) = strip_noise_words(&content);
-            
-            // Ensure parent directory exists
-            if let Some(parent) = std::path::Path::new(output_path.as_str()).parent() {
-                std::fs::create_dir_all(parent).ok();
-            }
+            let (cleaned, stripped) = strip_noise_words(content);
             
-            // Write output
-            if std::fs::write(output_path, &cleaned).is_ok() {
+            // Write output (an unchanged file stripped in place is left alone)
+            let written = match output_paths.as_ref() {
+                Some(outputs) => std::fs::write(&outputs[i], &cleaned).is_ok(),
+                None => cleaned == content || std::fs::write(input_path, &cleaned).is_ok(),
+            };
+            if written {
                 files_processed.fetch_add(1, Ordering::Relaxed);
                 if stripped > 0 {
                     files_modified.fetch_add(1, Ordering::Relaxed);
@@ -3871,15 +4803,706 @@ fn strip_noise_batch_parallel_logged(
     Ok((stats, log))
 }
 
+/// Cancellation flag shared between Python and long-running Rust calls
+/// Rust workers poll it between files without needing the GIL.
+#[pyclass]
+#[derive(Clone, Default)]
+pub struct CancelToken {
+    flag: Arc<AtomicBool>,
+}
+
+#[pymethods]
+impl CancelToken {
+    #[new]
+    fn new() -> Self {
+        Self::default()
+    }
+    
+    /// Ask the running call to stop (safe to call from a signal handler)
+    fn cancel(&self) {
+        self.flag.store(true, Ordering::Relaxed);
+    }
+    
+    /// Whether cancel() has been called
+    fn is_cancelled(&self) -> bool {
+        self.flag.load(Ordering::Relaxed)
+    }
+}
+
+/// Read, strip and write one file for the directory stripper
+/// The output's parent directory must already exist. buf is scratch space for the
+/// input; an unchanged file stripped in place is not rewritten.
+/// Returns None if the input could not be read, otherwise (bytes_read, words_stripped),
+/// with words_stripped None if the output could not be written.
+fn strip_noise_file_pair(
+    input_path: &str,
+    output_path: &std::path::Path,
+    in_place: bool,
+    buf: &mut Vec<u8>,
+) -> Option<(usize, Option<usize>)> {
+    read_file_into(input_path, buf).ok()?;
+    let content = std::str::from_utf8(buf).ok()?;
+    let (cleaned, stripped) = strip_noise_words(content);
+    
+    let written = (in_place && cleaned == content) || std::fs::write(output_path, &cleaned).is_ok();
+    Some((content.len(), if written { Some(stripped) } else { None }))
+}
+
+/// Path of a discovered file relative to the walk root, borrowed from path
+fn relative_to<'a>(path: &'a str, root: &std::path::Path) -> &'a str {
+    std::path::Path::new(path)
+        .strip_prefix(root)
+        .ok()
+        .and_then(|rel| rel.to_str())
+        .unwrap_or(path)
+}
+
+/// Write s to out as a JSON string literal
+/// Unescaped runs are copied straight through; only quotes, backslashes and
+/// control characters (all ASCII, so never inside a UTF-8 sequence) are escaped.
+fn write_json_string(out: &mut impl std::io::Write, s: &str) -> std::io::Result<()> {
+    let bytes = s.as_bytes();
+    out.write_all(b"\"")?;
+    let mut start = 0;
+    for (i, &b) in bytes.iter().enumerate() {
+        if b >= 0x20 && b != b'"' && b != b'\\' {
+            continue;
+        }
+        out.write_all(&bytes[start..i])?;
+        match b {
+            b'"' => out.write_all(b"\\\"")?,
+            b'\\' => out.write_all(b"\\\\")?,
+            b'\n' => out.write_all(b"\\n")?,
+            b'\r' => out.write_all(b"\\r")?,
+            b'\t' => out.write_all(b"\\t")?,
+            _ => write!(out, "\\u{:04x}", b)?,
+        }
+        start = i + 1;
+    }
+    out.write_all(&bytes[start..])?;
+    out.write_all(b"\"")
+}
+
+/// Write one strip log line: {"path": <path>, "words_stripped": n}
+fn write_strip_log_line(
+    out: &mut impl std::io::Write,
+    path: &str,
+    words_stripped: usize,
+) -> std::io::Result<()> {
+    out.write_all(b"{\"path\": ")?;
+    write_json_string(out, path)?;
+    writeln!(out, ", \"words_stripped\": {}}}", words_stripped)
+}
+
+/// Strip noise words from every *.txt file under input_dir in one call
+/// Files are found with the parallel directory walk and stripped on a Rayon pool,
+/// without the GIL. Outputs mirror the input tree under
+/// output_dir (pass input_dir again to modify files in place). If log_path is set,
+/// each modified file is written to it as a JSONL line
+/// {"path": <path relative to input_dir>, "words_stripped": n}.
+/// progress(files_done, total_files, stats) is called once after discovery
+/// (files_done = 0) and every batch_size files with running totals; if it returns
+/// True, or `cancel` is cancelled, files not yet started are skipped.
+/// When no files are found, neither output_dir nor the log file is created.
+/// Returns: (StripBatchStats totals, total_files)
+#[pyfunction]
+#[pyo3(signature = (input_dir, output_dir, num_threads, log_path=None, progress=None, batch_size=1000, cancel=None))]
+fn strip_noise_dir(
+    py: Python<'_>,
+    input_dir: &str,
+    output_dir: &str,
+    num_threads: usize,
+    log_path: Option<&str>,
+    progress: Option<Bound<'_, PyAny>>,
+    batch_size: usize,
+    cancel: Option<CancelToken>,
+) -> PyResult<(StripBatchStats, usize)> {
+    use std::io::Write;
+    
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(num_threads)
+        .build()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            format!("Failed to create thread pool: {}", e)
+        ))?;
+    
+    let input_root = std::path::Path::new(input_dir);
+    let output_root = std::path::Path::new(output_dir);
+    let pattern: Vec<char> = "*.txt".chars().collect();
+    let files = py.detach(|| pool.install(|| find_files_in(input_root, &pattern)));
+    
+    let mut stats = StripBatchStats {
+        files_processed: 0,
+        files_modified: 0,
+        total_words_stripped: 0,
+        total_bytes: 0,
+    };
+    let progress = progress.map(Bound::unbind);
+    let report = |py: Python<'_>, files_done: usize, stats: &StripBatchStats| -> PyResult<bool> {
+        match progress.as_ref() {
+            Some(callback) => callback
+                .bind(py)
+                .call1((files_done, files.len(), stats.clone()))?
+                .is_truthy(),
+            None => Ok(false),
+        }
+    };
+    
+    let cancel = cancel.unwrap_or_default();
+    // Nothing found, or stopped before starting: leave the filesystem untouched
+    if report(py, 0, &stats)? || files.is_empty() {
+        return Ok((stats, files.len()));
+    }
+    
+    // Create each distinct output directory once up front (in-place runs write next
+    // to their inputs), so per-file writes need no mkdir of their own
+    if output_root != input_root {
+        py.detach(|| {
+            let dirs: std::collections::HashSet<&std::path::Path> = files
+                .iter()
+                .filter_map(|path| std::path::Path::new(relative_to(path, input_root)).parent())
+                .collect();
+            pool.install(|| {
+                dirs.par_iter().for_each(|dir| {
+                    std::fs::create_dir_all(output_root.join(dir)).ok();
+                })
+            });
+        });
+    }
+    
+    let mut log = match log_path {
+        Some(path) => {
+            let file = std::fs::File::create(path)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(
+                    format!("Failed to create log file: {}", e)
+                ))?;
+            Some(std::io::BufWriter::with_capacity(1 << 20, file))
+        }
+        None => None,
+    };
+    let log_error = |e: std::io::Error| {
+        PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to write log file: {}", e))
+    };
+    
+    // One work-stealing pass over all files; results stream back over a channel so
+    // batch_size only sets the progress interval and there is no per-batch join
+    // where idle workers wait on the slowest file. Log lines are in completion order.
+    let batch_size = batch_size.max(1);
+    let outcome: PyResult<()> = py.detach(|| {
+        let (tx, rx) = std::sync::mpsc::sync_channel(batch_size);
+        std::thread::scope(|scope| {
+            scope.spawn(|| {
+                // Owned here so the channel closes once the workers finish
+                let tx = tx;
+                let in_place = output_root == input_root;
+                pool.install(|| {
+                    files.par_iter().for_each_init(
+                        || (tx.clone(), Vec::new()),
+                        |(tx, buf), input_path| {
+                            if cancel.is_cancelled() {
+                                return;
+                            }
+                            let output_path = output_root.join(relative_to(input_path, input_root));
+                            let result = strip_noise_file_pair(input_path, &output_path, in_place, buf);
+                            let _ = tx.send((input_path, result));
+                        },
+                    )
+                })
+            });
+            
+            let mut files_done = 0;
+            let mut collect = || -> PyResult<()> {
+                for (input_path, result) in rx.iter() {
+                    files_done += 1;
+                    if let Some((bytes, written)) = result {
+                        stats.total_bytes += bytes as u64;
+                        if let Some(stripped) = written {
+                            stats.files_processed += 1;
+                            if stripped > 0 {
+                                stats.files_modified += 1;
+                                stats.total_words_stripped += stripped as u64;
+                                if let Some(log) = log.as_mut() {
+                                    let path = relative_to(input_path, input_root);
+                                    write_strip_log_line(log, path, stripped).map_err(log_error)?;
+                                }
+                            }
+                        }
+                    }
+                    if files_done % batch_size == 0 || files_done == files.len() {
+                        if Python::attach(|py| report(py, files_done, &stats))? {
+                            cancel.cancel();
+                        }
+                    }
+                }
+                Ok(())
+            };
+            let outcome = collect();
+            if outcome.is_err() {
+                // Stop the workers; they would otherwise keep stripping unreported files
+                cancel.cancel();
+            }
+            // Unblock workers waiting on a full channel before the scope joins them
+            drop(rx);
+            outcome
+        })
+    });
+    outcome?;
+    
+    if let Some(mut log) = log {
+        log.flush().map_err(log_error)?;
+    }
+    
+    Ok((stats, files.len()))
+}
+
+// ============================================================================
+// SYMSPELL CORRECTION
+// ============================================================================
+
+lazy_static! {
+    /// SymSpell dictionary used by symspell_correct_text
+    static ref SYMSPELL: std::sync::RwLock<Option<symspell::SymSpell>> =
+        std::sync::RwLock::new(None);
+    
+    /// Lowercase words symspell_correct_text never corrects
+    static ref SYMSPELL_SKIP_WORDS: std::sync::RwLock<symspell::SkipWords> =
+        std::sync::RwLock::new(symspell::SkipWords::default());
+}
+
+/// Load a SymSpell frequency dictionary ("term count" per line), replacing any loaded one
+/// max_edit_distance is the largest distance lookups may use later.
+/// If cache_path is given, the built delete index is read from it when it was made
+/// from the same dictionary text and settings, and (re)written there otherwise, so
+/// later loads skip generating the deletes. Cache write failures are ignored.
+/// Returns the number of dictionary words.
+#[pyfunction]
+#[pyo3(signature = (dictionary_path, max_edit_distance=2, prefix_length=7, cache_path=None))]
+fn symspell_load_dictionary(
+    py: Python<'_>,
+    dictionary_path: &str,
+    max_edit_distance: usize,
+    prefix_length: usize,
+    cache_path: Option<&str>,
+) -> PyResult<usize> {
+    if prefix_length <= max_edit_distance {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "prefix_length must be greater than max_edit_distance",
+        ));
+    }
+    let content = std::fs::read_to_string(dictionary_path)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(
+            format!("Failed to read dictionary: {}", e)
+        ))?;
+    
+    let dictionary = py.detach(|| {
+        let source_hash = symspell::source_hash(content.as_bytes());
+        let cached = cache_path
+            .and_then(|path| std::fs::read(path).ok())
+            .and_then(|data| {
+                symspell::SymSpell::read_index(&data, source_hash, max_edit_distance, prefix_length)
+            });
+        if let Some(dictionary) = cached {
+            return dictionary;
+        }
+        
+        let mut dictionary = symspell::SymSpell::new(max_edit_distance, prefix_length);
+        dictionary.load_dictionary(&content);
+        if let Some(path) = cache_path {
+            write_symspell_index(&dictionary, source_hash, std::path::Path::new(path)).ok();
+        }
+        dictionary
+    });
+    let count = dictionary.len();
+    *SYMSPELL.write().unwrap() = Some(dictionary);
+    Ok(count)
+}
+
+/// Write a SymSpell index to path through a temporary file and a rename, so a
+/// concurrent load never reads a partly written index
+fn write_symspell_index(
+    dictionary: &symspell::SymSpell,
+    source_hash: u64,
+    path: &std::path::Path,
+) -> std::io::Result<()> {
+    use std::io::Write;
+    
+    if let Some(parent) = path.parent() {
+        std::fs::create_dir_all(parent)?;
+    }
+    let mut tmp_path = path.as_os_str().to_owned();
+    tmp_path.push(format!(".{}.tmp", std::process::id()));
+    let tmp_path = std::path::PathBuf::from(tmp_path);
+    
+    let written = std::fs::File::create(&tmp_path).and_then(|file| {
+        let mut out = std::io::BufWriter::with_capacity(1 << 20, file);
+        dictionary.write_index(&mut out, source_hash)?;
+        out.flush()
+    });
+    match written {
+        Ok(()) => std::fs::rename(&tmp_path, path),
+        Err(e) => {
+            std::fs::remove_file(&tmp_path).ok();
+            Err(e)
+        }
+    }
+}
+
+/// Set the words symspell_correct_text leaves alone (matched case-insensitively)
+/// Returns the number of distinct skip words.
+#[pyfunction]
+fn symspell_set_skip_words(words: Vec<String>) -> usize {
+    // Most entries are lowercase already; keep their strings rather than copying
+    let words: symspell::SkipWords = words
+        .into_iter()
+        .map(|word| {
+            if word.chars().any(|c| c.to_lowercase().ne(std::iter::once(c))) {
+                word.to_lowercase()
+            } else {
+                word
+            }
+        })
+        .collect();
+    let count = words.len();
+    *SYMSPELL_SKIP_WORDS.write().unwrap() = words;
+    count
+}
+
+/// The loaded dictionary, checked to support lookups at max_edit_distance
+fn loaded_symspell(
+    dictionary: &Option<symspell::SymSpell>,
+    max_edit_distance: usize,
+) -> PyResult<&symspell::SymSpell> {
+    let dictionary = dictionary.as_ref().ok_or_else(|| {
+        pyo3::exceptions::PyRuntimeError::new_err(
+            "SymSpell dictionary not loaded; call symspell_load_dictionary first",
+        )
+    })?;
+    if max_edit_distance > dictionary.max_dictionary_edit_distance() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "max_edit_distance exceeds the dictionary's max_edit_distance",
+        ));
+    }
+    Ok(dictionary)
+}
+
+/// Correct OCR errors in text with the loaded SymSpell dictionary
+/// Each word is looked up unless it is a skip word, too short, too long, contains a
+/// digit or is a short all-caps abbreviation. Corrections keep the word's case.
+/// Returns (corrected_text, total_words, corrected_words, skipped_words, corrections)
+/// where corrections maps "word -> corrected" to its number of occurrences.
+#[pyfunction]
+#[pyo3(signature = (text, max_edit_distance=2, min_word_length=4))]
+fn symspell_correct_text(
+    py: Python<'_>,
+    text: &str,
+    max_edit_distance: usize,
+    min_word_length: usize,
+) -> PyResult<(String, u64, u64, u64, symspell::Corrections)> {
+    py.detach(|| {
+        let dictionary = SYMSPELL.read().unwrap();
+        let dictionary = loaded_symspell(&dictionary, max_edit_distance)?;
+        let skip_words = SYMSPELL_SKIP_WORDS.read().unwrap();
+        
+        let mut counts = symspell::CorrectionCounts::default();
+        let corrected = dictionary.correct_text(
+            text,
+            &skip_words,
+            max_edit_distance,
+            min_word_length,
+            &mut symspell::CorrectionCache::default(),
+            &mut counts,
+        );
+        Ok((
+            corrected.into_owned(),
+            counts.total_words,
+            counts.corrected_words,
+            counts.skipped_words,
+            counts.corrections,
+        ))
+    })
+}
+
+/// Correct a file with the loaded SymSpell dictionary, as symspell_correct_text does
+/// The text is read, corrected and written here without becoming a Python string.
+/// Invalid UTF-8 is replaced; with output_path=None nothing is written.
+/// Returns (was_modified, total_words, corrected_words, skipped_words, corrections)
+#[pyfunction]
+#[pyo3(signature = (input_path, output_path=None, max_edit_distance=2, min_word_length=4))]
+fn symspell_correct_file(
+    py: Python<'_>,
+    input_path: &str,
+    output_path: Option<&str>,
+    max_edit_distance: usize,
+    min_word_length: usize,
+) -> PyResult<(bool, u64, u64, u64, symspell::Corrections)> {
+    py.detach(|| {
+        let dictionary = SYMSPELL.read().unwrap();
+        let dictionary = loaded_symspell(&dictionary, max_edit_distance)?;
+        let skip_words = SYMSPELL_SKIP_WORDS.read().unwrap();
+        
+        let mut buf = Vec::new();
+        read_file_into(input_path, &mut buf)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(
+                format!("Failed to read file: {}", e)
+            ))?;
+        let content = String::from_utf8_lossy(&buf);
+        
+        let mut counts = symspell::CorrectionCounts::default();
+        let corrected = dictionary.correct_text(
+            &content,
+            &skip_words,
+            max_edit_distance,
+            min_word_length,
+            &mut symspell::CorrectionCache::default(),
+            &mut counts,
+        );
+        
+        if let Some(output_path) = output_path {
+            if let Some(parent) = std::path::Path::new(output_path).parent() {
+                std::fs::create_dir_all(parent).ok();
+            }
+            std::fs::write(output_path, corrected.as_bytes())
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(
+                    format!("Failed to write file: {}", e)
+                ))?;
+        }
+        
+        Ok((
+            matches!(corrected, std::borrow::Cow::Owned(_)),
+            counts.total_words,
+            counts.corrected_words,
+            counts.skipped_words,
+            counts.corrections,
+        ))
+    })
+}
+
+/// Statistics from batch SymSpell correction
+#[pyclass]
+#[derive(Clone)]
+pub struct SymSpellBatchStats {
+    #[pyo3(get)]
+    pub files_processed: u64,
+    #[pyo3(get)]
+    pub files_modified: u64,
+    #[pyo3(get)]
+    pub files_failed: u64,
+    #[pyo3(get)]
+    pub total_words: u64,
+    #[pyo3(get)]
+    pub corrected_words: u64,
+    #[pyo3(get)]
+    pub skipped_words: u64,
+    /// "word -> corrected" -> occurrences, summed over the batch
+    #[pyo3(get)]
+    pub corrections: symspell::Corrections,
+}
+
+/// Per-worker state for symspell_correct_dir
+#[derive(Default)]
+struct SymSpellWorker<'a> {
+    /// Scratch space for the input file
+    buf: Vec<u8>,
+    cache: symspell::CorrectionCache<'a>,
+    counts: symspell::CorrectionCounts,
+}
+
+/// Correct one file for symspell_correct_dir, adding to the worker's counts
+/// Nothing is written when output_path is None.
+/// Returns whether the text changed, or None if the file could not be read or written.
+fn symspell_correct_file_pair<'a>(
+    dictionary: &'a symspell::SymSpell,
+    skip_words: &symspell::SkipWords,
+    input_path: &str,
+    output_path: Option<&std::path::Path>,
+    max_edit_distance: usize,
+    min_word_length: usize,
+    worker: &mut SymSpellWorker<'a>,
+) -> Option<bool> {
+    read_file_into(input_path, &mut worker.buf).ok()?;
+    let content = String::from_utf8_lossy(&worker.buf);
+    let corrected = dictionary.correct_text(
+        &content,
+        skip_words,
+        max_edit_distance,
+        min_word_length,
+        &mut worker.cache,
+        &mut worker.counts,
+    );
+    if let Some(output_path) = output_path {
+        std::fs::write(output_path, corrected.as_bytes()).ok()?;
+    }
+    Some(matches!(corrected, std::borrow::Cow::Owned(_)))
+}
+
+/// Correct every file under input_dir matching pattern in one call
+/// Files are found with the parallel directory walk and corrected on a Rayon pool
+/// without the GIL and without a Python path list. Each file is read (invalid UTF-8
+/// replaced) and corrected with the loaded dictionary and skip words as in
+/// symspell_correct_text. Outputs mirror the input tree under output_dir; with
+/// output_dir=None files are only analyzed. progress(files_done, total_files) is called once after
+/// discovery (files_done = 0) and every batch_size files; if it returns True, or
+/// `cancel` is cancelled, files not yet started are skipped.
+/// Returns: (SymSpellBatchStats totals, total_files)
+#[pyfunction]
+#[pyo3(signature = (input_dir, output_dir, num_threads, pattern="*.txt", max_edit_distance=2, min_word_length=4, progress=None, batch_size=1000, cancel=None))]
+fn symspell_correct_dir(
+    py: Python<'_>,
+    input_dir: &str,
+    output_dir: Option<&str>,
+    num_threads: usize,
+    pattern: &str,
+    max_edit_distance: usize,
+    min_word_length: usize,
+    progress: Option<Bound<'_, PyAny>>,
+    batch_size: usize,
+    cancel: Option<CancelToken>,
+) -> PyResult<(SymSpellBatchStats, usize)> {
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(num_threads)
+        .build()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            format!("Failed to create thread pool: {}", e)
+        ))?;
+    
+    let input_root = std::path::Path::new(input_dir);
+    let output_root = output_dir.map(std::path::Path::new);
+    let pattern: Vec<char> = pattern.chars().collect();
+    let files = py.detach(|| pool.install(|| find_files_in(input_root, &pattern)));
+    
+    // Create each distinct output directory once up front
+    if let Some(output_root) = output_root {
+        py.detach(|| {
+            let dirs: std::collections::HashSet<&std::path::Path> = files
+                .iter()
+                .filter_map(|path| std::path::Path::new(relative_to(path, input_root)).parent())
+                .collect();
+            pool.install(|| {
+                dirs.par_iter().for_each(|dir| {
+                    std::fs::create_dir_all(output_root.join(dir)).ok();
+                })
+            });
+        });
+    }
+    
+    let mut stats = SymSpellBatchStats {
+        files_processed: 0,
+        files_modified: 0,
+        files_failed: 0,
+        total_words: 0,
+        corrected_words: 0,
+        skipped_words: 0,
+        corrections: symspell::Corrections::default(),
+    };
+    let progress = progress.map(Bound::unbind);
+    let report = |py: Python<'_>, files_done: usize| -> PyResult<bool> {
+        match progress.as_ref() {
+            Some(callback) => callback.bind(py).call1((files_done, files.len()))?.is_truthy(),
+            None => Ok(false),
+        }
+    };
+    
+    let cancel = cancel.unwrap_or_default();
+    if report(py, 0)? {
+        return Ok((stats, files.len()));
+    }
+    
+    // As in strip_noise_dir, per-file outcomes stream back over a channel so progress
+    // needs no per-batch join; correction counts are folded per worker and merged
+    // once the workers finish.
+    let batch_size = batch_size.max(1);
+    let counts = py.detach(|| -> PyResult<symspell::CorrectionCounts> {
+        let dictionary = SYMSPELL.read().unwrap();
+        let dictionary = loaded_symspell(&dictionary, max_edit_distance)?;
+        let skip_words = SYMSPELL_SKIP_WORDS.read().unwrap();
+        
+        let (tx, rx) = std::sync::mpsc::sync_channel(batch_size);
+        std::thread::scope(|scope| {
+            let workers = scope.spawn(|| {
+                // Owned here so the channel closes once the workers finish
+                let tx = tx;
+                pool.install(|| {
+                    files
+                        .par_iter()
+                        .fold(
+                            || (tx.clone(), SymSpellWorker::default()),
+                            |(tx, mut worker), input_path| {
+                                if cancel.is_cancelled() {
+                                    return (tx, worker);
+                                }
+                                let output_path = output_root
+                                    .map(|root| root.join(relative_to(input_path, input_root)));
+                                let result = symspell_correct_file_pair(
+                                    dictionary,
+                                    &skip_words,
+                                    input_path,
+                                    output_path.as_deref(),
+                                    max_edit_distance,
+                                    min_word_length,
+                                    &mut worker,
+                                );
+                                let _ = tx.send(result);
+                                (tx, worker)
+                            },
+                        )
+                        .map(|(_, worker)| worker.counts)
+                        .reduce(symspell::CorrectionCounts::default, symspell::CorrectionCounts::merge)
+                })
+            });
+            
+            let mut files_done = 0;
+            let mut collect = || -> PyResult<()> {
+                for result in rx.iter() {
+                    files_done += 1;
+                    match result {
+                        Some(modified) => {
+                            stats.files_processed += 1;
+                            if modified {
+                                stats.files_modified += 1;
+                            }
+                        }
+                        None => stats.files_failed += 1,
+                    }
+                    if files_done % batch_size == 0 || files_done == files.len() {
+                        if Python::attach(|py| report(py, files_done))? {
+                            cancel.cancel();
+                        }
+                    }
+                }
+                Ok(())
+            };
+            let outcome = collect();
+            if outcome.is_err() {
+                // Stop the workers; they would otherwise keep correcting unreported files
+                cancel.cancel();
+            }
+            // Unblock workers waiting on a full channel before joining them
+            drop(rx);
+            let counts = workers.join().unwrap();
+            outcome.map(|()| counts)
+        })
+    })?;
+    
+    stats.total_words = counts.total_words;
+    stats.corrected_words = counts.corrected_words;
+    stats.skipped_words = counts.skipped_words;
+    stats.corrections = counts.corrections;
+    Ok((stats, files.len()))
+}
+
 #[pymodule]
 fn rust_ocr_clean(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(clean_text, m)?)?;
     m.add_function(wrap_pyfunction!(clean_text_with_categories, m)?)?;
+    m.add_function(wrap_pyfunction!(check_garbage, m)?)?;
     m.add_function(wrap_pyfunction!(clean_file_to_file, m)?)?;
     m.add_function(wrap_pyfunction!(clean_batch_parallel, m)?)?;
+    m.add_function(wrap_pyfunction!(find_files, m)?)?;
+    m.add_function(wrap_pyfunction!(analyze_corpus, m)?)?;
     m.add_function(wrap_pyfunction!(triage_batch_parallel, m)?)?;
     m.add_class::<CleanupResult>()?;
     m.add_class::<BatchStats>()?;
+    m.add_class::<CorpusAnalysis>()?;
     m.add_class::<TriageResultWithLang>()?;
     m.add_class::<TriageBatchStats>()?;
     m.add_class::<VocabBatchStats>()?;
@@ -3905,7 +5528,12 @@ fn rust_ocr_clean(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(init_whitelist, m)?)?;
     m.add_function(wrap_pyfunction!(is_known_word, m)?)?;
     m.add_function(wrap_pyfunction!(word_languages, m)?)?;
+    m.add_function(wrap_pyfunction!(known_word_languages, m)?)?;
     m.add_function(wrap_pyfunction!(dictionaries_loaded, m)?)?;
+    m.add_function(wrap_pyfunction!(init_score_words, m)?)?;
+    m.add_function(wrap_pyfunction!(score_words, m)?)?;
+    m.add_function(wrap_pyfunction!(score_text_words, m)?)?;
+    m.add_function(wrap_pyfunction!(score_file_words, m)?)?;
     m.add_class::<WordInfo>()?;
     m.add_class::<TriageResult>()?;
     m.add_class::<LangDetectResult>()?;
@@ -3923,11 +5551,22 @@ fn rust_ocr_clean(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<StrippedRegion>()?;
     // Noise stripping functions
     m.add_function(wrap_pyfunction!(init_noise_words, m)?)?;
+    m.add_function(wrap_pyfunction!(init_noise_words_compact, m)?)?;
+    m.add_function(wrap_pyfunction!(clear_noise_words, m)?)?;
     m.add_function(wrap_pyfunction!(noise_words_count, m)?)?;
     m.add_function(wrap_pyfunction!(strip_noise_words, m)?)?;
     m.add_function(wrap_pyfunction!(strip_noise_file, m)?)?;
+    m.add_function(wrap_pyfunction!(count_noise_words_file, m)?)?;
     m.add_function(wrap_pyfunction!(strip_noise_batch_parallel, m)?)?;
     m.add_function(wrap_pyfunction!(strip_noise_batch_parallel_logged, m)?)?;
+    m.add_function(wrap_pyfunction!(strip_noise_dir, m)?)?;
+    m.add_class::<CancelToken>()?;
+    m.add_function(wrap_pyfunction!(symspell_load_dictionary, m)?)?;
+    m.add_function(wrap_pyfunction!(symspell_set_skip_words, m)?)?;
+    m.add_function(wrap_pyfunction!(symspell_correct_text, m)?)?;
+    m.add_function(wrap_pyfunction!(symspell_correct_file, m)?)?;
+    m.add_function(wrap_pyfunction!(symspell_correct_dir, m)?)?;
+    m.add_class::<SymSpellBatchStats>()?;
     m.add_class::<StripBatchStats>()?;
     Ok(())
 }
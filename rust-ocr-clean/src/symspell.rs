@@ -0,0 +1,953 @@
+//! SymSpell spelling correction for OCR cleanup.
+//!
+//! A port of symspellpy's symmetric-delete dictionary and Verbosity.CLOSEST
+//! lookup, together with the word rules of ocr_symspell (skip lists, case
+//! preservation, minimum suggestion frequency), so whole texts are corrected
+//! without a Python call per word.
+
+use std::borrow::Cow;
+use std::collections::{HashMap, HashSet};
+use std::hash::{BuildHasherDefault, Hasher};
+use std::io::{self, Write};
+
+use crate::dictionary::with_lowercase;
+
+/// Words longer than this are never corrected
+pub const MAX_WORD_LENGTH: usize = 25;
+
+/// Suggestions seen fewer times than this in the frequency dictionary are ignored
+pub const MIN_SUGGESTION_COUNT: u64 = 1000;
+
+/// FxHash (rustc's hasher): a few multiply-rotates per 8 bytes instead of SipHash
+/// rounds. Word keys come from our own corpus and dictionaries, so there is no need
+/// for SipHash's resistance to adversarial keys.
+#[derive(Default, Clone, Copy)]
+pub struct FxHasher {
+    hash: u64,
+}
+
+const FX_SEED: u64 = 0x51_7c_c1_b7_27_22_0a_95;
+
+impl FxHasher {
+    fn add_to_hash(&mut self, word: u64) {
+        self.hash = (self.hash.rotate_left(5) ^ word).wrapping_mul(FX_SEED);
+    }
+}
+
+impl Hasher for FxHasher {
+    fn write(&mut self, bytes: &[u8]) {
+        let mut chunks = bytes.chunks_exact(8);
+        for chunk in &mut chunks {
+            self.add_to_hash(u64::from_le_bytes(chunk.try_into().unwrap()));
+        }
+        let rest = chunks.remainder();
+        if !rest.is_empty() {
+            let mut buf = [0u8; 8];
+            buf[..rest.len()].copy_from_slice(rest);
+            self.add_to_hash(u64::from_le_bytes(buf));
+        }
+    }
+
+    fn write_u8(&mut self, i: u8) {
+        self.add_to_hash(i as u64);
+    }
+
+    fn write_u32(&mut self, i: u32) {
+        self.add_to_hash(i as u64);
+    }
+
+    fn write_u64(&mut self, i: u64) {
+        self.add_to_hash(i);
+    }
+
+    fn write_usize(&mut self, i: usize) {
+        self.add_to_hash(i as u64);
+    }
+
+    fn finish(&self) -> u64 {
+        // The multiply leaves the best-mixed bits at the top; the table picks
+        // buckets from the bottom (the rotation rustc-hash 2 adds)
+        self.hash.rotate_left(26)
+    }
+}
+
+pub type FxBuildHasher = BuildHasherDefault<FxHasher>;
+
+/// Lowercase words that are never corrected
+pub type SkipWords = HashSet<String, FxBuildHasher>;
+
+/// Whether \b counts c as a word character (Python's str.isalnum() or '_')
+fn is_word_char(c: char) -> bool {
+    c.is_alphanumeric() || c == '_'
+}
+
+/// Byte ranges of the words considered for correction, in order
+/// A direct scan for `\b([a-zA-Z]+(?:'[a-zA-Z]+)?)\b` with Python's Unicode word
+/// boundaries. The regex crate's DFA gives up on Unicode \b at the first non-ASCII
+/// byte, so accented OCR text sent every page through its slower engines.
+pub struct Words<'a> {
+    text: &'a str,
+    pos: usize,
+}
+
+impl<'a> Words<'a> {
+    pub fn new(text: &'a str) -> Self {
+        Words { text, pos: 0 }
+    }
+
+    fn letters_end(&self, start: usize) -> usize {
+        let bytes = self.text.as_bytes();
+        let mut end = start;
+        while end < bytes.len() && bytes[end].is_ascii_alphabetic() {
+            end += 1;
+        }
+        end
+    }
+
+    fn word_char_before(&self, i: usize) -> bool {
+        self.text[..i].chars().next_back().is_some_and(is_word_char)
+    }
+
+    fn word_char_at(&self, i: usize) -> bool {
+        self.text[i..].chars().next().is_some_and(is_word_char)
+    }
+}
+
+impl Iterator for Words<'_> {
+    type Item = (usize, usize);
+
+    fn next(&mut self) -> Option<(usize, usize)> {
+        let bytes = self.text.as_bytes();
+        let mut i = self.pos;
+        while i < bytes.len() {
+            // Non-ASCII bytes are never letters here, so stepping bytewise is safe
+            if !bytes[i].is_ascii_alphabetic() {
+                i += 1;
+                continue;
+            }
+            let start = i;
+            let end = self.letters_end(start);
+            i = end;
+            // A letter run glued to a preceding word character has no \b inside it
+            if self.word_char_before(start) {
+                continue;
+            }
+            // Prefer the apostrophe form; backing off from it leaves the bare run,
+            // which always ends at a boundary (the apostrophe)
+            if end + 1 < bytes.len() && bytes[end] == b'\'' && bytes[end + 1].is_ascii_alphabetic() {
+                let suffix_end = self.letters_end(end + 1);
+                self.pos = if self.word_char_at(suffix_end) { end } else { suffix_end };
+                return Some((start, self.pos));
+            }
+            if !self.word_char_at(end) {
+                self.pos = end;
+                return Some((start, end));
+            }
+        }
+        self.pos = bytes.len();
+        None
+    }
+}
+
+/// First bytes of a write_index file; bump the digit when the layout changes
+const INDEX_MAGIC: &[u8] = b"TCSYMSP1";
+
+/// Hash of a dictionary's text, stored in its index to detect a stale index file
+pub fn source_hash(content: &[u8]) -> u64 {
+    let mut hasher = FxHasher::default();
+    hasher.write(content);
+    hasher.write_usize(content.len());
+    hasher.finish()
+}
+
+/// Write a u32 length followed by the bytes
+fn write_bytes(out: &mut impl Write, bytes: &[u8]) -> io::Result<()> {
+    out.write_all(&(bytes.len() as u32).to_le_bytes())?;
+    out.write_all(bytes)
+}
+
+/// Little-endian reads from a write_index file; None once the data runs out
+struct IndexReader<'a> {
+    data: &'a [u8],
+}
+
+impl<'a> IndexReader<'a> {
+    fn take(&mut self, n: usize) -> Option<&'a [u8]> {
+        if self.data.len() < n {
+            return None;
+        }
+        let (head, rest) = self.data.split_at(n);
+        self.data = rest;
+        Some(head)
+    }
+
+    fn u32(&mut self) -> Option<u32> {
+        Some(u32::from_le_bytes(self.take(4)?.try_into().ok()?))
+    }
+
+    fn u64(&mut self) -> Option<u64> {
+        Some(u64::from_le_bytes(self.take(8)?.try_into().ok()?))
+    }
+
+    fn str(&mut self) -> Option<&'a str> {
+        let len = self.u32()? as usize;
+        std::str::from_utf8(self.take(len)?).ok()
+    }
+}
+
+/// A dictionary term suggested for an input word
+pub struct Suggestion<'a> {
+    pub term: &'a str,
+    pub distance: usize,
+    pub count: u64,
+}
+
+/// Symmetric-delete spelling dictionary
+pub struct SymSpell {
+    max_dictionary_edit_distance: usize,
+    prefix_length: usize,
+    /// (term, count, length in chars); ids index into this
+    terms: Vec<(String, u64, usize)>,
+    index: HashMap<String, u32, FxBuildHasher>,
+    /// Deletes of each term's prefix, mapped to the ids of the terms they came from
+    deletes: HashMap<String, Vec<u32>, FxBuildHasher>,
+    max_length: usize,
+}
+
+impl SymSpell {
+    pub fn new(max_dictionary_edit_distance: usize, prefix_length: usize) -> Self {
+        SymSpell {
+            max_dictionary_edit_distance,
+            prefix_length,
+            terms: Vec::new(),
+            index: HashMap::default(),
+            deletes: HashMap::default(),
+            max_length: 0,
+        }
+    }
+
+    pub fn max_dictionary_edit_distance(&self) -> usize {
+        self.max_dictionary_edit_distance
+    }
+
+    /// Number of dictionary words
+    pub fn len(&self) -> usize {
+        self.terms.len()
+    }
+
+    /// Whether no dictionary words are loaded
+    pub fn is_empty(&self) -> bool {
+        self.terms.is_empty()
+    }
+
+    /// Load "term count" lines (symspellpy's frequency dictionary format)
+    pub fn load_dictionary(&mut self, content: &str) {
+        for line in content.lines() {
+            let mut parts = line.trim_end().split(' ');
+            let (Some(term), Some(count)) = (parts.next(), parts.next()) else {
+                continue;
+            };
+            if let Ok(count) = count.parse::<i64>() {
+                self.create_dictionary_entry(term, count);
+            }
+        }
+    }
+
+    /// Add a word, or add to its count if already present (count threshold 1)
+    pub fn create_dictionary_entry(&mut self, key: &str, count: i64) {
+        if count <= 0 {
+            return;
+        }
+        let count = count as u64;
+        if let Some(&id) = self.index.get(key) {
+            let entry = &mut self.terms[id as usize];
+            entry.1 = entry.1.saturating_add(count).min(i64::MAX as u64);
+            return;
+        }
+
+        let id = self.terms.len() as u32;
+        let key_len = key.chars().count();
+        self.max_length = self.max_length.max(key_len);
+        self.terms.push((key.to_string(), count, key_len));
+        self.index.insert(key.to_string(), id);
+        for delete in self.edits_prefix(key, key_len) {
+            self.deletes.entry(delete).or_default().push(id);
+        }
+    }
+
+    fn edits_prefix(&self, key: &str, key_len: usize) -> HashSet<String, FxBuildHasher> {
+        let mut deletes = HashSet::default();
+        if key_len <= self.max_dictionary_edit_distance {
+            deletes.insert(String::new());
+        }
+        let prefix: String = key.chars().take(self.prefix_length).collect();
+        deletes.insert(prefix.clone());
+        self.edits(&prefix, 0, &mut deletes, 0);
+        deletes
+    }
+
+    fn edits(
+        &self,
+        word: &str,
+        edit_distance: usize,
+        deletes: &mut HashSet<String, FxBuildHasher>,
+        start: usize,
+    ) {
+        let edit_distance = edit_distance + 1;
+        for (pos, (i, _)) in word.char_indices().enumerate().skip(start) {
+            let delete = delete_char_at(word, i);
+            if edit_distance < self.max_dictionary_edit_distance {
+                self.edits(&delete, edit_distance, deletes, pos);
+            }
+            deletes.insert(delete);
+        }
+    }
+
+    /// Write the built dictionary (terms and delete index) to out
+    /// source_hash identifies the dictionary text it was built from (see source_hash);
+    /// read_index only accepts a file with the same hash and edit settings.
+    pub fn write_index(&self, out: &mut impl Write, source_hash: u64) -> io::Result<()> {
+        out.write_all(INDEX_MAGIC)?;
+        for value in [
+            source_hash,
+            self.max_dictionary_edit_distance as u64,
+            self.prefix_length as u64,
+            self.max_length as u64,
+            self.terms.len() as u64,
+        ] {
+            out.write_all(&value.to_le_bytes())?;
+        }
+        for (term, count, len) in &self.terms {
+            write_bytes(out, term.as_bytes())?;
+            out.write_all(&count.to_le_bytes())?;
+            out.write_all(&(*len as u32).to_le_bytes())?;
+        }
+        out.write_all(&(self.deletes.len() as u64).to_le_bytes())?;
+        for (delete, ids) in &self.deletes {
+            write_bytes(out, delete.as_bytes())?;
+            out.write_all(&(ids.len() as u32).to_le_bytes())?;
+            for id in ids {
+                out.write_all(&id.to_le_bytes())?;
+            }
+        }
+        Ok(())
+    }
+
+    /// Rebuild a dictionary written by write_index, without regenerating its deletes
+    /// Returns None if data is not a complete index for source_hash built with these
+    /// edit settings, so the caller can fall back to load_dictionary.
+    pub fn read_index(
+        data: &[u8],
+        source_hash: u64,
+        max_dictionary_edit_distance: usize,
+        prefix_length: usize,
+    ) -> Option<SymSpell> {
+        let mut reader = IndexReader { data: data.strip_prefix(INDEX_MAGIC)? };
+        if reader.u64()? != source_hash
+            || reader.u64()? != max_dictionary_edit_distance as u64
+            || reader.u64()? != prefix_length as u64
+        {
+            return None;
+        }
+        let mut dictionary = SymSpell::new(max_dictionary_edit_distance, prefix_length);
+        dictionary.max_length = reader.u64()? as usize;
+
+        let term_count = reader.u64()? as usize;
+        dictionary.terms.reserve(term_count.min(data.len()));
+        dictionary.index.reserve(term_count.min(data.len()));
+        for id in 0..term_count {
+            let term = reader.str()?;
+            let count = reader.u64()?;
+            let len = reader.u32()? as usize;
+            dictionary.index.insert(term.to_string(), id as u32);
+            dictionary.terms.push((term.to_string(), count, len));
+        }
+
+        let delete_count = reader.u64()? as usize;
+        dictionary.deletes.reserve(delete_count.min(data.len()));
+        for _ in 0..delete_count {
+            let delete = reader.str()?;
+            let id_count = reader.u32()? as usize;
+            let ids: Vec<u32> = (0..id_count).map(|_| reader.u32()).collect::<Option<_>>()?;
+            if ids.iter().any(|&id| id as usize >= term_count) {
+                return None;
+            }
+            dictionary.deletes.insert(delete.to_string(), ids);
+        }
+        reader.data.is_empty().then_some(dictionary)
+    }
+
+    /// Closest dictionary term to a lowercase phrase within max_edit_distance
+    /// Same result as symspellpy's lookup(phrase, Verbosity.CLOSEST)[0]: the
+    /// smallest edit distance, then the highest count. Exact matches win outright.
+    pub fn lookup_closest(&self, phrase: &str, max_edit_distance: usize) -> Option<Suggestion<'_>> {
+        let suggestion = |id: u32, distance: usize| {
+            let (term, count, _) = &self.terms[id as usize];
+            Suggestion { term, distance, count: *count }
+        };
+
+        // OCR words are ASCII, and an ASCII word's bytes are its chars: such words
+        // are compared bytewise against ASCII terms, and only decoded to chars
+        // when a suggestion is not ASCII
+        let phrase_ascii = phrase.is_ascii();
+        let mut phrase_chars: Vec<char> = Vec::new();
+        let phrase_len = if phrase_ascii {
+            phrase.len()
+        } else {
+            phrase_chars.extend(phrase.chars());
+            phrase_chars.len()
+        };
+        // Too long to be within reach of any word
+        if phrase_len > self.max_length + max_edit_distance {
+            return None;
+        }
+        if let Some(&id) = self.index.get(phrase) {
+            return Some(suggestion(id, 0));
+        }
+        if max_edit_distance == 0 {
+            return None;
+        }
+
+        let prefix_length = self.prefix_length;
+        let mut considered_deletes: HashSet<String, FxBuildHasher> = HashSet::default();
+        let mut considered_suggestions: HashSet<u32, FxBuildHasher> = HashSet::default();
+        let mut max_edit_distance_2 = max_edit_distance;
+        let mut suggestions: Vec<(u32, usize)> = Vec::new();
+        // Buffers for the distance checks, allocated once per lookup
+        let mut suggestion_chars: Vec<char> = Vec::new();
+        let mut rows: Vec<usize> = Vec::new();
+
+        let phrase_prefix_len = phrase_len.min(prefix_length);
+        let phrase_prefix: String = if phrase_ascii {
+            phrase[..phrase_prefix_len].to_string()
+        } else {
+            phrase_chars[..phrase_prefix_len].iter().collect()
+        };
+        let mut candidates: Vec<(String, usize)> = vec![(phrase_prefix, phrase_prefix_len)];
+        let mut candidate_pointer = 0;
+
+        while candidate_pointer < candidates.len() {
+            // Each candidate is visited once; move it out rather than copy it
+            let candidate_len = candidates[candidate_pointer].1;
+            let candidate = std::mem::take(&mut candidates[candidate_pointer].0);
+            candidate_pointer += 1;
+            let len_diff = phrase_prefix_len - candidate_len;
+
+            // Candidates come in order of delete distance, so none further on are closer
+            if len_diff > max_edit_distance_2 {
+                break;
+            }
+
+            for &id in self.deletes.get(&candidate).map(Vec::as_slice).unwrap_or(&[]) {
+                let (term, _, suggestion_len) = &self.terms[id as usize];
+                let suggestion_len = *suggestion_len;
+                if suggestion_len.abs_diff(phrase_len) > max_edit_distance_2
+                    || suggestion_len < candidate_len
+                    || (suggestion_len == candidate_len && *term != candidate)
+                {
+                    continue;
+                }
+                let suggestion_prefix_len = suggestion_len.min(prefix_length);
+                if suggestion_prefix_len > phrase_prefix_len
+                    && suggestion_prefix_len - candidate_len > max_edit_distance_2
+                {
+                    continue;
+                }
+
+                let distance;
+                if candidate_len == 0 {
+                    // No characters in common with the phrase
+                    distance = phrase_len.max(suggestion_len);
+                    if distance > max_edit_distance_2 || considered_suggestions.contains(&id) {
+                        continue;
+                    }
+                } else if suggestion_len == 1 {
+                    // Only reachable when the suggestion is itself a delete of the phrase
+                    distance = phrase_len - 1;
+                    if distance > max_edit_distance_2 || considered_suggestions.contains(&id) {
+                        continue;
+                    }
+                } else {
+                    // A term is ASCII exactly when its byte and char lengths agree
+                    let ascii = phrase_ascii && term.len() == suggestion_len;
+                    if !ascii {
+                        if phrase_chars.len() != phrase_len {
+                            phrase_chars.extend(phrase.chars());
+                        }
+                        suggestion_chars.clear();
+                        suggestion_chars.extend(term.chars());
+                    }
+                    // Edits in the prefix already use up the distance: skip
+                    // unless the suffixes could still line up
+                    let at_prefix_limit = prefix_length - max_edit_distance == candidate_len;
+                    let min_distance = if at_prefix_limit {
+                        phrase_len.min(suggestion_len) as isize - prefix_length as isize
+                    } else {
+                        0
+                    };
+                    if min_distance > 0 {
+                        let md = min_distance as usize;
+                        let ruled_out = if ascii {
+                            suffixes_differ(phrase.as_bytes(), term.as_bytes(), md, at_prefix_limit)
+                        } else {
+                            suffixes_differ(&phrase_chars, &suggestion_chars, md, at_prefix_limit)
+                        };
+                        if ruled_out {
+                            continue;
+                        }
+                    }
+                    if !considered_suggestions.insert(id) {
+                        continue;
+                    }
+                    let checked = if ascii {
+                        osa_distance(phrase.as_bytes(), term.as_bytes(), max_edit_distance_2, &mut rows)
+                    } else {
+                        osa_distance(&phrase_chars, &suggestion_chars, max_edit_distance_2, &mut rows)
+                    };
+                    distance = match checked {
+                        Some(d) => d,
+                        None => continue,
+                    };
+                }
+
+                if distance <= max_edit_distance_2 {
+                    if distance < max_edit_distance_2 {
+                        suggestions.clear();
+                    }
+                    max_edit_distance_2 = distance;
+                    suggestions.push((id, distance));
+                }
+            }
+
+            // Queue further deletes of this candidate until the distance limit
+            if len_diff < max_edit_distance && candidate_len <= prefix_length {
+                if len_diff >= max_edit_distance_2 {
+                    continue;
+                }
+                for (i, _) in candidate.char_indices() {
+                    let delete = delete_char_at(&candidate, i);
+                    if !considered_deletes.contains(&delete) {
+                        considered_deletes.insert(delete.clone());
+                        candidates.push((delete, candidate_len - 1));
+                    }
+                }
+            }
+        }
+
+        // All kept suggestions share the smallest distance; take the most frequent
+        // (first found on ties, as symspellpy's stable sort does)
+        let mut best: Option<(u32, usize)> = None;
+        for (id, distance) in suggestions {
+            let count = self.terms[id as usize].1;
+            if best.is_none_or(|(best_id, _)| count > self.terms[best_id as usize].1) {
+                best = Some((id, distance));
+            }
+        }
+        best.map(|(id, distance)| suggestion(id, distance))
+    }
+}
+
+/// word with the char starting at byte offset i removed
+fn delete_char_at(word: &str, i: usize) -> String {
+    let next = i + word[i..].chars().next().map_or(0, char::len_utf8);
+    let mut delete = String::with_capacity(word.len());
+    delete.push_str(&word[..i]);
+    delete.push_str(&word[next..]);
+    delete
+}
+
+/// Whether the ends of phrase p and suggestion s differ too much for s to be in reach
+/// once min_distance edits are spent in the prefix (symspellpy's suffix check)
+fn suffixes_differ<T: PartialEq>(p: &[T], s: &[T], min_distance: usize, at_prefix_limit: bool) -> bool {
+    let (md, pl, sl) = (min_distance, p.len(), s.len());
+    let suffix_differs = at_prefix_limit && md > 1 && p[pl + 1 - md..] != s[sl + 1 - md..];
+    let tail_differs =
+        p[pl - md] != s[sl - md] && (p[pl - md - 1] != s[sl - md] || p[pl - md] != s[sl - md - 1]);
+    suffix_differs || tail_differs
+}
+
+/// Optimal string alignment (restricted Damerau-Levenshtein) distance
+/// rows is scratch space, reused across calls. Returns None if the distance exceeds
+/// max_distance.
+fn osa_distance<T: PartialEq>(a: &[T], b: &[T], max_distance: usize, rows: &mut Vec<usize>) -> Option<usize> {
+    if a.len().abs_diff(b.len()) > max_distance {
+        return None;
+    }
+    let width = b.len() + 1;
+    rows.clear();
+    rows.resize(3 * width, 0);
+    let (mut prev2, rest) = rows.split_at_mut(width);
+    let (mut prev, mut cur) = rest.split_at_mut(width);
+    for (j, d) in prev.iter_mut().enumerate() {
+        *d = j;
+    }
+    for i in 1..=a.len() {
+        cur[0] = i;
+        for j in 1..width {
+            let cost = usize::from(a[i - 1] != b[j - 1]);
+            let mut d = (prev[j] + 1).min(cur[j - 1] + 1).min(prev[j - 1] + cost);
+            if i > 1 && j > 1 && a[i - 1] == b[j - 2] && a[i - 2] == b[j - 1] {
+                d = d.min(prev2[j - 2] + 1);
+            }
+            cur[j] = d;
+        }
+        std::mem::swap(&mut prev2, &mut prev);
+        std::mem::swap(&mut prev, &mut cur);
+    }
+    let distance = prev[b.len()];
+    (distance <= max_distance).then_some(distance)
+}
+
+/// Most distinct words a CorrectionCache holds before starting over
+const CORRECTION_CACHE_CAPACITY: usize = 1 << 17;
+
+/// Correction decisions by lowercase word, so a repeated word is looked up once
+/// Corpus text is Zipfian: a few thousand distinct words make up most tokens.
+/// Entries borrow the dictionary's terms; case is restored per occurrence.
+#[derive(Default)]
+pub struct CorrectionCache<'a> {
+    entries: HashMap<String, Option<&'a str>, FxBuildHasher>,
+}
+
+impl<'a> CorrectionCache<'a> {
+    fn get_or_insert_with(
+        &mut self,
+        lower: &str,
+        correction: impl FnOnce() -> Option<&'a str>,
+    ) -> Option<&'a str> {
+        if let Some(&term) = self.entries.get(lower) {
+            return term;
+        }
+        if self.entries.len() >= CORRECTION_CACHE_CAPACITY {
+            self.entries.clear();
+        }
+        let term = correction();
+        self.entries.insert(lower.to_string(), term);
+        term
+    }
+}
+
+/// Occurrences of each correction, keyed "word -> corrected"
+pub type Corrections = HashMap<String, u64, FxBuildHasher>;
+
+/// Running totals of a correction pass (ocr_symspell.CorrectionStats)
+#[derive(Default)]
+pub struct CorrectionCounts {
+    pub total_words: u64,
+    pub corrected_words: u64,
+    pub skipped_words: u64,
+    /// "word -> corrected" -> occurrences
+    pub corrections: Corrections,
+}
+
+impl CorrectionCounts {
+    /// Add another pass's totals into these
+    pub fn merge(self, other: CorrectionCounts) -> CorrectionCounts {
+        // Fold the smaller correction table into the larger one
+        let (mut into, from) = if self.corrections.len() >= other.corrections.len() {
+            (self, other)
+        } else {
+            (other, self)
+        };
+        into.total_words += from.total_words;
+        into.corrected_words += from.corrected_words;
+        into.skipped_words += from.skipped_words;
+        for (key, count) in from.corrections {
+            *into.corrections.entry(key).or_insert(0) += count;
+        }
+        into
+    }
+}
+
+const UPPER: u8 = 1;
+const LOWER: u8 = 2;
+const DIGIT: u8 = 4;
+
+/// Class bits of each ASCII byte
+const ASCII_CLASSES: [u8; 128] = {
+    let mut classes = [0u8; 128];
+    let mut b = 0;
+    while b < 128 {
+        classes[b] = match b as u8 {
+            b'A'..=b'Z' => UPPER,
+            b'a'..=b'z' => LOWER,
+            b'0'..=b'9' => DIGIT,
+            _ => 0,
+        };
+        b += 1;
+    }
+    classes
+};
+
+/// Union of the class bits of an ASCII word's bytes, in one branch-free pass
+fn ascii_classes(word: &[u8]) -> u8 {
+    word.iter().fold(0, |classes, &b| classes | ASCII_CLASSES[(b & 0x7f) as usize])
+}
+
+/// Python str.isupper(): has cased characters and none are lowercase
+fn is_upper(word: &str) -> bool {
+    if word.is_ascii() {
+        return ascii_classes(word.as_bytes()) & (UPPER | LOWER) == UPPER;
+    }
+    word.chars().any(char::is_uppercase) && !word.chars().any(char::is_lowercase)
+}
+
+/// Python str.istitle(): uppercase only starts a cased run, lowercase only continues one
+fn is_title(word: &str) -> bool {
+    let mut cased = false;
+    let mut previous_cased = false;
+    for c in word.chars() {
+        if c.is_uppercase() {
+            if previous_cased {
+                return false;
+            }
+            previous_cased = true;
+            cased = true;
+        } else if c.is_lowercase() {
+            if !previous_cased {
+                return false;
+            }
+            previous_cased = true;
+            cased = true;
+        } else {
+            previous_cased = false;
+        }
+    }
+    cased
+}
+
+/// Append Python's str.title() of word: uppercase the first cased character of each run
+fn push_title(out: &mut String, word: &str) {
+    let mut previous_cased = false;
+    for c in word.chars() {
+        if previous_cased {
+            out.extend(c.to_lowercase());
+        } else {
+            out.extend(c.to_uppercase());
+        }
+        previous_cased = c.is_uppercase() || c.is_lowercase();
+    }
+}
+
+/// Append corrected to out in the case pattern of original
+fn push_with_case(out: &mut String, original: &str, corrected: &str) {
+    if is_upper(original) {
+        if corrected.is_ascii() {
+            out.extend(corrected.chars().map(|c| c.to_ascii_uppercase()));
+        } else {
+            out.push_str(&corrected.to_uppercase());
+        }
+    } else if is_title(original) {
+        push_title(out, corrected);
+    } else if corrected.is_ascii() {
+        out.extend(corrected.chars().map(|c| c.to_ascii_lowercase()));
+    } else {
+        out.push_str(&corrected.to_lowercase());
+    }
+}
+
+/// Words never sent to SymSpell (ocr_symspell.should_skip_word plus the minimum length)
+/// The checks are ordered cheapest first: most words are short, and are decided by
+/// their length and one classification pass before the skip set is hashed.
+fn should_skip_word(word: &str, lower: &str, skip_words: &SkipWords, min_word_length: usize) -> bool {
+    // Scanned words are ASCII: one table pass gives the length, digits and case
+    let (len, has_digit, all_upper) = if word.is_ascii() {
+        let classes = ascii_classes(word.as_bytes());
+        (word.len(), classes & DIGIT != 0, classes & (UPPER | LOWER) == UPPER)
+    } else {
+        (word.chars().count(), word.bytes().any(|b| b.is_ascii_digit()), is_upper(word))
+    };
+    len < min_word_length
+        || len > MAX_WORD_LENGTH
+        || (len == 1 && !matches!(lower, "a" | "i" | "o"))
+        || has_digit
+        || (len <= 5 && all_upper)
+        || skip_words.contains(lower)
+}
+
+impl SymSpell {
+    /// Dictionary term to correct a lowercase word to, or None to keep it as is
+    /// Depends only on the lowercase form, so results can be cached per word.
+    fn correction_for(&self, lower: &str, max_edit_distance: usize) -> Option<&str> {
+        let best = self.lookup_closest(lower, max_edit_distance)?;
+        let term = best.term.to_lowercase();
+        if term == lower {
+            return None;
+        }
+        if lower.chars().count() <= 5 && best.distance > 1 {
+            return None;
+        }
+        if best.count < MIN_SUGGESTION_COUNT {
+            return None;
+        }
+        // Don't "correct" American spellings to British ones
+        if term.replace("ou", "o") == lower || term.replace("re", "er") == lower {
+            return None;
+        }
+        Some(best.term)
+    }
+
+    /// Correct every word of text, adding to counts
+    /// Text without corrections is returned as is, unallocated and uncopied, so the
+    /// result is Owned exactly when something changed. cache must only be shared
+    /// between calls with the same max_edit_distance.
+    pub fn correct_text<'a, 't>(
+        &'a self,
+        text: &'t str,
+        skip_words: &SkipWords,
+        max_edit_distance: usize,
+        min_word_length: usize,
+        cache: &mut CorrectionCache<'a>,
+        counts: &mut CorrectionCounts,
+    ) -> Cow<'t, str> {
+        // Allocated at the first correction
+        let mut result = String::new();
+        let mut last_end = 0;
+        // Reused for each correction's table key; only a new pair allocates
+        let mut key = String::new();
+        for (start, end) in Words::new(text) {
+            let word = &text[start..end];
+            counts.total_words += 1;
+            let term = with_lowercase(word, |lower| {
+                if should_skip_word(word, lower, skip_words, min_word_length) {
+                    counts.skipped_words += 1;
+                    return None;
+                }
+                cache.get_or_insert_with(lower, || self.correction_for(lower, max_edit_distance))
+            });
+            if let Some(term) = term {
+                if result.is_empty() {
+                    result.reserve(text.len());
+                }
+                result.push_str(&text[last_end..start]);
+                let corrected_start = result.len();
+                push_with_case(&mut result, word, term);
+                last_end = end;
+                
+                counts.corrected_words += 1;
+                key.clear();
+                key.push_str(word);
+                key.push_str(" -> ");
+                key.push_str(&result[corrected_start..]);
+                match counts.corrections.get_mut(key.as_str()) {
+                    Some(count) => *count += 1,
+                    None => {
+                        counts.corrections.insert(key.clone(), 1);
+                    }
+                }
+            }
+        }
+        if result.is_empty() {
+            return Cow::Borrowed(text);
+        }
+        result.push_str(&text[last_end..]);
+        Cow::Owned(result)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn words(text: &str) -> Vec<&str> {
+        Words::new(text).map(|(start, end)| &text[start..end]).collect()
+    }
+
+    fn lookup<'a>(dictionary: &'a SymSpell, phrase: &str, max_edit_distance: usize) -> Option<(&'a str, usize)> {
+        dictionary
+            .lookup_closest(phrase, max_edit_distance)
+            .map(|s| (s.term, s.distance))
+    }
+
+    fn with_case(original: &str, corrected: &str) -> String {
+        let mut out = String::new();
+        push_with_case(&mut out, original, corrected);
+        out
+    }
+
+    #[test]
+    fn test_words_apostrophes() {
+        assert_eq!(words("don't stop"), ["don't", "stop"]);
+        assert_eq!(words("rock'n'roll"), ["rock'n", "roll"]);
+        assert_eq!(words("the dogs' bone"), ["the", "dogs", "bone"]);
+        assert_eq!(words("'quoted' it'5"), ["quoted", "it"]);
+        // The suffix is glued to a digit, so only the bare run ends at a boundary
+        assert_eq!(words("can'tx1"), ["can"]);
+    }
+
+    #[test]
+    fn test_words_need_word_boundaries() {
+        assert_eq!(words("abc1 2abc x3y word"), ["word"]);
+        assert_eq!(words("foo_bar _baz qux_ ok"), ["ok"]);
+        // Non-ASCII letters are word characters, so runs touching them are not words
+        assert_eq!(words("café naïve über ok"), ["ok"]);
+        assert_eq!(words("\u{201c}quoted\u{201d} — dash"), ["quoted", "dash"]);
+        assert!(words("").is_empty());
+    }
+
+    #[test]
+    fn test_lookup_closest_distances() {
+        let mut dictionary = SymSpell::new(2, 7);
+        dictionary.load_dictionary("hello 100\ncat 10\ncart 1000\n");
+
+        assert_eq!(lookup(&dictionary, "hello", 2), Some(("hello", 0)));
+        assert_eq!(lookup(&dictionary, "helo", 2), Some(("hello", 1)));
+        assert_eq!(lookup(&dictionary, "hxllp", 2), Some(("hello", 2)));
+        assert_eq!(lookup(&dictionary, "hxllp", 1), None);
+        // A closer term wins over a more frequent one
+        assert_eq!(lookup(&dictionary, "cot", 2), Some(("cat", 1)));
+        assert_eq!(lookup(&dictionary, "zzzzzz", 2), None);
+    }
+
+    #[test]
+    fn test_lookup_closest_ties() {
+        let mut dictionary = SymSpell::new(2, 7);
+        dictionary.load_dictionary("bat 5\ncat 50\n");
+        // Same distance: the more frequent term wins
+        assert_eq!(lookup(&dictionary, "xat", 2), Some(("cat", 1)));
+
+        // Same distance and count: the first term found wins
+        let mut dictionary = SymSpell::new(2, 7);
+        dictionary.load_dictionary("bat 5\ncat 5\n");
+        assert_eq!(lookup(&dictionary, "xat", 2), Some(("bat", 1)));
+        let mut dictionary = SymSpell::new(2, 7);
+        dictionary.load_dictionary("cat 5\nbat 5\n");
+        assert_eq!(lookup(&dictionary, "xat", 2), Some(("cat", 1)));
+    }
+
+    #[test]
+    fn test_push_with_case() {
+        // Upper case
+        assert_eq!(with_case("TEH", "the"), "THE");
+        assert_eq!(with_case("ÉTE", "été"), "ÉTÉ");
+        // Title case, including str.title()'s capital after an apostrophe
+        assert_eq!(with_case("Teh", "the"), "The");
+        assert_eq!(with_case("Dont", "don't"), "Don'T");
+        // Mixed case falls back to lowercase
+        assert_eq!(with_case("tEh", "the"), "the");
+        assert_eq!(with_case("McDonld", "McDonald"), "mcdonald");
+    }
+
+    #[test]
+    fn test_index_round_trip() {
+        let content = "hello 100\nworld 50\nword 20\n";
+        let mut dictionary = SymSpell::new(2, 7);
+        dictionary.load_dictionary(content);
+        let hash = source_hash(content.as_bytes());
+        let mut data = Vec::new();
+        dictionary.write_index(&mut data, hash).unwrap();
+
+        let loaded = SymSpell::read_index(&data, hash, 2, 7).expect("index should load");
+        assert_eq!(loaded.len(), dictionary.len());
+        for phrase in ["hello", "helo", "wrld", "wordd", "xyzzy"] {
+            assert_eq!(lookup(&loaded, phrase, 2), lookup(&dictionary, phrase, 2));
+        }
+
+        // Stale hash, other edit settings or truncated data are rejected
+        let stale = source_hash(b"hello 100\n");
+        assert!(SymSpell::read_index(&data, stale, 2, 7).is_none());
+        assert!(SymSpell::read_index(&data, hash, 1, 7).is_none());
+        assert!(SymSpell::read_index(&data, hash, 2, 6).is_none());
+        assert!(SymSpell::read_index(&data[..data.len() - 1], hash, 2, 7).is_none());
+    }
+}
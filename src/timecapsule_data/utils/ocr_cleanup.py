@@ -35,15 +35,32 @@ Usage:
 
 import argparse
 import json
+import os
+import queue
+import random
 import re
+import signal
+import sqlite3
 import sys
+import threading
+import time
 from collections import Counter
 from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import rust_ocr_clean
 
+# Optional: orjson for faster report and JSONL serialization (pip install orjson)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def get_unique_path(path: Path) -> Path:
     """Return a unique path by adding numeric suffix if file exists.
@@ -66,6 +83,120 @@ def get_unique_path(path: Path) -> Path:
         counter += 1
 
 
+def write_json_report(path: Path, data: dict) -> None:
+    """Write a report as indented JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+# Write buffer for JSONL logs; large so per-record writes rarely reach a syscall
+JSONL_BUFFER_SIZE = 1 << 20
+
+
+def jsonl_line(record: dict) -> bytes:
+    """Serialize a record as one newline-terminated JSONL line, using orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+class JsonlWriter:
+    """Append JSON records to a JSONL file from a background thread.
+
+    Records go through a bounded queue, so the processing loop never waits on
+    disk and write() blocks (bounding memory) only if the writer falls behind.
+    Errors raised while writing are re-raised from close().
+    """
+
+    _DONE = object()
+
+    def __init__(self, path: Path, maxsize: int = 10_000):
+        self._file = open(path, "wb", buffering=JSONL_BUFFER_SIZE)
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is self._DONE:
+                return
+            if self._error is not None:
+                continue  # Keep draining so write() never blocks forever
+            try:
+                self._file.write(jsonl_line(record))
+            except Exception as e:
+                self._error = e
+
+    def write(self, record: dict) -> None:
+        self._queue.put(record)
+
+    def close(self) -> None:
+        self._queue.put(self._DONE)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+
+class FileStateCache:
+    """Input file (mtime_ns, size) from the last successful run, kept in SQLite.
+
+    Lets batch reruns skip files that have not changed since they were cleaned,
+    like make's timestamp check. Rows are loaded into memory once at open.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_state (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._state = {
+            row[0]: (row[1], row[2])
+            for row in self._conn.execute("SELECT path, mtime_ns, size FROM file_state")
+        }
+
+    def is_unchanged(self, path: str) -> bool:
+        """True if path has the same mtime and size as when it was last recorded."""
+        cached = self._state.get(path)
+        if cached is None:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return cached == (st.st_mtime_ns, st.st_size)
+
+    def record(self, paths: list[str]) -> None:
+        """Store the current mtime and size of successfully processed files."""
+        rows = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rows.append((path, st.st_mtime_ns, st.st_size))
+        self._conn.executemany("INSERT OR REPLACE INTO file_state VALUES (?, ?, ?)", rows)
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 # =============================================================================
 # Preprocessing Functions (applied before OCR substitutions)
 # Uses Rust implementations for performance at scale (2M+ docs)
@@ -116,13 +247,14 @@ def normalize_whitespace(text: str) -> tuple[str, int]:
     """
     changes = 0
 
-    # Normalize line endings first
-    if "\r\n" in text:
-        text = text.replace("\r\n", "\n")
-        changes += 1
+    # Normalize line endings first (single scan in the common LF-only case)
     if "\r" in text:
-        text = text.replace("\r", "\n")
-        changes += 1
+        if "\r\n" in text:
+            text = text.replace("\r\n", "\n")
+            changes += 1
+        if "\r" in text:
+            text = text.replace("\r", "\n")
+            changes += 1
 
     # Strip trailing whitespace from each line (critical for hyphen detection)
     lines = text.split("\n")
@@ -204,18 +336,19 @@ def normalize_midword_caps(text: str) -> tuple[str, int]:
 # Common OCR substitution errors
 # Format: (error_pattern, correction, context_required)
 # context_required: None = always apply, or regex that must match around the word
-# Patterns that indicate garbage OCR (not fixable, flag for review)
-GARBAGE_PATTERNS = [
-    r"[^\x00-\x7F]{10,}",  # Long runs of non-ASCII
-    r"[bcdfghjklmnpqrstvwxz]{6,}",  # Long consonant runs
-    r"\d{2,}[a-z]+\d{2,}",  # Numbers mixed into words oddly
-    r"[|l1I]{5,}",  # Pipe/l/1/I confusion runs
-]
+# A document is flagged for a pattern once it has more matches than this
+GARBAGE_MATCH_THRESHOLD = 5
 
 
 # Threshold for flagging high-substitution documents (substitutions per 1000 chars)
 HIGH_SUBSTITUTION_THRESHOLD = 10.0
 
+# Skipped-file records kept for the report, per triage action (quarantine, reject)
+TRIAGE_SAMPLE_SIZE = 500
+
+# Most frequent substitution categories kept in the report
+TOP_SUBSTITUTIONS = 50
+
 
 @dataclass
 class CleanupStats:
@@ -230,7 +363,7 @@ class CleanupStats:
     hyphen_rejoins: int = 0
     midword_caps_fixes: int = 0
     long_s_fixes: int = 0  # Track long-s fixes separately
-    substitution_counts: Counter = field(default_factory=Counter)
+    substitution_counts: Counter = field(default_factory=Counter)  # category -> count
     flagged_files: list = field(default_factory=list)
     skipped_files: list = field(default_factory=list)  # Non-English files
     # Per-document tracking (only interesting docs, not all 1M+)
@@ -242,7 +375,10 @@ class CleanupStats:
     triage_passed: int = 0
     triage_quarantined: int = 0
     triage_rejected: int = 0
-    triage_results: list = field(default_factory=list)  # Full triage results for JSONL export
+    # Reservoir samples of non-pass triage records: action -> list (capped per action)
+    triage_samples: dict = field(default_factory=dict)
+    triage_seen: Counter = field(default_factory=Counter)  # action -> records offered
+    _triage_rng: random.Random = field(default_factory=lambda: random.Random(42), repr=False)
     elapsed_seconds: float = 0.0  # Total processing time
     # Boilerplate stripping stats
     files_with_boilerplate: int = 0
@@ -298,7 +434,54 @@ class CleanupStats:
                     }
                 )
 
-    def to_dict(self):
+    def track_triage_skip(self, record: dict):
+        """Reservoir-sample a non-pass triage record (Algorithm R, per action)."""
+        action = record["action"]
+        seen = self.triage_seen[action]
+        self.triage_seen[action] = seen + 1
+        sample = self.triage_samples.setdefault(action, [])
+        if len(sample) < TRIAGE_SAMPLE_SIZE:
+            sample.append(record)
+        else:
+            j = self._triage_rng.randrange(seen + 1)
+            if j < TRIAGE_SAMPLE_SIZE:
+                sample[j] = record
+
+    def track_language_skip(self, source: Path, confidence: float):
+        """Record a document skipped as non-English."""
+        self.files_skipped_language += 1
+        self.skipped_files.append(
+            {
+                "file": str(source),
+                "reason": "non-english",
+                "confidence": confidence,
+            }
+        )
+
+    def track_cleanup(self, source: Path, char_count: int, sub_count: int, categories: dict):
+        """Aggregate one document's Rust cleanup results (single-file mode)."""
+        long_s_fixes = categories.get("long_s", 0)
+        self.total_substitutions += sub_count
+        self.long_s_fixes += long_s_fixes
+        self.substitution_counts.update(categories)
+
+        # Track per-document stats (only stores interesting docs - high sub rate)
+        if sub_count > 0:
+            self.track_document(
+                filename=source.name,
+                char_count=char_count,
+                total_subs=sub_count,
+                long_s_fixes=long_s_fixes,
+                whitespace_fixes=0,  # Preprocessing not done in single-file mode
+                hyphen_fixes=0,
+                midword_caps_fixes=0,
+                has_long_s=long_s_fixes > 0,
+            )
+
+    def to_dict(self, top_substitutions: Optional[list[tuple[str, int]]] = None):
+        """Report-ready stats; pass top_substitutions if most_common() was already computed."""
+        if top_substitutions is None:
+            top_substitutions = self.substitution_counts.most_common(TOP_SUBSTITUTIONS)
         return {
             "total_files": self.total_files,
             "files_modified": self.files_modified,
@@ -316,7 +499,7 @@ class CleanupStats:
                 - self.midword_caps_fixes
                 - self.long_s_fixes,
             },
-            "top_substitutions": self.substitution_counts.most_common(50),
+            "top_substitutions": top_substitutions[:TOP_SUBSTITUTIONS],
             "flagged_files": self.flagged_files[:100],
             "skipped_files": self.skipped_files[:100],
             # Per-document analysis (only interesting docs stored, not all 1M+)
@@ -335,9 +518,9 @@ class CleanupStats:
             "triage_passed": self.triage_passed,
             "triage_quarantined": self.triage_quarantined,
             "triage_rejected": self.triage_rejected,
-            "triage_skipped_files": [r for r in self.triage_results if r["action"] != "pass"][
-                :500
-            ],  # Cap at 500 to avoid huge reports
+            "triage_skipped_files": [
+                record for sample in self.triage_samples.values() for record in sample
+            ],  # Up to TRIAGE_SAMPLE_SIZE per action
             # Boilerplate stripping stats
             "boilerplate": {
                 "files_with_boilerplate": self.files_with_boilerplate,
@@ -348,13 +531,49 @@ class CleanupStats:
 
 
 def check_garbage(text: str) -> list[tuple[str, int]]:
-    """Check for unfixable garbage patterns. Returns list of (pattern, count)."""
-    issues = []
-    for pattern in GARBAGE_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if len(matches) > 5:
-            issues.append((pattern, len(matches)))
-    return issues
+    """Check for unfixable garbage patterns. Returns list of (pattern, count).
+
+    A pattern is flagged once it matches more than GARBAGE_MATCH_THRESHOLD times;
+    scanning stops there, so count is capped at GARBAGE_MATCH_THRESHOLD + 1.
+    Matching runs in Rust (regex crate DFA, GIL released).
+    """
+    return rust_ocr_clean.check_garbage(text)
+
+
+def clean_content(
+    content: str,
+    source: Path,
+    stats: Optional[CleanupStats] = None,
+    skip_language_check: bool = False,
+) -> tuple[str, int, list, bool]:
+    """
+    Clean already-loaded text.
+
+    Args:
+        content: Text to clean
+        source: Path the text came from (used for stats and skip records)
+        stats: CleanupStats object to update
+        skip_language_check: If True, skip language detection
+
+    Returns: (cleaned_text, substitution_count, garbage_issues, was_skipped)
+        was_skipped is True if the text was skipped due to non-English content
+    """
+    # Language detection - skip non-English documents
+    if not skip_language_check:
+        is_english, confidence = detect_language(content)
+        if not is_english:
+            if stats:
+                stats.track_language_skip(source, confidence)
+            return content, 0, [], True
+
+    # Use Rust for all OCR cleanup and garbage detection (no Python fallback)
+    result = rust_ocr_clean.clean_text_with_categories(content)
+    sub_count = result.total_substitutions
+
+    if stats:
+        stats.track_cleanup(source, len(content), sub_count, result.substitutions_by_category)
+
+    return result.text, sub_count, result.garbage_issues, False
 
 
 def clean_file(
@@ -366,6 +585,10 @@ def clean_file(
     """
     Clean a single file.
 
+    When output_path is set, the file is read, cleaned (boilerplate stripping +
+    OCR cleanup) and written entirely in Rust, the same pipeline the batch
+    command uses, so the text never round-trips through a Python str.
+
     Args:
         input_path: Path to input file
         output_path: Path to output file (None = don't write)
@@ -376,67 +599,60 @@ def clean_file(
         was_skipped is True if file was skipped due to non-English content
     """
     try:
-        with open(input_path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
+        # Language detection - skip non-English documents (Rust reads only the file head)
+        if not skip_language_check:
+            lang = rust_ocr_clean.detect_language_file(str(input_path), 0.5)
+            if not lang.is_english:
+                if stats:
+                    stats.track_language_skip(input_path, lang.confidence)
+                # Don't process, don't copy to output
+                return False, 0, [], True
+
+        if output_path is None:
+            with open(input_path, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
+            _, sub_count, garbage_issues, _ = clean_content(
+                content, input_path, stats, skip_language_check=True
+            )
+            return sub_count > 0, sub_count, garbage_issues, False
+
+        was_modified, sub_count, _, categories, _, garbage_issues, chars_read = (
+            rust_ocr_clean.clean_file_to_file(str(input_path), str(output_path))
+        )
     except Exception as e:
-        print(f"  Error reading {input_path}: {e}")
+        print(f"  Error processing {input_path}: {e}")
         return False, 0, [], False
 
-    # Language detection - skip non-English documents
-    if not skip_language_check:
-        is_english, confidence = detect_language(content)
-        if not is_english:
-            if stats:
-                stats.files_skipped_language += 1
-                stats.skipped_files.append(
-                    {
-                        "file": str(input_path),
-                        "reason": "non-english",
-                        "confidence": confidence,
-                    }
-                )
-            # Don't process, don't copy to output
-            return False, 0, [], True
-
-    garbage_issues = check_garbage(content)
-
-    # Use Rust for all OCR cleanup (no Python fallback)
-    result = rust_ocr_clean.clean_text_with_categories(content)
-    cleaned = result.text
-    sub_count = result.total_substitutions
-    categories = result.substitutions_by_category
-    was_modified = sub_count > 0
-
-    # Update stats from Rust results
     if stats:
-        stats.total_substitutions += sub_count
-        stats.long_s_fixes += categories.get("long_s", 0)
-
-    # Track per-document stats (only stores interesting docs - high sub rate)
-    if stats and sub_count > 0:
-        stats.track_document(
-            filename=input_path.name,
-            char_count=len(content),
-            total_subs=sub_count,
-            long_s_fixes=categories.get("long_s", 0),
-            whitespace_fixes=0,  # Preprocessing not done in single-file mode
-            hyphen_fixes=0,
-            midword_caps_fixes=0,
-            has_long_s=categories.get("long_s", 0) > 0,
-        )
-
-    if output_path and was_modified:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(cleaned)
-    elif output_path and not was_modified:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        stats.track_cleanup(input_path, chars_read, sub_count, categories)
 
     return was_modified, sub_count, garbage_issues, False
 
 
+def format_progress(
+    done: int, total: int, elapsed: float, bytes_processed: int, total_subs: int
+) -> str:
+    """Format a batch progress line with throughput and ETA."""
+    files_per_sec = done / elapsed if elapsed > 0 else 0
+    mb_per_sec = (bytes_processed / (1024 * 1024)) / elapsed if elapsed > 0 else 0
+    remaining = (total - done) / files_per_sec if files_per_sec > 0 else 0
+
+    # Format remaining time
+    if remaining >= 3600:
+        eta = f"{remaining / 3600:.1f}h"
+    elif remaining >= 60:
+        eta = f"{remaining / 60:.1f}m"
+    else:
+        eta = f"{remaining:.0f}s"
+
+    pct = (done / total) * 100 if total > 0 else 100
+    return (
+        f"  [{pct:5.1f}%] {done:,}/{total:,} files | "
+        f"{files_per_sec:.1f} files/s | {mb_per_sec:.1f} MB/s | "
+        f"ETA: {eta} | subs: {total_subs:,}"
+    )
+
+
 def clean_batch(
     input_dir: Path,
     output_dir: Optional[Path] = None,
@@ -446,8 +662,9 @@ def clean_batch(
     triage_output: Optional[Path] = None,
     boilerplate_log: Optional[Path] = None,
     parallel: bool = True,
-    num_threads: int = 24,
+    num_threads: Optional[int] = None,
     input_files: Optional[list[Path]] = None,
+    state_db: Optional[Path] = None,
 ) -> CleanupStats:
     """
     Clean all text files in a directory.
@@ -464,14 +681,13 @@ def clean_batch(
         triage_output: If set, write triage results to this JSONL file
         boilerplate_log: If set, write boilerplate audit log to this JSONL file
         parallel: If True, use multi-threaded Rayon processing (default: True)
-        num_threads: Number of threads for parallel processing (default: 24)
+        num_threads: Number of threads for parallel processing (default: all CPU cores)
         input_files: If provided, use this file list instead of scanning input_dir
+        state_db: If set, skip inputs unchanged (mtime, size) since their last
+            successful run, tracked in this SQLite file
     """
-    import signal
-    import sys
-    import time
-
     stats = CleanupStats()
+    num_threads = num_threads or os.cpu_count() or 1
     interrupted = False
 
     def handle_interrupt(signum, frame):
@@ -483,149 +699,117 @@ def clean_batch(
         interrupted = True
         print("\n\nInterrupted! Finishing current file, then stopping...", file=sys.stderr)
 
+    state_cache = FileStateCache(state_db) if state_db else None
+    # JSONL writers, closed in the finally block so queued records are flushed
+    # even on error or a forced quit
+    triage_writer: Optional[JsonlWriter] = None
+    boilerplate_log_file: Optional[JsonlWriter] = None
+
     # Set up clean interrupt handling
     old_handler = signal.signal(signal.SIGINT, handle_interrupt)
 
     try:
-        # Import Rust module (required - no Python fallback)
-        import rust_ocr_clean  # type: ignore[import-not-found]
-
-        rust_clean_file = rust_ocr_clean.clean_file_to_file
-
-        # Use provided file list or discover files
+        # Use provided file list or discover files (paths are kept as str from here on)
         if input_files is not None:
             print(f"Using provided file list: {len(input_files):,} files")
-            stats.total_files = len(input_files)
+            input_paths = [str(f) for f in input_files]
         else:
-            # Discover files using os.scandir (faster than glob)
+            # Discover files with a parallel directory walk in Rust
             print(f"Scanning {input_dir} for {file_pattern} files...", end="", flush=True)
-
-            import fnmatch
-            import os
-
-            def fast_find_files(directory: Path, pattern: str) -> list[Path]:
-                """Fast recursive file discovery using os.scandir."""
-                results = []
-                dirs_to_scan = [directory]
-                scanned = 0
-
-                while dirs_to_scan:
-                    current_dir = dirs_to_scan.pop()
-                    try:
-                        with os.scandir(current_dir) as it:
-                            for entry in it:
-                                if entry.is_dir(follow_symlinks=False):
-                                    dirs_to_scan.append(Path(entry.path))
-                                elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
-                                    results.append(Path(entry.path))
-                    except PermissionError:
-                        continue
-
-                    scanned += 1
-                    if scanned % 500 == 0:
-                        print(".", end="", flush=True)
-
-                return results
-
-            input_files = fast_find_files(input_dir, file_pattern)
-            stats.total_files = len(input_files)
-            print(f" found {stats.total_files:,} files")
+            input_paths = rust_ocr_clean.find_files(str(input_dir), file_pattern, num_threads)
+            print(f" found {len(input_paths):,} files")
+        stats.total_files = len(input_paths)
 
         if stats.total_files == 0:
             print("No files found.")
             return stats
 
         # Document triage - filter out problematic content before OCR cleanup
-        files_to_process = input_files
+        files_to_process = input_paths
         if not skip_triage:
             print(f"Running document triage (parallel, {num_threads} threads)...")
-            try:
-                import rust_ocr_clean  # type: ignore[import-not-found]
-
-                total_files = len(input_files)
-                paths = [str(f) for f in input_files]
-                triage_start = time.time()
+            total_files = len(input_paths)
+            triage_start_ns = time.monotonic_ns()
+
+            # Single parallel call does structural triage + language detection
+            triage_results, triage_stats = rust_ocr_clean.triage_batch_parallel(
+                input_paths,
+                num_threads,
+                0.5,  # lang confidence threshold
+            )
 
-                # Single parallel call does structural triage + language detection
-                triage_results, triage_stats = rust_ocr_clean.triage_batch_parallel(
-                    paths,
-                    num_threads,
-                    0.5,  # lang confidence threshold
-                )
+            triage_elapsed = (time.monotonic_ns() - triage_start_ns) / 1e9
+            triage_rate = total_files / triage_elapsed if triage_elapsed > 0 else 0
+
+            # Process results, streaming the full record set to JSONL if requested
+            # and keeping only a capped sample of skipped files in memory
+            pass_files = []
+            language_counts: dict[str, int] = {}
+            if triage_output:
+                triage_writer = JsonlWriter(triage_output)
+
+            for r in triage_results:
+                triage_record = {
+                    "path": r.path,
+                    "action": r.action,
+                    "problems": list(r.problems),
+                    "signals": {
+                        "alpha_ratio": round(r.alpha_ratio, 4),
+                        "line_length_cv": round(r.line_length_cv, 4),
+                        "mean_words_per_line": round(r.mean_words_per_line, 2),
+                        "fragment_ratio": round(r.fragment_ratio, 4),
+                    },
+                }
 
-                triage_elapsed = time.time() - triage_start
-                triage_rate = total_files / triage_elapsed if triage_elapsed > 0 else 0
-
-                # Process results
-                pass_files = []
-                language_counts: dict[str, int] = {}
-
-                for r in triage_results:
-                    triage_record = {
-                        "path": r.path,
-                        "action": r.action,
-                        "problems": list(r.problems),
-                        "signals": {
-                            "alpha_ratio": round(r.alpha_ratio, 4),
-                            "line_length_cv": round(r.line_length_cv, 4),
-                            "mean_words_per_line": round(r.mean_words_per_line, 2),
-                            "fragment_ratio": round(r.fragment_ratio, 4),
-                        },
+                # Add language info if detected
+                if r.detected_lang:
+                    triage_record["language"] = {
+                        "detected": r.detected_lang,
+                        "confidence": round(r.lang_confidence, 4),
+                        "is_english": r.is_english,
                     }
+                    if not r.is_english:
+                        language_counts[r.detected_lang] = (
+                            language_counts.get(r.detected_lang, 0) + 1
+                        )
 
-                    # Add language info if detected
-                    if r.detected_lang:
-                        triage_record["language"] = {
-                            "detected": r.detected_lang,
-                            "confidence": round(r.lang_confidence, 4),
-                            "is_english": r.is_english,
-                        }
-                        if not r.is_english:
-                            language_counts[r.detected_lang] = (
-                                language_counts.get(r.detected_lang, 0) + 1
-                            )
+                if triage_writer:
+                    triage_writer.write(triage_record)
 
-                    stats.triage_results.append(triage_record)
+                if r.action == "pass":
+                    pass_files.append(r.path)
+                else:
+                    stats.track_triage_skip(triage_record)
 
-                    if r.action == "pass":
-                        pass_files.append(Path(r.path))
+            # Update stats from Rust
+            stats.triage_passed = triage_stats.passed
+            stats.triage_quarantined = triage_stats.quarantined
+            stats.triage_rejected = triage_stats.rejected
 
-                # Update stats from Rust
-                stats.triage_passed = triage_stats.passed
-                stats.triage_quarantined = triage_stats.quarantined
-                stats.triage_rejected = triage_stats.rejected
+            files_to_process = pass_files
 
-                files_to_process = pass_files
+            # Print summary
+            print(
+                f"  Triage complete: {total_files:,} files in {triage_elapsed:.1f}s "
+                f"({triage_rate:.0f} files/s)"
+            )
+            print(
+                f"  Results: pass={triage_stats.passed:,}, "
+                f"quarantine={triage_stats.quarantined:,}, "
+                f"reject={triage_stats.rejected:,}"
+            )
 
-                # Print summary
-                print(
-                    f"  Triage complete: {total_files:,} files in {triage_elapsed:.1f}s "
-                    f"({triage_rate:.0f} files/s)"
-                )
-                print(
-                    f"  Results: pass={triage_stats.passed:,}, "
-                    f"quarantine={triage_stats.quarantined:,}, "
-                    f"reject={triage_stats.rejected:,}"
-                )
+            # Show language stats
+            if triage_stats.non_english > 0:
+                print(f"\n  Non-English detected: {triage_stats.non_english:,} files")
+                sorted_langs = sorted(language_counts.items(), key=lambda x: -x[1])[:10]
+                for lang, count in sorted_langs:
+                    print(f"    {lang}: {count:,}")
+                if len(language_counts) > 10:
+                    print(f"    ... and {len(language_counts) - 10} more languages")
 
-                # Show language stats
-                if triage_stats.non_english > 0:
-                    print(f"\n  Non-English detected: {triage_stats.non_english:,} files")
-                    sorted_langs = sorted(language_counts.items(), key=lambda x: -x[1])[:10]
-                    for lang, count in sorted_langs:
-                        print(f"    {lang}: {count:,}")
-                    if len(language_counts) > 10:
-                        print(f"    ... and {len(language_counts) - 10} more languages")
-
-                # Write triage results to JSONL if requested
-                if triage_output:
-                    with open(triage_output, "w") as f:
-                        for record in stats.triage_results:
-                            f.write(json.dumps(record) + "\n")
-                    print(f"  Triage results written to: {triage_output}")
-
-            except ImportError:
-                print("  Skipped (Rust module not available)")
+            if triage_output:
+                print(f"  Triage results written to: {triage_output}")
 
         # Skip upfront size calculation - we'll track as we go
         print("(Size will be calculated during processing)")
@@ -641,96 +825,136 @@ def clean_batch(
             print(f"  Threads: {num_threads}")
         print(f"{'=' * 60}\n")
 
-        start_time = time.time()
+        # Monotonic clock so progress and ETA math can't jump with wall-clock changes
+        start_ns = time.monotonic_ns()
         bytes_processed = 0
-        last_update = start_time
+        last_update_ns = start_ns
         i = 0  # Track progress even if loop is empty or interrupted
-        boilerplate_log_file = None
 
-        # Open boilerplate audit log if path provided
+        # Open boilerplate audit log if path provided (written from a background thread)
         if boilerplate_log:
-            boilerplate_log_file = open(boilerplate_log, "w")
-
-        # Build file pairs list (needed for both parallel and sequential)
-        file_pairs = []
-        for input_path in files_to_process:
-            if output_dir:
-                relative = input_path.relative_to(input_dir)
-                output_path = output_dir / relative
-            else:
-                output_path = input_path  # in-place
-            file_pairs.append((str(input_path), str(output_path)))
+            boilerplate_log_file = JsonlWriter(boilerplate_log)
+
+        # Relative paths via string slicing - avoids building PurePath objects per file
+        in_prefix = os.path.join(str(input_dir), "")
+        out_prefix = os.path.join(str(output_dir), "") if output_dir else ""
+
+        def relative_to_input(path_str: str) -> str:
+            if path_str.startswith(in_prefix):
+                return path_str[len(in_prefix) :]
+            return str(Path(path_str).relative_to(input_dir))
+
+        # Stream (input, output) pairs lazily (needed for both parallel and sequential)
+        # so only the current batch of pairs is resident, not one tuple per file
+        resumed = 0
+
+        def iter_file_pairs():
+            nonlocal resumed
+            for input_path_str in files_to_process:
+                # With a state cache, only inputs unchanged since their last run are skipped
+                unchanged = state_cache is None or state_cache.is_unchanged(input_path_str)
+                if output_dir:
+                    output_path_str = out_prefix + relative_to_input(input_path_str)
+                    # Skip already-processed files (output exists) for resumability
+                    if unchanged and os.path.exists(output_path_str):
+                        resumed += 1
+                        continue
+                else:
+                    output_path_str = input_path_str  # in-place
+                    if state_cache is not None and unchanged:
+                        resumed += 1
+                        continue
+                yield input_path_str, output_path_str
 
-        # Filter out already-processed files (output exists) for resumability
-        if output_dir:
-            before_count = len(file_pairs)
-            file_pairs = [(inp, out) for inp, out in file_pairs if not Path(out).exists()]
-            skipped = before_count - len(file_pairs)
-            if skipped > 0:
-                print(f"  Resuming: skipping {skipped:,} already processed files")
+        file_pairs = iter_file_pairs()
 
         if parallel and not interrupted:
             # ===== PARALLEL PROCESSING WITH RAYON =====
-            total_to_process = len(file_pairs)
-            BATCH_SIZE = 1000  # Process in batches for progress reporting
+            # Batch size adapts toward ~1s of work per Rust call: large enough to
+            # keep every Rayon worker busy on tiny files, small enough to report
+            # progress promptly on huge ones.
+            TARGET_BATCH_SECONDS = 1.0
+            min_batch_size = num_threads * 8
+            max_batch_size = 100_000
+            batch_size = num_threads * 64
+            PROGRESS_INTERVAL_NS = 500_000_000  # Minimum time between progress lines
 
-            for batch_start in range(0, total_to_process, BATCH_SIZE):
-                if interrupted:
+            while not interrupted:
+                # Two flat path lists convert across the FFI boundary more cheaply
+                # than a list of (input, output) tuples
+                batch_inputs = []
+                batch_outputs = []
+                for input_path_str, output_path_str in islice(file_pairs, batch_size):
+                    batch_inputs.append(input_path_str)
+                    batch_outputs.append(output_path_str)
+                if not batch_inputs:
                     break
 
-                batch_end = min(batch_start + BATCH_SIZE, total_to_process)
-                batch = file_pairs[batch_start:batch_end]
-
                 # Process batch in parallel using Rust/Rayon
-                batch_stats = rust_ocr_clean.clean_batch_parallel(batch, num_threads)
+                batch_start_ns = time.monotonic_ns()
+                batch_stats = rust_ocr_clean.clean_batch_parallel(
+                    batch_inputs, batch_outputs, num_threads
+                )
+                now_ns = time.monotonic_ns()
+                batch_elapsed = (now_ns - batch_start_ns) / 1e9
+                if len(batch_inputs) == batch_size:
+                    batch_size = int(batch_size * TARGET_BATCH_SECONDS / max(batch_elapsed, 0.1))
+                    batch_size = max(min_batch_size, min(batch_size, max_batch_size))
 
                 # Aggregate stats
-                i = batch_end
+                i += len(batch_inputs)
+                total_to_process = len(files_to_process) - resumed
                 stats.files_modified += batch_stats.files_modified
                 stats.total_substitutions += batch_stats.total_substitutions
                 stats.long_s_fixes += batch_stats.long_s_fixes
                 stats.files_with_boilerplate += batch_stats.boilerplate_files
                 stats.total_boilerplate_chars += batch_stats.boilerplate_chars
+                stats.files_flagged += batch_stats.files_flagged
+                # Per-category totals arrive pre-aggregated per batch from Rust
+                stats.substitution_counts.update(batch_stats.substitutions_by_category)
                 bytes_processed += batch_stats.total_bytes
 
-                # Progress update
-                now = time.time()
-                elapsed = now - start_time
-                files_per_sec = i / elapsed if elapsed > 0 else 0
-                mb_per_sec = (bytes_processed / (1024 * 1024)) / elapsed if elapsed > 0 else 0
-                remaining = (total_to_process - i) / files_per_sec if files_per_sec > 0 else 0
+                # Failures aren't reported per file, so only fully clean batches are recorded
+                if state_cache is not None and batch_stats.files_failed == 0:
+                    state_cache.record(batch_inputs)
 
-                # Format remaining time
-                if remaining >= 3600:
-                    eta = f"{remaining / 3600:.1f}h"
-                elif remaining >= 60:
-                    eta = f"{remaining / 60:.1f}m"
-                else:
-                    eta = f"{remaining:.0f}s"
-
-                pct = (i / total_to_process) * 100 if total_to_process > 0 else 100
-                print(
-                    f"  [{pct:5.1f}%] {i:,}/{total_to_process:,} files | "
-                    f"{files_per_sec:.1f} files/s | {mb_per_sec:.1f} MB/s | "
-                    f"ETA: {eta} | subs: {stats.total_substitutions:,}"
-                )
+                # Progress update, throttled so fast batches don't stall on terminal writes
+                if now_ns - last_update_ns >= PROGRESS_INTERVAL_NS:
+                    print(
+                        format_progress(
+                            i,
+                            total_to_process,
+                            (now_ns - start_ns) / 1e9,
+                            bytes_processed,
+                            stats.total_substitutions,
+                        )
+                    )
+                    last_update_ns = now_ns
 
         else:
             # ===== SEQUENTIAL PROCESSING (for Ctrl+C support or when parallel=False) =====
+            state_pending = []  # Processed inputs not yet written to the state cache
             for i, (input_path_str, output_path_str) in enumerate(file_pairs, 1):
                 if interrupted:
                     break
 
-                input_path = Path(input_path_str)
-
                 try:
                     # Use Rust for all file I/O (pipeline: strip boilerplate -> OCR cleanup)
-                    was_modified, sub_count, file_bytes, categories, boilerplate_regions = (
-                        rust_clean_file(input_path_str, output_path_str)
-                    )
+                    (
+                        was_modified,
+                        sub_count,
+                        file_bytes,
+                        categories,
+                        boilerplate_regions,
+                        garbage_issues,
+                        _,
+                    ) = rust_ocr_clean.clean_file_to_file(input_path_str, output_path_str)
                     bytes_processed += file_bytes
                     # Aggregate category counts from Rust
                     stats.long_s_fixes += categories.get("long_s", 0)
+                    stats.substitution_counts.update(categories)
+                    if garbage_issues:
+                        stats.files_flagged += 1
 
                     if was_modified:
                         stats.files_modified += 1
@@ -745,9 +969,8 @@ def clean_batch(
 
                         # Write to boilerplate audit log if enabled
                         if boilerplate_log_file:
-                            relative = input_path.relative_to(input_dir)
                             log_entry = {
-                                "file": str(relative),
+                                "file": relative_to_input(input_path_str),
                                 "stripped": [
                                     {
                                         "category": cat,
@@ -758,39 +981,41 @@ def clean_batch(
                                     for cat, pattern, start_line, end_line, char_count in boilerplate_regions
                                 ],
                             }
-                            boilerplate_log_file.write(json.dumps(log_entry) + "\n")
+                            boilerplate_log_file.write(log_entry)
+
+                    if state_cache is not None:
+                        state_pending.append(input_path_str)
+                        if len(state_pending) >= 1000:
+                            state_cache.record(state_pending)
+                            state_pending = []
 
                 except Exception as e:
-                    print(f"\n  Error processing {input_path}: {e}", file=sys.stderr)
+                    print(f"\n  Error processing {input_path_str}: {e}", file=sys.stderr)
                     continue
 
                 # Progress update every 2 seconds or every 500 files
-                now = time.time()
-                total_to_process = len(file_pairs)
-                if now - last_update >= 2.0 or i % 500 == 0:
-                    elapsed = now - start_time
-                    files_per_sec = i / elapsed if elapsed > 0 else 0
-                    mb_per_sec = (bytes_processed / (1024 * 1024)) / elapsed if elapsed > 0 else 0
-                    remaining = (total_to_process - i) / files_per_sec if files_per_sec > 0 else 0
-
-                    # Format remaining time
-                    if remaining >= 3600:
-                        eta = f"{remaining / 3600:.1f}h"
-                    elif remaining >= 60:
-                        eta = f"{remaining / 60:.1f}m"
-                    else:
-                        eta = f"{remaining:.0f}s"
-
-                    pct = (i / total_to_process) * 100 if total_to_process > 0 else 100
+                now_ns = time.monotonic_ns()
+                total_to_process = len(files_to_process) - resumed
+                if now_ns - last_update_ns >= 2_000_000_000 or i % 500 == 0:
                     print(
-                        f"  [{pct:5.1f}%] {i:,}/{total_to_process:,} files | "
-                        f"{files_per_sec:.1f} files/s | {mb_per_sec:.1f} MB/s | "
-                        f"ETA: {eta} | subs: {stats.total_substitutions:,}"
+                        format_progress(
+                            i,
+                            total_to_process,
+                            (now_ns - start_ns) / 1e9,
+                            bytes_processed,
+                            stats.total_substitutions,
+                        )
                     )
-                    last_update = now
+                    last_update_ns = now_ns
+
+            if state_cache is not None and state_pending:
+                state_cache.record(state_pending)
+
+        if resumed > 0:
+            print(f"  Resumed: skipped {resumed:,} already processed files")
 
         # Final stats
-        elapsed = time.time() - start_time
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
         stats.elapsed_seconds = elapsed  # Store for final report
         total_to_process = len(files_to_process)
         files_per_sec = total_to_process / elapsed if elapsed > 0 else 0
@@ -821,13 +1046,16 @@ def clean_batch(
             )
         print(f"{'=' * 60}")
 
-        # Close boilerplate log file
-        if boilerplate_log_file:
-            boilerplate_log_file.close()
-
     finally:
         # Restore original signal handler
         signal.signal(signal.SIGINT, old_handler)
+        if state_cache is not None:
+            state_cache.close()
+        # close() flushes the queue and re-raises any error hit while writing
+        if triage_writer is not None:
+            triage_writer.close()
+        if boilerplate_log_file is not None:
+            boilerplate_log_file.close()
 
     return stats
 
@@ -838,39 +1066,16 @@ def analyze_corpus(corpus_dir: Path, sample_size: int = 1000) -> dict:
 
     Returns analysis report.
     """
-    files = list(corpus_dir.glob("**/*.txt"))
-    if len(files) > sample_size:
-        import random
-
-        files = random.sample(files, sample_size)
-
-    error_counts = Counter()
-    garbage_files = []
-    total_words = 0
-
-    print(f"Analyzing {len(files)} files...")
-
-    for filepath in files:
-        try:
-            with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-        except Exception:
-            continue
-
-        words = content.split()
-        total_words += len(words)
+    print(f"Analyzing up to {sample_size:,} files...")
 
-        # Use Rust to count potential errors by category
-        result = rust_ocr_clean.clean_text_with_categories(content)
-        for category, count in result.substitutions_by_category.items():
-            error_counts[category] += count
-
-        garbage = check_garbage(content)
-        if garbage:
-            garbage_files.append(str(filepath))
+    # Rust samples files during a single directory walk and analyzes them in parallel
+    analysis = rust_ocr_clean.analyze_corpus(str(corpus_dir), "*.txt", sample_size)
+    error_counts = Counter(analysis.error_counts)
+    total_words = analysis.total_words
+    garbage_files = analysis.garbage_files
 
     return {
-        "files_analyzed": len(files),
+        "files_analyzed": analysis.files_analyzed,
         "total_words": total_words,
         "potential_errors": error_counts.most_common(50),
         "garbage_files": garbage_files[:50],
@@ -945,8 +1150,12 @@ Examples:
     batch_parser.add_argument(
         "--threads",
         type=int,
-        default=24,
-        help="Thread count for parallel processing (default: 24)",
+        help="Thread count for parallel processing (default: all CPU cores)",
+    )
+    batch_parser.add_argument(
+        "--state-db",
+        type=Path,
+        help="SQLite file tracking input mtime/size; skips files unchanged since their last run",
     )
 
     # Strip boilerplate only (standalone command)
@@ -978,13 +1187,23 @@ Examples:
         "--batch-size", type=int, default=10000, help="Files per batch (default: 10000)"
     )
     triage_db_parser.add_argument(
-        "--threads", type=int, default=24, help="Thread count (default: 24)"
+        "--threads", type=int, help="Thread count (default: all CPU cores)"
     )
 
     args = parser.parse_args()
 
     if args.command == "clean":
-        was_modified, sub_count, garbage, was_skipped = clean_file(args.input, args.output)
+        if args.output:
+            was_modified, sub_count, garbage, was_skipped = clean_file(args.input, args.output)
+        else:
+            # stdout mode: read and clean once, then print the cleaned text
+            try:
+                with open(args.input, "r", encoding="utf-8", errors="replace") as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error processing {args.input}: {e}", file=sys.stderr)
+                sys.exit(1)
+            cleaned, sub_count, garbage, was_skipped = clean_content(content, args.input)
 
         if was_skipped:
             print(f"Skipped {args.input} - detected as non-English")
@@ -994,14 +1213,9 @@ Examples:
             if garbage:
                 print(f"  Warning: {len(garbage)} garbage patterns detected")
         else:
-            with open(args.input, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-            result = rust_ocr_clean.clean_text_with_categories(content)
-            print(result.text)
+            print(cleaned)
 
     elif args.command == "batch":
-        from datetime import datetime
-
         run_start = datetime.now()
 
         # Determine report paths (default to parent of output dir)
@@ -1038,8 +1252,6 @@ Examples:
         input_files = None
         skip_triage = args.skip_triage
         if args.from_db:
-            import sqlite3
-
             db_path = Path(args.from_db).resolve()
             if not db_path.exists():
                 print(f"Error: Database not found: {db_path}", file=sys.stderr)
@@ -1077,6 +1289,7 @@ Examples:
             boilerplate_log=boilerplate_path,
             num_threads=args.threads,
             input_files=input_files,
+            state_db=args.state_db,
         )
 
         run_end = datetime.now()
@@ -1116,9 +1329,11 @@ Examples:
         if stats.files_flagged > 0:
             print(f"    Flagged (post-OCR garbage): {stats.files_flagged:,}")
 
-        if stats.substitution_counts:
+        # Ranked once for both the summary and the report
+        top_substitutions = stats.substitution_counts.most_common(TOP_SUBSTITUTIONS)
+        if top_substitutions:
             print("\n  Top substitutions:")
-            for pattern, count in stats.substitution_counts.most_common(10):
+            for pattern, count in top_substitutions[:10]:
                 print(f"    {pattern}: {count:,}")
 
         # Write reports with metadata
@@ -1137,10 +1352,9 @@ Examples:
                     "pattern": args.pattern,
                     "skip_triage": args.skip_triage,
                 },
-                "stats": stats.to_dict(),
+                "stats": stats.to_dict(top_substitutions),
             }
-            with open(report_path, "w") as f:
-                json.dump(report_data, f, indent=2)
+            write_json_report(report_path, report_data)
             print(f"    Stats report: {report_path}")
 
         if triage_path and triage_path.exists():
@@ -1154,9 +1368,6 @@ Examples:
         print(f"{'=' * 60}")
 
     elif args.command == "strip-boilerplate":
-        import fnmatch
-        import os
-
         input_path = args.input
         output_path = args.output
         log_path = args.log
@@ -1193,8 +1404,8 @@ Examples:
                         for r in result.stripped_regions
                     ],
                 }
-                with open(log_path, "w") as f:
-                    f.write(json.dumps(log_entry) + "\n")
+                with open(log_path, "wb") as f:
+                    f.write(jsonl_line(log_entry))
                 print(f"Audit log written to: {log_path}")
 
         elif input_path.is_dir():
@@ -1205,12 +1416,9 @@ Examples:
 
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # Find files
-            files = []
-            for root, dirs, filenames in os.walk(input_path):
-                for filename in filenames:
-                    if fnmatch.fnmatch(filename, args.pattern):
-                        files.append(Path(root) / filename)
+            # Find files with the parallel Rust directory walk (no per-entry stat)
+            files = rust_ocr_clean.find_files(str(input_path), args.pattern)
+            input_prefix_len = len(os.path.join(str(input_path), ""))
 
             print(f"Processing {len(files)} files...")
 
@@ -1219,15 +1427,15 @@ Examples:
             log_file = None
 
             if log_path:
-                log_file = open(log_path, "w")
+                log_file = open(log_path, "wb", buffering=JSONL_BUFFER_SIZE)
 
             try:
                 for i, file_path in enumerate(files, 1):
-                    relative = file_path.relative_to(input_path)
+                    relative = file_path[input_prefix_len:]
                     out_file = output_path / relative
                     out_file.parent.mkdir(parents=True, exist_ok=True)
 
-                    result = rust_ocr_clean.strip_boilerplate_file(str(file_path), str(out_file))
+                    result = rust_ocr_clean.strip_boilerplate_file(file_path, str(out_file))
 
                     if result.stripped_regions:
                         files_with_boilerplate += 1
@@ -1235,7 +1443,7 @@ Examples:
 
                         if log_file:
                             log_entry = {
-                                "file": str(relative),
+                                "file": relative,
                                 "stripped": [
                                     {
                                         "category": r.category,
@@ -1246,7 +1454,7 @@ Examples:
                                     for r in result.stripped_regions
                                 ],
                             }
-                            log_file.write(json.dumps(log_entry) + "\n")
+                            log_file.write(jsonl_line(log_entry))
 
                     if i % 500 == 0:
                         print(f"  Processed {i}/{len(files)} files...")
@@ -1267,15 +1475,10 @@ Examples:
             sys.exit(1)
 
     elif args.command == "triage-db":
-        import signal
-        import sqlite3
-        import time
-        from datetime import datetime
-
         db_path = Path(args.db).resolve()
         raw_dir = Path(args.raw_dir).resolve()
         batch_size = args.batch_size
-        num_threads = args.threads
+        num_threads = args.threads or os.cpu_count() or 1
 
         if not db_path.exists():
             print(f"Error: Database not found: {db_path}", file=sys.stderr)
@@ -1462,8 +1665,7 @@ Examples:
                 print(f"  {pattern}: {count}")
 
         if args.report:
-            with open(args.report, "w") as f:
-                json.dump(report, f, indent=2)
+            write_json_report(args.report, report)
             print(f"\nReport saved to {args.report}")
 
 
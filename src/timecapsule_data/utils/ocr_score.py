@@ -20,18 +20,462 @@ Usage:
 """
 
 import argparse
-import json
+import heapq
+import os
+import random
 import re
+import shutil
 import sys
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
+from functools import lru_cache
+from itertools import count, islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from .ocr_cleanup import jsonl_line, write_json_report
 
 # =============================================================================
 # Dictionary Management
 # =============================================================================
 
+# Most common English words
+COMMON_WORDS: frozenset[str] = frozenset(
+    (
+        "the",
+        "be",
+        "to",
+        "of",
+        "and",
+        "a",
+        "in",
+        "that",
+        "have",
+        "i",
+        "it",
+        "for",
+        "not",
+        "on",
+        "with",
+        "he",
+        "as",
+        "you",
+        "do",
+        "at",
+        "this",
+        "but",
+        "his",
+        "by",
+        "from",
+        "they",
+        "we",
+        "say",
+        "her",
+        "she",
+        "or",
+        "an",
+        "will",
+        "my",
+        "one",
+        "all",
+        "would",
+        "there",
+        "their",
+        "what",
+        "so",
+        "up",
+        "out",
+        "if",
+        "about",
+        "who",
+        "get",
+        "which",
+        "go",
+        "me",
+        "when",
+        "make",
+        "can",
+        "like",
+        "time",
+        "no",
+        "just",
+        "him",
+        "know",
+        "take",
+        "people",
+        "into",
+        "year",
+        "your",
+        "good",
+        "some",
+        "could",
+        "them",
+        "see",
+        "other",
+        "than",
+        "then",
+        "now",
+        "look",
+        "only",
+        "come",
+        "its",
+        "over",
+        "think",
+        "also",
+        "back",
+        "after",
+        "use",
+        "two",
+        "how",
+        "our",
+        "work",
+        "first",
+        "well",
+        "way",
+        "even",
+        "new",
+        "want",
+        "because",
+        "any",
+        "these",
+        "give",
+        "day",
+        "most",
+        "us",
+        "very",
+        "has",
+        "had",
+        "was",
+        "were",
+        "been",
+        "being",
+        "is",
+        "are",
+        "am",
+    )
+)
+
+
+# Common inflected forms that NLTK misses
+COMMON_INFLECTIONS: frozenset[str] = frozenset(
+    (
+        # Plurals
+        "years",
+        "days",
+        "times",
+        "ways",
+        "things",
+        "men",
+        "women",
+        "children",
+        "people",
+        "words",
+        "students",
+        "members",
+        "others",
+        "hands",
+        "eyes",
+        "friends",
+        "books",
+        "letters",
+        "pages",
+        "lines",
+        "places",
+        "states",
+        "parts",
+        "points",
+        "facts",
+        "cases",
+        "questions",
+        "matters",
+        "rights",
+        # Past tense
+        "said",
+        "made",
+        "found",
+        "gave",
+        "told",
+        "asked",
+        "used",
+        "tried",
+        "called",
+        "seemed",
+        "left",
+        "felt",
+        "became",
+        "got",
+        "kept",
+        "let",
+        "began",
+        "brought",
+        "heard",
+        "played",
+        "moved",
+        "lived",
+        "believed",
+        "held",
+        "stood",
+        "showed",
+        "followed",
+        "turned",
+        "reached",
+        "issued",
+        # Present tense third person
+        "says",
+        "makes",
+        "finds",
+        "gives",
+        "tells",
+        "asks",
+        "uses",
+        "tries",
+        "calls",
+        "seems",
+        "feels",
+        "becomes",
+        "gets",
+        "keeps",
+        "lets",
+        "begins",
+        "brings",
+        "shows",
+        "follows",
+        "turns",
+        "means",
+        "needs",
+        "wants",
+        # -ing forms
+        "being",
+        "having",
+        "doing",
+        "going",
+        "coming",
+        "making",
+        "taking",
+        "getting",
+        "saying",
+        "looking",
+        "thinking",
+        "working",
+        "trying",
+        "using",
+        "finding",
+        "giving",
+        "telling",
+        "asking",
+        "leaving",
+        # Contractions
+        "don't",
+        "won't",
+        "can't",
+        "didn't",
+        "wouldn't",
+        "couldn't",
+        "shouldn't",
+        "isn't",
+        "aren't",
+        "wasn't",
+        "weren't",
+        "hasn't",
+        "haven't",
+        "hadn't",
+        "i'm",
+        "you're",
+        "we're",
+        "they're",
+        "he's",
+        "she's",
+        "it's",
+        "that's",
+        "i've",
+        "you've",
+        "we've",
+        "they've",
+        "i'd",
+        "you'd",
+        "we'd",
+        "they'd",
+        "i'll",
+        "you'll",
+        "we'll",
+        "they'll",
+        "he'll",
+        "she'll",
+    )
+)
+
+
+# Vocabulary common in historical texts but rare today
+HISTORICAL_VOCABULARY: frozenset[str] = frozenset(
+    (
+        # Archaic pronouns/words
+        "thee",
+        "thou",
+        "thy",
+        "thine",
+        "ye",
+        "hath",
+        "doth",
+        "dost",
+        "hast",
+        "wherefore",
+        "whence",
+        "thence",
+        "hence",
+        "whilst",
+        "amongst",
+        "towards",
+        "betwixt",
+        "forsooth",
+        "perchance",
+        "mayhap",
+        "methinks",
+        "prithee",
+        # British spellings
+        "parlour",
+        "honour",
+        "favour",
+        "colour",
+        "labour",
+        "behaviour",
+        "neighbour",
+        "centre",
+        "theatre",
+        "fibre",
+        "metre",
+        "litre",
+        "calibre",
+        "lustre",
+        "connexion",
+        "reflexion",
+        "inflexion",
+        "despatch",
+        "gaol",
+        "kerb",
+        "tyre",
+        "plough",
+        "cheque",
+        "storey",
+        "waggon",
+        "grey",
+        "judgement",
+        "acknowledgement",
+        # Period-specific technology/terms
+        "telegraph",
+        "railway",
+        "steamship",
+        "gaslight",
+        "omnibus",
+        "typewriter",
+        "phonograph",
+        "daguerreotype",
+        # Titles and forms of address
+        "esq",
+        "messrs",
+        "mesdames",
+        "reverend",
+        "honourable",
+        "excellency",
+        "dr",
+        "mr",
+        "mrs",
+        "ms",
+        "prof",
+        "rev",
+        "hon",
+        "jr",
+        "sr",
+    )
+)
+
+
+# Common proper nouns that appear frequently
+COMMON_NAMES: frozenset[str] = frozenset(
+    (
+        # Countries/places
+        "england",
+        "britain",
+        "america",
+        "france",
+        "germany",
+        "russia",
+        "london",
+        "paris",
+        "berlin",
+        "rome",
+        "vienna",
+        "washington",
+        "europe",
+        "asia",
+        "africa",
+        "atlantic",
+        "pacific",
+        "philadelphia",
+        "boston",
+        "chicago",
+        "york",
+        # Common given names
+        "john",
+        "james",
+        "william",
+        "henry",
+        "george",
+        "charles",
+        "thomas",
+        "mary",
+        "elizabeth",
+        "ann",
+        "sarah",
+        "jane",
+        "margaret",
+        "alice",
+        # Months, days
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "sept",
+        "oct",
+        "nov",
+        "dec",
+    )
+)
+
+# Each dictionary load gets a new version so cached lookups never outlive it
+_DICTIONARY_VERSIONS = count()
+
+
+@lru_cache(maxsize=65536)
+def _is_known_word_cached(word: str, dict_version: int) -> bool:
+    """Rust multi-language dictionary lookup, cached per dictionary version."""
+    import rust_ocr_clean  # type: ignore[import-not-found]
+
+    return rust_ocr_clean.is_known_word(word)
+
 
 class Dictionary:
     """
@@ -55,448 +499,34 @@ class Dictionary:
         if dict_dir.exists():
             rust_ocr_clean.init_dictionaries(str(dict_dir))
             self._rust_dict_loaded = rust_ocr_clean.dictionaries_loaded()
+        self._version = next(_DICTIONARY_VERSIONS)
 
         # Still load supplementary word sets for historical/domain terms
-        self._add_common_words()
-        self._add_common_inflections()
-        self._add_historical_vocabulary()
-        self._add_common_names()
-
-    def _add_common_words(self):
-        """Add most common English words."""
-        common = {
-            "the",
-            "be",
-            "to",
-            "of",
-            "and",
-            "a",
-            "in",
-            "that",
-            "have",
-            "i",
-            "it",
-            "for",
-            "not",
-            "on",
-            "with",
-            "he",
-            "as",
-            "you",
-            "do",
-            "at",
-            "this",
-            "but",
-            "his",
-            "by",
-            "from",
-            "they",
-            "we",
-            "say",
-            "her",
-            "she",
-            "or",
-            "an",
-            "will",
-            "my",
-            "one",
-            "all",
-            "would",
-            "there",
-            "their",
-            "what",
-            "so",
-            "up",
-            "out",
-            "if",
-            "about",
-            "who",
-            "get",
-            "which",
-            "go",
-            "me",
-            "when",
-            "make",
-            "can",
-            "like",
-            "time",
-            "no",
-            "just",
-            "him",
-            "know",
-            "take",
-            "people",
-            "into",
-            "year",
-            "your",
-            "good",
-            "some",
-            "could",
-            "them",
-            "see",
-            "other",
-            "than",
-            "then",
-            "now",
-            "look",
-            "only",
-            "come",
-            "its",
-            "over",
-            "think",
-            "also",
-            "back",
-            "after",
-            "use",
-            "two",
-            "how",
-            "our",
-            "work",
-            "first",
-            "well",
-            "way",
-            "even",
-            "new",
-            "want",
-            "because",
-            "any",
-            "these",
-            "give",
-            "day",
-            "most",
-            "us",
-            "very",
-            "has",
-            "had",
-            "was",
-            "were",
-            "been",
-            "being",
-            "is",
-            "are",
-            "am",
-        }
-        self.words.update(common)
-
-    def _add_common_inflections(self):
-        """Add common inflected forms that NLTK misses."""
-        inflections = {
-            # Plurals
-            "years",
-            "days",
-            "times",
-            "ways",
-            "things",
-            "men",
-            "women",
-            "children",
-            "people",
-            "words",
-            "students",
-            "members",
-            "others",
-            "hands",
-            "eyes",
-            "friends",
-            "books",
-            "letters",
-            "pages",
-            "lines",
-            "places",
-            "states",
-            "parts",
-            "points",
-            "facts",
-            "cases",
-            "questions",
-            "matters",
-            "rights",
-            # Past tense
-            "said",
-            "made",
-            "found",
-            "gave",
-            "told",
-            "asked",
-            "used",
-            "tried",
-            "called",
-            "seemed",
-            "left",
-            "felt",
-            "became",
-            "got",
-            "kept",
-            "let",
-            "began",
-            "brought",
-            "heard",
-            "played",
-            "moved",
-            "lived",
-            "believed",
-            "held",
-            "stood",
-            "showed",
-            "followed",
-            "turned",
-            "reached",
-            "issued",
-            # Present tense third person
-            "says",
-            "makes",
-            "finds",
-            "gives",
-            "tells",
-            "asks",
-            "uses",
-            "tries",
-            "calls",
-            "seems",
-            "feels",
-            "becomes",
-            "gets",
-            "keeps",
-            "lets",
-            "begins",
-            "brings",
-            "shows",
-            "follows",
-            "turns",
-            "means",
-            "needs",
-            "wants",
-            # -ing forms
-            "being",
-            "having",
-            "doing",
-            "going",
-            "coming",
-            "making",
-            "taking",
-            "getting",
-            "saying",
-            "looking",
-            "thinking",
-            "working",
-            "trying",
-            "using",
-            "finding",
-            "giving",
-            "telling",
-            "asking",
-            "leaving",
-            # Contractions
-            "don't",
-            "won't",
-            "can't",
-            "didn't",
-            "wouldn't",
-            "couldn't",
-            "shouldn't",
-            "isn't",
-            "aren't",
-            "wasn't",
-            "weren't",
-            "hasn't",
-            "haven't",
-            "hadn't",
-            "i'm",
-            "you're",
-            "we're",
-            "they're",
-            "he's",
-            "she's",
-            "it's",
-            "that's",
-            "i've",
-            "you've",
-            "we've",
-            "they've",
-            "i'd",
-            "you'd",
-            "we'd",
-            "they'd",
-            "i'll",
-            "you'll",
-            "we'll",
-            "they'll",
-            "he'll",
-            "she'll",
-        }
-        self.words.update(inflections)
-
-    def _add_historical_vocabulary(self):
-        """Add vocabulary common in historical texts but rare today."""
-        historical = {
-            # Archaic pronouns/words
-            "thee",
-            "thou",
-            "thy",
-            "thine",
-            "ye",
-            "hath",
-            "doth",
-            "dost",
-            "hast",
-            "wherefore",
-            "whence",
-            "thence",
-            "hence",
-            "whilst",
-            "amongst",
-            "towards",
-            "betwixt",
-            "forsooth",
-            "perchance",
-            "mayhap",
-            "methinks",
-            "prithee",
-            # British spellings
-            "parlour",
-            "honour",
-            "favour",
-            "colour",
-            "labour",
-            "behaviour",
-            "neighbour",
-            "centre",
-            "theatre",
-            "fibre",
-            "metre",
-            "litre",
-            "calibre",
-            "lustre",
-            "connexion",
-            "reflexion",
-            "inflexion",
-            "despatch",
-            "gaol",
-            "kerb",
-            "tyre",
-            "plough",
-            "cheque",
-            "storey",
-            "waggon",
-            "grey",
-            "judgement",
-            "acknowledgement",
-            # Period-specific technology/terms
-            "telegraph",
-            "railway",
-            "steamship",
-            "gaslight",
-            "omnibus",
-            "typewriter",
-            "phonograph",
-            "daguerreotype",
-            # Titles and forms of address
-            "esq",
-            "messrs",
-            "mesdames",
-            "reverend",
-            "honourable",
-            "excellency",
-            "dr",
-            "mr",
-            "mrs",
-            "ms",
-            "prof",
-            "rev",
-            "hon",
-            "jr",
-            "sr",
-        }
-        self.words.update(historical)
-
-    def _add_common_names(self):
-        """Add common proper nouns that appear frequently."""
-        names = {
-            # Countries/places
-            "england",
-            "britain",
-            "america",
-            "france",
-            "germany",
-            "russia",
-            "london",
-            "paris",
-            "berlin",
-            "rome",
-            "vienna",
-            "washington",
-            "europe",
-            "asia",
-            "africa",
-            "atlantic",
-            "pacific",
-            "philadelphia",
-            "boston",
-            "chicago",
-            "york",
-            # Common given names
-            "john",
-            "james",
-            "william",
-            "henry",
-            "george",
-            "charles",
-            "thomas",
-            "mary",
-            "elizabeth",
-            "ann",
-            "sarah",
-            "jane",
-            "margaret",
-            "alice",
-            # Months, days
-            "january",
-            "february",
-            "march",
-            "april",
-            "may",
-            "june",
-            "july",
-            "august",
-            "september",
-            "october",
-            "november",
-            "december",
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-            "jan",
-            "feb",
-            "mar",
-            "apr",
-            "jun",
-            "jul",
-            "aug",
-            "sep",
-            "sept",
-            "oct",
-            "nov",
-            "dec",
-        }
-        self.words.update(names)
+        self.words.update(COMMON_WORDS, COMMON_INFLECTIONS, HISTORICAL_VOCABULARY, COMMON_NAMES)
+
+        # The Rust batch scorer checks the same supplementary words
+        rust_ocr_clean.init_score_words(list(self.words))
+
+    def add_words(self, words):
+        """Add lowercase known words and sync them to the Rust batch scorer."""
+        import rust_ocr_clean  # type: ignore[import-not-found]
+
+        self.words.update(words)
+        rust_ocr_clean.init_score_words(list(self.words))
 
     def add_corpus_vocabulary(self, vocab_file: Path):
         """Add vocabulary extracted from a corpus."""
         if vocab_file.exists():
+            words = []
             with open(vocab_file) as f:
                 for line in f:
                     word = line.strip().lower()
                     if word and len(word) > 1:
-                        self.words.add(word)
+                        words.append(word)
+            self.add_words(words)
 
     def is_word(self, word: str) -> bool:
         """Check if a word is in the dictionary."""
-        import rust_ocr_clean  # type: ignore[import-not-found]
-
         word_lower = word.lower()
 
         # Fast check against known word set first
@@ -505,10 +535,36 @@ class Dictionary:
 
         # Use Rust dictionaries for comprehensive check (en, de, fr, la)
         if self._rust_dict_loaded:
-            return rust_ocr_clean.is_known_word(word)
+            return _is_known_word_cached(word, self._version)
 
         return False
 
+    def score_words(self, words: list[str]) -> tuple[int, int, list[str], str]:
+        """Classify words in one Rust call.
+
+        Number-like words are skipped; the rest count as garbage (is_garbage) or
+        unknown (not is_word). Returns (unknown_count, garbage_count, the 20 most
+        common unknown words, dominant language code).
+        """
+        import rust_ocr_clean  # type: ignore[import-not-found]
+
+        return rust_ocr_clean.score_words(words)
+
+    def score_text_words(self, text: str) -> tuple[int, int, int, list[str], str]:
+        """Like score_words, with word extraction (extract_words) done in Rust too.
+
+        Returns (total_words, unknown_count, garbage_count, sample, language).
+        """
+        import rust_ocr_clean  # type: ignore[import-not-found]
+
+        return rust_ocr_clean.score_text_words(text)
+
+    def score_file_words(self, file_path: Path) -> tuple[int, int, int, list[str], str]:
+        """Like score_text_words, reading the file in Rust without decoding it."""
+        import rust_ocr_clean  # type: ignore[import-not-found]
+
+        return rust_ocr_clean.score_file_words(str(file_path))
+
     def __contains__(self, word: str) -> bool:
         return self.is_word(word)
 
@@ -518,20 +574,43 @@ class Dictionary:
         return len(self.words)
 
 
+@lru_cache(maxsize=1)
+def get_dictionary() -> Dictionary:
+    """Return this process's shared Dictionary, building it on first use."""
+    return Dictionary()
+
+
 # =============================================================================
 # Text Analysis
 # =============================================================================
 
-# Regex for extracting words (letters only, handles contractions)
+# Regex for extracting words (letters only, handles contractions); mirrored by
+# extract_score_words in the Rust extension, which does the extraction when scoring
 WORD_PATTERN = re.compile(r"[a-zA-Z]+(?:'[a-zA-Z]+)?")
 
-# Patterns that indicate OCR garbage (not fixable words)
-GARBAGE_PATTERNS = [
-    re.compile(r"[bcdfghjklmnpqrstvwxz]{5,}", re.I),  # Long consonant runs
-    re.compile(r"[aeiou]{4,}", re.I),  # Long vowel runs
-    re.compile(r"(.)\1{3,}"),  # 4+ repeated characters
-    re.compile(r"[^a-zA-Z\s]{3,}"),  # 3+ consecutive symbols
-]
+# Number-like words, skipped when scoring: roman numerals | ordinals
+# (mirrored by is_number_like_word in the Rust extension)
+NUMBER_LIKE_RE = re.compile(r"[ivxlcdm]+|\d+(?:st|nd|rd|th)", re.I)
+
+# Common number-like words (lowercase), checked before NUMBER_LIKE_RE:
+# roman numerals i-xx and ordinals 1st-100th
+NUMBER_LIKE_FAST: frozenset[str] = frozenset(
+    "i ii iii iv v vi vii viii ix x xi xii xiii xiv xv xvi xvii xviii xix xx".split()
+    + [
+        f"{n}{'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')}"
+        for n in range(1, 101)
+    ]
+)
+
+# Patterns that indicate OCR garbage (not fixable words), as one alternation so a
+# single regex scan decides: long consonant runs | long vowel runs |
+# 4+ repeated characters | 3+ consecutive symbols
+GARBAGE_RE = re.compile(
+    r"(?i:[bcdfghjklmnpqrstvwxz]{5,})"
+    r"|(?i:[aeiou]{4,})"
+    r"|(.)\1{3,}"
+    r"|[^a-zA-Z\s]{3,}"
+)
 
 
 def extract_words(text: str) -> list[str]:
@@ -543,21 +622,15 @@ def extract_words(text: str) -> list[str]:
 
 def is_garbage(word: str) -> bool:
     """Check if a word matches garbage patterns (unfixable OCR noise)."""
-    for pattern in GARBAGE_PATTERNS:
-        if pattern.search(word):
-            return True
-    return False
+    # Every pattern needs at least 3 characters
+    if len(word) < 3:
+        return False
+    return GARBAGE_RE.search(word) is not None
 
 
 def is_number_like(word: str) -> bool:
     """Check if word is a number or number-like (dates, roman numerals)."""
-    # Roman numerals
-    if re.match(r"^[ivxlcdm]+$", word, re.I):
-        return True
-    # Ordinals
-    if re.match(r"^\d+(st|nd|rd|th)$", word, re.I):
-        return True
-    return False
+    return word.lower() in NUMBER_LIKE_FAST or NUMBER_LIKE_RE.fullmatch(word) is not None
 
 
 @dataclass
@@ -573,20 +646,21 @@ class ScoreResult:
     combined_score: float  # weighted combination
     quality_tier: str  # 'good', 'moderate', 'poor', 'garbage'
     sample_unknown: list[str]  # Sample of unknown words for debugging
+    dominant_language: str = "unknown"  # dictionary language, e.g. 'en'
 
     def to_dict(self) -> dict:
         return asdict(self)
 
 
-def score_text(text: str, dictionary: Dictionary, file_path: str = "") -> ScoreResult:
-    """
-    Score text for OCR quality.
-
-    Returns a ScoreResult with error rates and quality tier.
-    """
-    words = extract_words(text)
-    total = len(words)
-
+def _score_result(
+    file_path: str,
+    total: int,
+    unknown_count: int,
+    garbage_count: int,
+    sample_unknown: list[str],
+    dominant_language: str = "unknown",
+) -> ScoreResult:
+    """Build a ScoreResult from word counts."""
     if total == 0:
         return ScoreResult(
             file_path=file_path,
@@ -600,26 +674,6 @@ def score_text(text: str, dictionary: Dictionary, file_path: str = "") -> ScoreR
             sample_unknown=[],
         )
 
-    unknown = []
-    garbage = []
-
-    for word in words:
-        # Skip numbers and number-like tokens
-        if is_number_like(word):
-            continue
-
-        # Check for garbage patterns
-        if is_garbage(word):
-            garbage.append(word)
-            continue
-
-        # Check dictionary
-        if not dictionary.is_word(word):
-            unknown.append(word)
-
-    unknown_count = len(unknown)
-    garbage_count = len(garbage)
-
     error_rate = unknown_count / total
     garbage_rate = garbage_count / total
 
@@ -637,10 +691,6 @@ def score_text(text: str, dictionary: Dictionary, file_path: str = "") -> ScoreR
     else:
         tier = "garbage"
 
-    # Get sample of unknown words (most common)
-    unknown_counter = Counter(unknown)
-    sample_unknown = [w for w, _ in unknown_counter.most_common(20)]
-
     return ScoreResult(
         file_path=file_path,
         total_words=total,
@@ -651,14 +701,25 @@ def score_text(text: str, dictionary: Dictionary, file_path: str = "") -> ScoreR
         combined_score=round(combined_score, 4),
         quality_tier=tier,
         sample_unknown=sample_unknown,
+        dominant_language=dominant_language,
     )
 
 
+def score_text(text: str, dictionary: Dictionary, file_path: str = "") -> ScoreResult:
+    """
+    Score text for OCR quality.
+
+    Returns a ScoreResult with error rates and quality tier.
+    """
+    # Word extraction, number-like skipping, garbage patterns, dictionary lookups and
+    # the dominant-language tally run in one Rust call
+    return _score_result(file_path, *dictionary.score_text_words(text))
+
+
 def score_file(file_path: Path, dictionary: Dictionary) -> ScoreResult:
-    """Score a single file."""
+    """Score a single file (read and tokenized in Rust, never decoded whole)."""
     try:
-        text = file_path.read_text(encoding="utf-8", errors="replace")
-        return score_text(text, dictionary, str(file_path))
+        return _score_result(str(file_path), *dictionary.score_file_words(file_path))
     except Exception as e:
         return ScoreResult(
             file_path=str(file_path),
@@ -678,48 +739,159 @@ def score_file(file_path: Path, dictionary: Dictionary) -> ScoreResult:
 # =============================================================================
 
 
-def analyze_corpus(corpus_dir: Path, dictionary: Dictionary, limit: Optional[int] = None) -> dict:
+def _init_worker(extra_words: set[str]):
+    """Set up the worker's dictionary, including any words added in the parent.
+
+    Forked workers inherit the parent's get_dictionary() instance, so this only
+    builds one under spawn.
     """
-    Analyze all files in a corpus directory.
+    dictionary = get_dictionary()
+    if not dictionary.words.issuperset(extra_words):
+        dictionary.add_words(extra_words)
+
+
+def _score_chunk_worker(path_strs: list[str]) -> list[ScoreResult]:
+    """Score a chunk of files in a pool worker."""
+    dictionary = get_dictionary()
+    return [score_file(Path(path_str), dictionary) for path_str in path_strs]
 
-    Returns statistics and per-file scores.
+
+# Files per pool task
+SCORE_CHUNK_SIZE = 64
+
+
+def iter_text_files(root: str) -> Iterator[str]:
+    """Lazily yield paths of .txt files under root (os.scandir, no Path objects)."""
+    try:
+        with os.scandir(root) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".txt") and entry.is_file():
+                    yield entry.path
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from iter_text_files(subdir)
+
+
+def _score_in_pool(
+    executor: ProcessPoolExecutor, paths: Iterator[str], max_pending: int
+) -> Iterator[ScoreResult]:
+    """Score paths in chunks on the pool, in order, with at most max_pending chunks queued."""
+    pending: deque = deque()
+    for chunk in iter(lambda: list(islice(paths, SCORE_CHUNK_SIZE)), []):
+        pending.append(executor.submit(_score_chunk_worker, chunk))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+# Scores kept (reservoir-sampled) for percentiles; exact up to this many files
+PERCENTILE_SAMPLE_SIZE = 100_000
+
+# Worst-scoring files kept in the summary
+WORST_FILES = 10
+
+# Write buffer for the per-file JSONL results
+RESULTS_BUFFER_SIZE = 1 << 20
+
+
+def analyze_corpus(
+    corpus_dir: Path,
+    dictionary: Dictionary,
+    limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    output_path: Optional[Path] = None,
+) -> dict:
     """
-    files = list(corpus_dir.rglob("*.txt"))
-    if limit:
-        files = files[:limit]
+    Analyze all files in a corpus directory.
 
-    total = len(files)
-    print(f"Scoring {total} files...")
+    Files are scored in parallel across worker processes (default: one per CPU);
+    workers=1 scores in-process with the given dictionary.
 
-    results = []
-    tier_counts = Counter()
+    Per-file scores are streamed to output_path as JSONL (if given) rather than
+    held in memory. Returns summary statistics: tier counts, mean score,
+    percentiles (over a reservoir sample of PERCENTILE_SAMPLE_SIZE scores) and
+    the WORST_FILES worst files.
+    """
+    # Files are enumerated lazily while earlier ones are scored, so there is no total up front
+    files = iter_text_files(str(corpus_dir))
+    if limit:
+        files = islice(files, limit)
 
-    for i, file_path in enumerate(files, 1):
-        if i % 500 == 0:
-            print(f"  Progress: {i}/{total} ({i / total * 100:.0f}%)")
+    workers = workers or os.cpu_count() or 1
+    print(f"Scoring .txt files under {corpus_dir} ({workers} workers)...")
 
-        result = score_file(file_path, dictionary)
-        results.append(result.to_dict())
-        tier_counts[result.quality_tier] += 1
+    total = 0
 
-    # Sort by combined score (worst first)
-    results.sort(key=lambda x: x["combined_score"], reverse=True)
+    tier_counts = Counter()
+    language_counts = Counter()
+    score_sum = 0.0
+    score_sample: list[float] = []
+    rng = random.Random(42)
+    # Min-heap of (score, -index, result): the root is the best of the kept worst files
+    worst: list[tuple[float, int, dict]] = []
+
+    def collect(scored, out):
+        nonlocal score_sum, total
+        for i, result in enumerate(scored, 1):
+            total = i
+            if i % 500 == 0:
+                print(f"  Progress: {i:,} files scored")
+            record = result.to_dict()
+            if out is not None:
+                out.write(jsonl_line(record))
+            tier_counts[result.quality_tier] += 1
+            language_counts[result.dominant_language] += 1
+
+            score = result.combined_score
+            score_sum += score
+            if len(score_sample) < PERCENTILE_SAMPLE_SIZE:
+                score_sample.append(score)
+            else:
+                j = rng.randrange(i)
+                if j < PERCENTILE_SAMPLE_SIZE:
+                    score_sample[j] = score
+
+            if len(worst) < WORST_FILES:
+                heapq.heappush(worst, (score, -i, record))
+            elif (score, -i) > worst[0][:2]:
+                heapq.heapreplace(worst, (score, -i, record))
+
+    out = open(output_path, "wb", buffering=RESULTS_BUFFER_SIZE) if output_path else None
+    try:
+        if workers == 1:
+            collect((score_file(Path(path_str), dictionary) for path_str in files), out)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(dictionary.words,)
+            ) as executor:
+                collect(_score_in_pool(executor, files, max_pending=workers * 4), out)
+    finally:
+        if out is not None:
+            out.close()
 
     # Calculate summary statistics
-    scores = [r["combined_score"] for r in results]
+    scores = sorted(score_sample)
+    n = len(scores)
 
     summary = {
         "total_files": total,
         "tier_distribution": dict(tier_counts),
+        "language_distribution": dict(language_counts.most_common()),
         "score_percentiles": {
-            "p10": sorted(scores)[int(len(scores) * 0.1)] if scores else 0,
-            "p25": sorted(scores)[int(len(scores) * 0.25)] if scores else 0,
-            "p50": sorted(scores)[int(len(scores) * 0.5)] if scores else 0,
-            "p75": sorted(scores)[int(len(scores) * 0.75)] if scores else 0,
-            "p90": sorted(scores)[int(len(scores) * 0.9)] if scores else 0,
+            "p10": scores[int(n * 0.1)] if scores else 0,
+            "p25": scores[int(n * 0.25)] if scores else 0,
+            "p50": scores[int(n * 0.5)] if scores else 0,
+            "p75": scores[int(n * 0.75)] if scores else 0,
+            "p90": scores[int(n * 0.9)] if scores else 0,
         },
-        "mean_score": sum(scores) / len(scores) if scores else 0,
-        "files": results,
+        "mean_score": score_sum / total if total else 0,
+        # Worst first
+        "worst_files": [record for _, _, record in sorted(worst, reverse=True)],
     }
 
     return summary
@@ -730,6 +902,47 @@ def analyze_corpus(corpus_dir: Path, dictionary: Dictionary, limit: Optional[int
 # =============================================================================
 
 
+# Linux ioctl that makes dest share src's extents (reflink) on btrfs/xfs
+FICLONE = 0x40049409
+
+
+def place_file(src: str, dest: Path, mode: str = "copy") -> None:
+    """Put the contents of src at dest as a hardlink, reflink clone or copy.
+
+    link and reflink fall back to a plain copy where the filesystem cannot do
+    them (e.g. across devices). A hardlinked dest shares its inode with src,
+    so editing either one edits both.
+    """
+    if mode == "link":
+        try:
+            os.link(src, dest)
+            return
+        except FileExistsError:
+            # Replace an earlier output (which may itself be a link to src)
+            os.unlink(dest)
+            return place_file(src, dest, mode)
+        except OSError:
+            pass
+    elif mode == "reflink":
+        try:
+            import fcntl
+
+            # Never truncate through an existing hardlink to src
+            if os.path.lexists(dest):
+                os.unlink(dest)
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+    try:
+        shutil.copyfile(src, dest)
+    except shutil.SameFileError:
+        # dest is a hardlink to src from an earlier run; replace it with a copy
+        os.unlink(dest)
+        shutil.copyfile(src, dest)
+
+
 def cmd_check(args, dictionary: Dictionary):
     """Check a single file."""
     result = score_file(Path(args.file), dictionary)
@@ -740,6 +953,7 @@ def cmd_check(args, dictionary: Dictionary):
     print(f"Garbage words: {result.garbage_words:,} ({result.garbage_rate:.1%})")
     print(f"Combined score: {result.combined_score:.3f}")
     print(f"Quality tier: {result.quality_tier.upper()}")
+    print(f"Dominant language: {result.dominant_language}")
 
     if result.sample_unknown:
         print("\nSample unknown words:")
@@ -755,7 +969,17 @@ def cmd_analyze(args, dictionary: Dictionary):
         print(f"Error: Directory not found: {corpus_dir}", file=sys.stderr)
         sys.exit(1)
 
-    summary = analyze_corpus(corpus_dir, dictionary, limit=args.limit)
+    results_path = Path(args.results) if args.results else None
+    if results_path is None and args.report:
+        results_path = Path(args.report).with_suffix(".files.jsonl")
+
+    summary = analyze_corpus(
+        corpus_dir,
+        dictionary,
+        limit=args.limit,
+        workers=args.workers,
+        output_path=results_path,
+    )
 
     print(f"\n{'=' * 60}")
     print("CORPUS OCR QUALITY ANALYSIS")
@@ -769,18 +993,23 @@ def cmd_analyze(args, dictionary: Dictionary):
         pct = count / summary["total_files"] * 100 if summary["total_files"] > 0 else 0
         print(f"  {tier.upper():10s}: {count:6,} ({pct:5.1f}%)")
     print()
+    print("Dominant languages:")
+    for lang, count in list(summary["language_distribution"].items())[:5]:
+        print(f"  {lang:10s}: {count:6,}")
+    print()
     print("Score percentiles:")
     for p, v in summary["score_percentiles"].items():
         print(f"  {p}: {v:.3f}")
 
     if args.report:
-        with open(args.report, "w") as f:
-            json.dump(summary, f, indent=2)
-        print(f"\nFull report saved to: {args.report}")
+        write_json_report(Path(args.report), summary)
+        print(f"\nSummary report saved to: {args.report}")
+    if results_path:
+        print(f"Per-file scores saved to: {results_path}")
 
     # Show worst files
-    print(f"\nWorst {min(10, len(summary['files']))} files:")
-    for result in summary["files"][:10]:
+    print(f"\nWorst {len(summary['worst_files'])} files:")
+    for result in summary["worst_files"]:
         print(
             f"  {result['combined_score']:.3f} [{result['quality_tier']:8s}] {Path(result['file_path']).name}"
         )
@@ -799,38 +1028,62 @@ def cmd_filter(args, dictionary: Dictionary):
     if output_bad:
         output_bad.mkdir(parents=True, exist_ok=True)
 
-    files = list(corpus_dir.rglob("*.txt"))
-    total = len(files)
+    workers = args.workers or os.cpu_count() or 1
+    files = iter_text_files(str(corpus_dir))
     good_count = 0
     bad_count = 0
 
-    print(f"Filtering {total} files with threshold {threshold}...")
-
-    for i, file_path in enumerate(files, 1):
-        if i % 500 == 0:
-            print(f"  Progress: {i}/{total}")
+    print(
+        f"Filtering .txt files under {corpus_dir} with threshold {threshold} "
+        f"({workers} workers)..."
+    )
 
-        result = score_file(file_path, dictionary)
+    # Files are linked or cloned where possible, else copied byte for byte
+    # (shutil.copyfile uses the kernel's fast-copy path on Linux)
+    copy_mode = args.copy_mode
+
+    def copy_results(scored):
+        nonlocal good_count, bad_count
+        for i, result in enumerate(scored, 1):
+            if i % 500 == 0:
+                print(f"  Progress: {i:,} files")
+
+            if result.combined_score < threshold:
+                good_count += 1
+                if output_good:
+                    place_file(
+                        result.file_path, output_good / Path(result.file_path).name, copy_mode
+                    )
+            else:
+                bad_count += 1
+                if output_bad:
+                    place_file(
+                        result.file_path, output_bad / Path(result.file_path).name, copy_mode
+                    )
+
+    # Scoring runs in worker processes; copies happen here as results arrive
+    if workers == 1:
+        copy_results(score_file(Path(path_str), dictionary) for path_str in files)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(dictionary.words,)
+        ) as executor:
+            copy_results(_score_in_pool(executor, files, max_pending=workers * 4))
 
-        if result.combined_score < threshold:
-            good_count += 1
-            if output_good:
-                dest = output_good / file_path.name
-                dest.write_text(file_path.read_text(encoding="utf-8", errors="replace"))
-        else:
-            bad_count += 1
-            if output_bad:
-                dest = output_bad / file_path.name
-                dest.write_text(file_path.read_text(encoding="utf-8", errors="replace"))
+    total = good_count + bad_count
+    if total == 0:
+        print("No files found.")
+        return
 
     print("\nResults:")
     print(f"  Good (score < {threshold}): {good_count:,} ({good_count / total * 100:.1f}%)")
     print(f"  Bad (score >= {threshold}): {bad_count:,} ({bad_count / total * 100:.1f}%)")
 
+    placed = {"link": "linked", "reflink": "cloned"}.get(copy_mode, "copied")
     if output_good:
-        print(f"  Good files copied to: {output_good}")
+        print(f"  Good files {placed} to: {output_good}")
     if output_bad:
-        print(f"  Bad files copied to: {output_bad}")
+        print(f"  Bad files {placed} to: {output_bad}")
 
 
 def main():
@@ -860,8 +1113,16 @@ Examples:
     # Analyze corpus
     analyze_parser = subparsers.add_parser("analyze", help="Analyze entire corpus")
     analyze_parser.add_argument("corpus_dir", type=str, help="Corpus directory")
-    analyze_parser.add_argument("--report", type=str, help="Save JSON report to file")
+    analyze_parser.add_argument("--report", type=str, help="Save JSON summary report to file")
+    analyze_parser.add_argument(
+        "--results",
+        type=str,
+        help="Stream per-file scores to this JSONL file (default: <report>.files.jsonl)",
+    )
     analyze_parser.add_argument("--limit", type=int, help="Limit number of files to analyze")
+    analyze_parser.add_argument(
+        "--workers", type=int, help="Worker processes for scoring (default: CPU count)"
+    )
 
     # Filter corpus
     filter_parser = subparsers.add_parser("filter", help="Filter corpus by quality")
@@ -871,6 +1132,16 @@ Examples:
     )
     filter_parser.add_argument("--output-good", type=str, help="Directory for good files")
     filter_parser.add_argument("--output-bad", type=str, help="Directory for bad files")
+    filter_parser.add_argument(
+        "--workers", type=int, help="Worker processes for scoring (default: CPU count)"
+    )
+    filter_parser.add_argument(
+        "--copy-mode",
+        choices=["link", "reflink", "copy"],
+        default="link",
+        help="How to place output files: hardlink (edits reach the originals), "
+        "reflink clone, or full copy; falls back to copy (default: link)",
+    )
 
     # Common options
     parser.add_argument("--vocab", type=str, help="Additional vocabulary file")
@@ -879,7 +1150,7 @@ Examples:
 
     # Initialize dictionary
     print("Loading dictionary...", file=sys.stderr)
-    dictionary = Dictionary()
+    dictionary = get_dictionary()
     print(f"Dictionary loaded: ~{len(dictionary):,} words", file=sys.stderr)
 
     if hasattr(args, "vocab") and args.vocab:
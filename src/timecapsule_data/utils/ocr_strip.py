@@ -23,6 +23,10 @@ Workflow:
 
 Output:
     _strip_log.jsonl - JSONL log of modified files (auto-increments if exists)
+
+Environment:
+    TC_OCR_COMPACT_NOISE=1 - keep the noise words in a packed sorted table
+    (much smaller than the default hash set, for very large vocab files)
 """
 
 from __future__ import annotations
@@ -31,9 +35,13 @@ import argparse
 import os
 import signal
 import sys
+import threading
 import time
 from pathlib import Path
 
+# Minimum time between batch progress lines
+PROGRESS_INTERVAL_NS = 500_000_000
+
 
 def get_unique_path(path: Path) -> Path:
     """Return a unique path by adding numeric suffix if file exists.
@@ -56,10 +64,21 @@ def get_unique_path(path: Path) -> Path:
         counter += 1
 
 
+def init_noise_words(vocab_path: Path, categories: list[str] | None = None) -> int:
+    """Load the noise word set, returning the count loaded.
+
+    Set TC_OCR_COMPACT_NOISE=1 to store it as a packed sorted table, which
+    uses far less memory for large vocab files at a small lookup cost.
+    """
+    import rust_ocr_clean  # type: ignore[import-not-found]
+
+    if os.environ.get("TC_OCR_COMPACT_NOISE"):
+        return rust_ocr_clean.init_noise_words_compact(str(vocab_path), categories)
+    return rust_ocr_clean.init_noise_words(str(vocab_path), categories)
+
+
 def cmd_batch(args: argparse.Namespace) -> int:
     """Strip noise words from batch of files."""
-    import json
-
     import rust_ocr_clean  # type: ignore[import-not-found]
 
     input_dir = Path(args.input_dir).resolve()
@@ -75,6 +94,9 @@ def cmd_batch(args: argparse.Namespace) -> int:
         return 1
 
     output_dir = input_dir if in_place else Path(args.output_dir).resolve()
+    # Resolved once; the batch loop works on these str forms only
+    input_root = os.fspath(input_dir)
+    output_root = os.fspath(output_dir)
 
     # Determine log path (auto-generate with increment if not specified)
     # Default location is parent of input_dir (consistent with other tools)
@@ -102,10 +124,9 @@ def cmd_batch(args: argparse.Namespace) -> int:
     print(f"Loading noise words from: {vocab_path}", file=sys.stderr)
     if categories:
         print(f"  Categories: {', '.join(categories)}", file=sys.stderr)
-        noise_count = rust_ocr_clean.init_noise_words(str(vocab_path), categories)
     else:
         print("  Categories: G (garbage), R (repeated) [default]", file=sys.stderr)
-        noise_count = rust_ocr_clean.init_noise_words(str(vocab_path))
+    noise_count = init_noise_words(vocab_path, categories)
 
     print(f"  Loaded {noise_count:,} noise words", file=sys.stderr)
 
@@ -113,154 +134,128 @@ def cmd_batch(args: argparse.Namespace) -> int:
         print("Warning: No noise words loaded. Check vocab file format.", file=sys.stderr)
         return 1
 
-    # Set up interrupt handling
-    interrupted = False
+    num_threads = args.threads or os.cpu_count() or 1
+    # Files between progress reports; scaled so each report covers real work per thread
+    batch_size = max(512, num_threads * 64)
+
+    # Set up interrupt handling. The Rust call runs on a worker thread so the
+    # main thread stays free to run this handler; the token is polled per file.
+    stop = threading.Event()
+    cancel = rust_ocr_clean.CancelToken()
 
     def handle_interrupt(signum: int, frame: object) -> None:
-        nonlocal interrupted
-        if interrupted:
+        if stop.is_set():
             print("\n\nForce quit.", file=sys.stderr)
             sys.exit(1)
-        interrupted = True
+        stop.set()
+        cancel.cancel()
         print(
-            "\n\nInterrupted! Finishing current batch, then stopping...",
+            "\n\nInterrupted! Finishing files in flight, then stopping...",
             file=sys.stderr,
         )
 
     old_handler = signal.signal(signal.SIGINT, handle_interrupt)
 
     try:
-        # Discover files
+        # Discovery (parallel readdir walk), output directory creation, stripping and
+        # log writing all run in Rust without the GIL; Python only sees progress
+        # callbacks between batches. Nothing is created when no files are found.
         print(f"Scanning {input_dir} for *.txt files...", end="", flush=True)
 
-        def fast_find_files(directory: Path, pattern: str) -> list[Path]:
-            """Fast recursive file discovery using os.scandir."""
-            import fnmatch
-
-            results = []
+        start_ns = time.monotonic_ns()
+        last_print_ns = 0
+
+        def report_progress(files_done: int, total_files: int, batch_stats) -> bool:
+            """Print the header after discovery, then progress at most every 0.5s.
+
+            Returns True to stop starting new files (on interrupt).
+            """
+            nonlocal start_ns, last_print_ns
+            if files_done == 0:
+                print(f" found {total_files:,} files", file=sys.stderr)
+                if total_files:
+                    print(f"\n{'=' * 60}")
+                    print("OCR Noise Stripping - Rust engine (parallel)")
+                    print(f"{'=' * 60}")
+                    print(f"  Files to process: {total_files:,}")
+                    print(f"  Noise words: {noise_count:,}")
+                    print(f"  Mode: {'in-place' if in_place else 'copy to ' + output_root}")
+                    if log_path:
+                        print(f"  Log: {log_path}")
+                    print(f"  Threads: {num_threads}")
+                    print(f"{'=' * 60}\n")
+                start_ns = time.monotonic_ns()
+                return stop.is_set()
+
+            now_ns = time.monotonic_ns()
+            if now_ns - last_print_ns < PROGRESS_INTERVAL_NS and files_done < total_files:
+                return stop.is_set()
+            last_print_ns = now_ns
+
+            elapsed = (now_ns - start_ns) / 1e9
+            files_per_sec = files_done / elapsed if elapsed > 0 else 0
+            mb_per_sec = (batch_stats.total_bytes / (1024 * 1024)) / elapsed if elapsed > 0 else 0
+            remaining = (total_files - files_done) / files_per_sec if files_per_sec > 0 else 0
+
+            # Format remaining time
+            if remaining >= 3600:
+                eta = f"{remaining / 3600:.1f}h"
+            elif remaining >= 60:
+                eta = f"{remaining / 60:.1f}m"
+            else:
+                eta = f"{remaining:.0f}s"
+
+            pct = (files_done / total_files) * 100
+            print(
+                f"  [{pct:5.1f}%] {files_done:,}/{total_files:,} files | "
+                f"{files_per_sec:.1f} files/s | {mb_per_sec:.1f} MB/s | "
+                f"ETA: {eta} | stripped: {batch_stats.total_words_stripped:,}"
+            )
+            return stop.is_set()
+
+        outcome: list = []
+
+        def run_strip() -> None:
             try:
-                with os.scandir(directory) as entries:
-                    for entry in entries:
-                        if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
-                            results.append(Path(entry.path))
-                        elif entry.is_dir():
-                            results.extend(fast_find_files(Path(entry.path), pattern))
-            except PermissionError:
-                pass
-            return results
-
-        files = fast_find_files(input_dir, "*.txt")
-        print(f" found {len(files):,} files", file=sys.stderr)
-
-        if not files:
-            print("No files to process.", file=sys.stderr)
-            return 0
-
-        # Build file pairs (for in-place, input == output)
-        file_pairs = []
-        for input_path in files:
-            relative = input_path.relative_to(input_dir)
-            output_path = output_dir / relative
-            file_pairs.append((str(input_path), str(output_path)))
-
-        # Create output directory (only if not in-place)
-        if not in_place:
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-        num_threads = args.threads or 24
-
-        # Print header
-        print(f"\n{'=' * 60}")
-        print("OCR Noise Stripping - Rust engine (parallel)")
-        print(f"{'=' * 60}")
-        print(f"  Files to process: {len(file_pairs):,}")
-        print(f"  Noise words: {noise_count:,}")
-        print(f"  Mode: {'in-place' if in_place else 'copy to ' + str(output_dir)}")
-        if log_path:
-            print(f"  Log: {log_path}")
-        print(f"  Threads: {num_threads}")
-        print(f"{'=' * 60}\n")
-
-        # Open log file if requested
-        log_file = open(log_path, "w", encoding="utf-8") if log_path else None
-
-        # Process in batches for progress reporting
-        start_time = time.time()
-        total_to_process = len(file_pairs)
-        BATCH_SIZE = 1000
-
-        files_processed = 0
-        files_modified = 0
-        total_stripped = 0
-        bytes_processed = 0
-
-        try:
-            for batch_start in range(0, total_to_process, BATCH_SIZE):
-                if interrupted:
-                    break
-
-                batch_end = min(batch_start + BATCH_SIZE, total_to_process)
-                batch = file_pairs[batch_start:batch_end]
-
-                # Process batch - use logged version if logging enabled
-                if log_file:
-                    batch_stats, modified_files = rust_ocr_clean.strip_noise_batch_parallel_logged(
-                        batch, num_threads
+                outcome.append(
+                    rust_ocr_clean.strip_noise_dir(
+                        input_root,
+                        output_root,
+                        num_threads,
+                        log_path=str(log_path) if log_path else None,
+                        progress=report_progress,
+                        batch_size=batch_size,
+                        cancel=cancel,
                     )
-                    # Write log entries for modified files
-                    for path, words_stripped in modified_files:
-                        # Make path relative to input_dir for cleaner logs
-                        try:
-                            rel_path = str(Path(path).relative_to(input_dir))
-                        except ValueError:
-                            rel_path = path
-                        log_file.write(
-                            json.dumps({"path": rel_path, "words_stripped": words_stripped}) + "\n"
-                        )
-                else:
-                    batch_stats = rust_ocr_clean.strip_noise_batch_parallel(batch, num_threads)
-
-                # Aggregate stats
-                files_processed += batch_stats.files_processed
-                files_modified += batch_stats.files_modified
-                total_stripped += batch_stats.total_words_stripped
-                bytes_processed += batch_stats.total_bytes
-
-                # Progress update
-                now = time.time()
-                elapsed = now - start_time
-                current_count = batch_end
-                files_per_sec = current_count / elapsed if elapsed > 0 else 0
-                mb_per_sec = (bytes_processed / (1024 * 1024)) / elapsed if elapsed > 0 else 0
-                remaining = (
-                    (total_to_process - current_count) / files_per_sec if files_per_sec > 0 else 0
                 )
+            except BaseException as e:
+                outcome.append(e)
+
+        worker = threading.Thread(target=run_strip, name="ocr-strip", daemon=True)
+        worker.start()
+        # Join with a timeout so the main thread keeps handling signals
+        while worker.is_alive():
+            worker.join(0.1)
+        if isinstance(outcome[0], BaseException):
+            raise outcome[0]
+        stats, total_to_process = outcome[0]
+
+        if total_to_process == 0:
+            print("No files to process.", file=sys.stderr)
+            return 0
 
-                # Format remaining time
-                if remaining >= 3600:
-                    eta = f"{remaining / 3600:.1f}h"
-                elif remaining >= 60:
-                    eta = f"{remaining / 60:.1f}m"
-                else:
-                    eta = f"{remaining:.0f}s"
-
-                pct = (current_count / total_to_process) * 100 if total_to_process > 0 else 100
-                print(
-                    f"  [{pct:5.1f}%] {current_count:,}/{total_to_process:,} files | "
-                    f"{files_per_sec:.1f} files/s | {mb_per_sec:.1f} MB/s | "
-                    f"ETA: {eta} | stripped: {total_stripped:,}"
-                )
-        finally:
-            if log_file:
-                log_file.close()
+        files_processed = stats.files_processed
+        files_modified = stats.files_modified
+        total_stripped = stats.total_words_stripped
+        bytes_processed = stats.total_bytes
 
         # Final stats
-        elapsed = time.time() - start_time
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
         files_per_sec = files_processed / elapsed if elapsed > 0 else 0
         mb_per_sec = (bytes_processed / (1024 * 1024)) / elapsed if elapsed > 0 else 0
 
         print(f"\n{'=' * 60}")
-        if interrupted:
+        if stop.is_set():
             print(f"INTERRUPTED after {files_processed:,} of {total_to_process:,} files")
         else:
             print("COMPLETE")
@@ -274,7 +269,7 @@ def cmd_batch(args: argparse.Namespace) -> int:
             print(f"  Log written:     {log_path}")
         print(f"{'=' * 60}")
 
-        return 0 if not interrupted else 1
+        return 0 if not stop.is_set() else 1
 
     finally:
         signal.signal(signal.SIGINT, old_handler)
@@ -304,10 +299,7 @@ def cmd_file(args: argparse.Namespace) -> int:
         categories = [c.strip().upper() for c in args.categories.split(",")]
 
     # Initialize noise word set
-    if categories:
-        noise_count = rust_ocr_clean.init_noise_words(str(vocab_path), categories)
-    else:
-        noise_count = rust_ocr_clean.init_noise_words(str(vocab_path))
+    noise_count = init_noise_words(vocab_path, categories)
 
     print(f"Loaded {noise_count:,} noise words", file=sys.stderr)
 
@@ -345,14 +337,10 @@ def cmd_check(args: argparse.Namespace) -> int:
         categories = [c.strip().upper() for c in args.categories.split(",")]
 
     # Initialize noise word set
-    if categories:
-        noise_count = rust_ocr_clean.init_noise_words(str(vocab_path), categories)
-    else:
-        noise_count = rust_ocr_clean.init_noise_words(str(vocab_path))
+    noise_count = init_noise_words(vocab_path, categories)
 
-    # Read and check
-    content = input_path.read_text()
-    _, words_stripped = rust_ocr_clean.strip_noise_words(content)
+    # Count in Rust, streaming the file rather than loading it as a str
+    words_stripped = rust_ocr_clean.count_noise_words_file(str(input_path))
 
     print(f"File: {input_path}")
     print(f"Noise words loaded: {noise_count:,}")
@@ -406,7 +394,7 @@ Output files (auto-generated, auto-incremented):
         "--categories",
         help="Comma-separated categories to strip (default: G,R)",
     )
-    batch_parser.add_argument("--threads", type=int, default=24, help="Thread count (default: 24)")
+    batch_parser.add_argument("--threads", type=int, help="Thread count (default: all CPU cores)")
     batch_parser.add_argument(
         "--log",
         help="Override log file path (default: {input_dir}/_strip_log.jsonl)",
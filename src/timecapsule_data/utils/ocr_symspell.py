@@ -14,24 +14,44 @@ Usage:
 import argparse
 import importlib.resources
 import json
-import re
+import os
+import signal
 import sys
+import threading
+import time
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from symspellpy import SymSpell, Verbosity
+# Minimum time between batch progress lines
+PROGRESS_INTERVAL_NS = 500_000_000
 
+# Built SymSpell delete indexes, reused across runs (rebuilt if the dictionary changes)
+SYMSPELL_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "timecapsule"
+)
 
-def create_symspell(max_edit_distance: int = 2) -> SymSpell:
-    """Create and load SymSpell with frequency dictionary."""
-    sym_spell = SymSpell(max_dictionary_edit_distance=max_edit_distance)
+
+def create_symspell(max_edit_distance: int = 2, custom_vocab: Optional[set[str]] = None) -> int:
+    """Load the SymSpell frequency dictionary and skip words into rust_ocr_clean.
+
+    Words in SKIP_WORDS or custom_vocab are never corrected. Returns the
+    number of dictionary words. The built index is cached in SYMSPELL_CACHE_DIR,
+    so only the first run pays for generating the dictionary's deletes.
+    """
+    import rust_ocr_clean  # type: ignore[import-not-found]
+
+    # symspellpy ships the English frequency dictionary; lookups run in Rust
     dictionary_path = str(
         importlib.resources.files("symspellpy").joinpath("frequency_dictionary_en_82_765.txt")
     )
-    sym_spell.load_dictionary(dictionary_path, term_index=0, count_index=1)
-    return sym_spell
+    cache_path = SYMSPELL_CACHE_DIR / f"symspell_en_82_765_ed{max_edit_distance}.bin"
+    word_count = rust_ocr_clean.symspell_load_dictionary(
+        dictionary_path, max_edit_distance, cache_path=str(cache_path)
+    )
+    rust_ocr_clean.symspell_set_skip_words([*SKIP_WORDS, *(custom_vocab or ())])
+    return word_count
 
 
 def load_custom_vocab(vocab_path: str) -> set[str]:
@@ -59,98 +79,96 @@ def load_custom_vocab(vocab_path: str) -> set[str]:
     return vocab
 
 
-WORD_PATTERN = re.compile(r"\b([a-zA-Z]+(?:'[a-zA-Z]+)?)\b")
-
-SKIP_WORDS = {
-    "i",
-    "a",
-    "o",
-    "mr",
-    "mrs",
-    "ms",
-    "dr",
-    "jr",
-    "sr",
-    "st",
-    "nd",
-    "rd",
-    "th",
-    "vs",
-    "etc",
-    "ie",
-    "eg",
-    "cf",
-    "al",
-    "et",
-    "esq",
-    "hon",
-    "rev",
-    "messrs",
-    "mesdames",
-    "ii",
-    "iii",
-    "iv",
-    "vi",
-    "vii",
-    "viii",
-    "ix",
-    "xi",
-    "xii",
-    "xx",
-    "ing",
-    "tion",
-    "sion",
-    "ment",
-    "ness",
-    "ful",
-    "less",
-    "able",
-    "ible",
-    "ence",
-    "ance",
-    "ous",
-    "ive",
-    "tive",
-    "ary",
-    "ory",
-    "ity",
-    "ty",
-    "pre",
-    "pro",
-    "anti",
-    "dis",
-    "mis",
-    "non",
-    "sub",
-    "super",
-    "un",
-    "ly",
-    "er",
-    "est",
-    "ed",
-    "es",
-    "en",
-    "al",
-    "ic",
-    "ical",
-    "labor",
-    "color",
-    "honor",
-    "favor",
-    "neighbor",
-    "behavior",
-    "center",
-    "theater",
-    "fiber",
-    "meter",
-    "liter",
-    "colored",
-    "honored",
-    "favored",
-    "labored",
-}
-
-MAX_WORD_LENGTH = 25
+SKIP_WORDS = frozenset(
+    {
+        "i",
+        "a",
+        "o",
+        "mr",
+        "mrs",
+        "ms",
+        "dr",
+        "jr",
+        "sr",
+        "st",
+        "nd",
+        "rd",
+        "th",
+        "vs",
+        "etc",
+        "ie",
+        "eg",
+        "cf",
+        "al",
+        "et",
+        "esq",
+        "hon",
+        "rev",
+        "messrs",
+        "mesdames",
+        "ii",
+        "iii",
+        "iv",
+        "vi",
+        "vii",
+        "viii",
+        "ix",
+        "xi",
+        "xii",
+        "xx",
+        "ing",
+        "tion",
+        "sion",
+        "ment",
+        "ness",
+        "ful",
+        "less",
+        "able",
+        "ible",
+        "ence",
+        "ance",
+        "ous",
+        "ive",
+        "tive",
+        "ary",
+        "ory",
+        "ity",
+        "ty",
+        "pre",
+        "pro",
+        "anti",
+        "dis",
+        "mis",
+        "non",
+        "sub",
+        "super",
+        "un",
+        "ly",
+        "er",
+        "est",
+        "ed",
+        "es",
+        "en",
+        "al",
+        "ic",
+        "ical",
+        "labor",
+        "color",
+        "honor",
+        "favor",
+        "neighbor",
+        "behavior",
+        "center",
+        "theater",
+        "fiber",
+        "meter",
+        "liter",
+        "colored",
+        "honored",
+        "favored",
+        "labored",
+    }
+)
 
 
 @dataclass
@@ -174,155 +192,79 @@ class CorrectionStats:
         }
 
 
-def should_skip_word(word: str) -> bool:
-    """Check if word should be skipped."""
-    word_lower = word.lower()
-    if word_lower in SKIP_WORDS:
-        return True
-    if len(word) == 1 and word_lower not in ("a", "i", "o"):
-        return True
-    if len(word) > MAX_WORD_LENGTH:
-        return True
-    if any(c.isdigit() for c in word):
-        return True
-    if word.isupper() and len(word) <= 5:
-        return True
-    return False
-
-
-def preserve_case(original: str, corrected: str) -> str:
-    """Preserve case pattern of original in correction."""
-    if original.isupper():
-        return corrected.upper()
-    elif original.istitle():
-        return corrected.title()
-    elif original.islower():
-        return corrected.lower()
-    else:
-        return corrected.lower()
-
-
-def correct_word(
-    word: str,
-    sym_spell: SymSpell,
-    stats: Optional[CorrectionStats] = None,
-    max_edit_distance: int = 2,
-    min_word_length: int = 4,
-    custom_vocab: Optional[set[str]] = None,
-) -> str:
-    """Attempt to correct a single word using SymSpell."""
-    if stats:
-        stats.total_words += 1
-
-    if should_skip_word(word) or len(word) < min_word_length:
-        if stats:
-            stats.skipped_words += 1
-        return word
-
-    # Skip words in custom vocabulary
-    if custom_vocab and word.lower() in custom_vocab:
-        if stats:
-            stats.skipped_words += 1
-        return word
-
-    suggestions = sym_spell.lookup(
-        word.lower(),
-        Verbosity.CLOSEST,
-        max_edit_distance=max_edit_distance,
-    )
-
-    if not suggestions:
-        return word
-
-    best = suggestions[0]
-
-    if best.term.lower() == word.lower():
-        return word
-
-    if len(word) <= 5 and best.distance > 1:
-        return word
-
-    if best.count < 1000:
-        return word
-
-    # Don't correct American->British spelling
-    if best.term.lower().replace("ou", "o") == word.lower():
-        return word
-    if best.term.lower().replace("re", "er") == word.lower():
-        return word
-
-    corrected = preserve_case(word, best.term)
-
-    if stats:
-        stats.corrected_words += 1
-        stats.corrections[f"{word} -> {corrected}"] += 1
-
-    return corrected
-
-
 def correct_text(
     text: str,
-    sym_spell: SymSpell,
     stats: Optional[CorrectionStats] = None,
     max_edit_distance: int = 2,
-    custom_vocab: Optional[set[str]] = None,
 ) -> str:
-    """Correct all words in text using SymSpell."""
-    result = []
-    last_end = 0
+    """Correct all words in text using the SymSpell dictionary loaded by create_symspell.
 
-    for match in WORD_PATTERN.finditer(text):
-        result.append(text[last_end : match.start()])
-        word = match.group(1)
-        corrected = correct_word(word, sym_spell, stats, max_edit_distance, 4, custom_vocab)
-        result.append(corrected)
-        last_end = match.end()
+    The whole text is corrected in one Rust call: words of 4+ letters that are
+    not skip words, digits or short abbreviations are replaced by the closest
+    frequent dictionary term, keeping their case.
+    """
+    import rust_ocr_clean  # type: ignore[import-not-found]
 
-    result.append(text[last_end:])
-    return "".join(result)
+    corrected, total, corrected_words, skipped, corrections = (
+        rust_ocr_clean.symspell_correct_text(text, max_edit_distance)
+    )
+    if stats:
+        stats.total_words += total
+        stats.corrected_words += corrected_words
+        stats.skipped_words += skipped
+        stats.corrections.update(corrections)
+    return corrected
 
 
 def correct_file(
     input_path: Path,
     output_path: Optional[Path],
-    sym_spell: SymSpell,
     stats: Optional[CorrectionStats] = None,
     max_edit_distance: int = 2,
-    custom_vocab: Optional[set[str]] = None,
 ) -> bool:
-    """Correct a single file. Returns True if modified."""
-    try:
-        content = input_path.read_text(encoding="utf-8", errors="replace")
-    except Exception as e:
-        print(f"  Error reading {input_path}: {e}", file=sys.stderr)
-        return False
+    """Correct a single file. Returns True if modified.
 
-    corrected = correct_text(content, sym_spell, stats, max_edit_distance, custom_vocab)
-    was_modified = corrected != content
+    The file is read, corrected and written in Rust, so its text never
+    becomes a Python string.
+    """
+    import rust_ocr_clean  # type: ignore[import-not-found]
 
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(corrected, encoding="utf-8")
+    try:
+        was_modified, total, corrected_words, skipped, corrections = (
+            rust_ocr_clean.symspell_correct_file(
+                str(input_path),
+                str(output_path) if output_path else None,
+                max_edit_distance,
+            )
+        )
+    except OSError as e:
+        print(f"  Error correcting {input_path}: {e}", file=sys.stderr)
+        return False
 
+    if stats:
+        stats.total_words += total
+        stats.corrected_words += corrected_words
+        stats.skipped_words += skipped
+        stats.corrections.update(corrections)
     return was_modified
 
 
 def cmd_clean(args):
     """Clean a single file."""
-    print("Loading SymSpell dictionary...", file=sys.stderr)
-    sym_spell = create_symspell(args.max_edit_distance)
-    print(f"Dictionary loaded: {len(sym_spell.words):,} words", file=sys.stderr)
-
     custom_vocab = None
     if args.vocab:
         custom_vocab = load_custom_vocab(args.vocab)
         print(f"Custom vocabulary: {len(custom_vocab):,} words to skip", file=sys.stderr)
 
+    print("Loading SymSpell dictionary...", file=sys.stderr)
+    word_count = create_symspell(args.max_edit_distance, custom_vocab)
+    print(f"Dictionary loaded: {word_count:,} words", file=sys.stderr)
+
     input_path = Path(args.input)
     output_path = Path(args.output) if args.output else None
 
     stats = CorrectionStats()
-    correct_file(input_path, output_path, sym_spell, stats, args.max_edit_distance, custom_vocab)
+    correct_file(input_path, output_path, stats, args.max_edit_distance)
 
     print(f"\nFile: {input_path}")
     print(f"Total words: {stats.total_words:,}")
@@ -342,46 +284,103 @@ def cmd_clean(args):
 
 def cmd_batch(args):
     """Clean all files in a directory."""
-    print("Loading SymSpell dictionary...", file=sys.stderr)
-    sym_spell = create_symspell(args.max_edit_distance)
-    print(f"Dictionary loaded: {len(sym_spell.words):,} words", file=sys.stderr)
+    import rust_ocr_clean  # type: ignore[import-not-found]
 
     custom_vocab = None
     if args.vocab:
         custom_vocab = load_custom_vocab(args.vocab)
         print(f"Custom vocabulary: {len(custom_vocab):,} words to skip", file=sys.stderr)
 
+    print("Loading SymSpell dictionary...", file=sys.stderr)
+    word_count = create_symspell(args.max_edit_distance, custom_vocab)
+    print(f"Dictionary loaded: {word_count:,} words", file=sys.stderr)
+
     input_dir = Path(args.input_dir)
     output_dir = Path(args.output_dir) if args.output_dir else None
-
-    files = list(input_dir.rglob(args.pattern))
-    total = len(files)
-
-    print(f"\nProcessing {total} files...")
-
-    stats = CorrectionStats()
-    modified_count = 0
-
-    for i, file_path in enumerate(files, 1):
-        if i % 100 == 0 or i == total:
-            print(f"  Progress: {i}/{total} ({i / total * 100:.0f}%)")
-
-        if output_dir:
-            relative = file_path.relative_to(input_dir)
-            out_path = output_dir / relative
-        else:
-            out_path = None
-
-        if correct_file(
-            file_path, out_path, sym_spell, stats, args.max_edit_distance, custom_vocab
-        ):
-            modified_count += 1
+    num_threads = args.threads or os.cpu_count() or 1
+
+    # Set up interrupt handling. The Rust call runs on a worker thread so the
+    # main thread stays free to run this handler; the token is polled per file.
+    stop = threading.Event()
+    cancel = rust_ocr_clean.CancelToken()
+
+    def handle_interrupt(signum, frame):
+        if stop.is_set():
+            print("\n\nForce quit.", file=sys.stderr)
+            sys.exit(1)
+        stop.set()
+        cancel.cancel()
+        print("\n\nInterrupted! Finishing files in flight, then stopping...", file=sys.stderr)
+
+    last_print_ns = 0
+
+    def report_progress(files_done: int, total_files: int) -> bool:
+        """Print the header after discovery, then progress at most every 0.5s."""
+        nonlocal last_print_ns
+        if files_done == 0:
+            print(f"\nProcessing {total_files} files ({num_threads} threads)...")
+            return stop.is_set()
+
+        now_ns = time.monotonic_ns()
+        if now_ns - last_print_ns < PROGRESS_INTERVAL_NS and files_done < total_files:
+            return stop.is_set()
+        last_print_ns = now_ns
+        print(f"  Progress: {files_done}/{total_files} ({files_done / total_files * 100:.0f}%)")
+        return stop.is_set()
+
+    outcome: list = []
+
+    def run_correct():
+        try:
+            # Discovery and correction both run in Rust, so no per-file Python path
+            # list is built; batch_size only sets how often progress is reported
+            outcome.append(
+                rust_ocr_clean.symspell_correct_dir(
+                    str(input_dir),
+                    str(output_dir) if output_dir else None,
+                    num_threads,
+                    pattern=args.pattern,
+                    max_edit_distance=args.max_edit_distance,
+                    progress=report_progress,
+                    batch_size=num_threads * 64,
+                    cancel=cancel,
+                )
+            )
+        except BaseException as e:
+            outcome.append(e)
+
+    old_handler = signal.signal(signal.SIGINT, handle_interrupt)
+    try:
+        worker = threading.Thread(target=run_correct, name="ocr-symspell", daemon=True)
+        worker.start()
+        # Join with a timeout so the main thread keeps handling signals
+        while worker.is_alive():
+            worker.join(0.1)
+    finally:
+        signal.signal(signal.SIGINT, old_handler)
+    if isinstance(outcome[0], BaseException):
+        raise outcome[0]
+    batch_stats, total = outcome[0]
+
+    stats = CorrectionStats(
+        total_words=batch_stats.total_words,
+        corrected_words=batch_stats.corrected_words,
+        skipped_words=batch_stats.skipped_words,
+        corrections=Counter(batch_stats.corrections),
+    )
+    modified_count = batch_stats.files_modified
+    failed_count = batch_stats.files_failed
 
     print(f"\n{'=' * 60}")
-    print("BATCH CORRECTION COMPLETE")
+    if stop.is_set():
+        print(f"INTERRUPTED after {batch_stats.files_processed:,} of {total:,} files")
+    else:
+        print("BATCH CORRECTION COMPLETE")
     print(f"{'=' * 60}")
     print(f"Total files: {total:,}")
     print(f"Files modified: {modified_count:,}")
+    if failed_count:
+        print(f"Files failed: {failed_count:,}")
     print(f"Total words processed: {stats.total_words:,}")
     print(
         f"Words corrected: {stats.corrected_words:,} ({stats.corrected_words / stats.total_words * 100:.2f}%)"
@@ -400,19 +399,18 @@ def cmd_batch(args):
 
 def cmd_analyze(args):
     """Analyze what would be corrected without modifying."""
-    print("Loading SymSpell dictionary...", file=sys.stderr)
-    sym_spell = create_symspell(args.max_edit_distance)
-
     custom_vocab = None
     if args.vocab:
         custom_vocab = load_custom_vocab(args.vocab)
         print(f"Custom vocabulary: {len(custom_vocab):,} words to skip", file=sys.stderr)
 
+    print("Loading SymSpell dictionary...", file=sys.stderr)
+    create_symspell(args.max_edit_distance, custom_vocab)
+
     input_path = Path(args.input)
-    content = input_path.read_text(encoding="utf-8", errors="replace")
 
     stats = CorrectionStats()
-    _ = correct_text(content, sym_spell, stats, args.max_edit_distance, custom_vocab)
+    correct_file(input_path, None, stats, args.max_edit_distance)
 
     print(f"\nAnalysis of: {input_path}")
     print(f"{'=' * 60}")
@@ -465,9 +463,14 @@ Examples:
     batch_parser = subparsers.add_parser("batch", help="Clean all files in directory")
     batch_parser.add_argument("input_dir", type=str, help="Input directory")
     batch_parser.add_argument("-o", "--output-dir", type=str, help="Output directory")
-    batch_parser.add_argument("--pattern", default="*.txt", help="File pattern (default: *.txt)")
+    batch_parser.add_argument(
+        "--pattern",
+        default="*.txt",
+        help="File name pattern, matched at any depth; no '/' (default: *.txt)",
+    )
     batch_parser.add_argument("--vocab", type=str, help="Custom vocabulary file (words to skip)")
     batch_parser.add_argument("--report", type=str, help="Save stats report to JSON")
+    batch_parser.add_argument("--threads", type=int, help="Thread count (default: all CPU cores)")
 
     analyze_parser = subparsers.add_parser("analyze", help="Analyze without modifying")
     analyze_parser.add_argument("input", type=str, help="Input file")
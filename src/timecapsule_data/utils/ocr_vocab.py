@@ -19,10 +19,12 @@ Usage:
 
 import argparse
 import json
-import re
+import os
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TextIO
 
 
 def get_unique_path(path: Path) -> Path:
@@ -66,21 +68,15 @@ def load_known_vocab(filepath: Path | None = None) -> set[str]:
     if not filepath.exists():
         return set()
 
-    words = set()
     try:
-        with open(filepath, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
-                    continue
-                # Add lowercase version
-                words.add(line.lower())
+        # One read and one lowercase pass over the whole file, not per line
+        text = filepath.read_text(encoding="utf-8").lower()
     except Exception as e:
         print(f"Warning: Could not load known vocab from {filepath}: {e}", file=sys.stderr)
         return set()
 
-    return words
+    # Skip comments and empty lines
+    return {line for line in map(str.strip, text.splitlines()) if line and line[0] != "#"}
 
 
 # Load known vocab at module import time
@@ -95,137 +91,114 @@ KNOWN_VOCAB: set[str] = load_known_vocab()
 # Patterns
 # =============================================================================
 
-WORD_PATTERN = re.compile(r"\b([a-zA-Z][a-zA-Z']*[a-zA-Z]|[a-zA-Z])\b")
+# NOTE: Word scanning is done in Rust (rust_ocr_clean.extract_vocab_*) with the regex crate,
+# which matches in linear time without backtracking.
 
 # NOTE: Suspicious pattern checking is now done exclusively in Rust (rust_ocr_clean module).
 # The Rust implementation handles patterns for: camelCase, triple repeats, consonant runs,
 # confusable chars (requiring actual digits/pipes), and rn/m confusion.
 
-# =============================================================================
-# Pattern-based whitelist (skip these patterns during extraction)
-# These are legitimate patterns that would otherwise be flagged as unknown
-# =============================================================================
-SKIP_PATTERNS = [
-    # Roman numerals (valid sequences only: I, V, X, L, C, D, M)
-    # Matches: III, VIII, XIII, XLVIII, MCMXCIX, etc.
-    # Does NOT match corrupted ones like IIL, IIII, VX (invalid sequences)
-    re.compile(r"^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$"),
-    # Scottish/Irish surname prefixes (Mc/Mac + capital + lowercase)
-    # Matches: McDonald, McLean, MacArthur, MacNeil, etc.
-    re.compile(r"^M[ac][A-Z][a-z]+$"),
-    re.compile(r"^Mac[A-Z][a-z]+$"),
-    # Common -ville place name suffix (American towns)
-    # Matches: Nashville, Louisville, Taylorsville, etc.
-    re.compile(r"^[A-Z][a-z]+ville$"),
-]
-
-
-def matches_skip_pattern(word: str) -> bool:
-    """Check if word matches any skip pattern (known legitimate patterns)."""
-    for pattern in SKIP_PATTERNS:
-        if pattern.match(word):
-            return True
-    return False
-
-
 # Common words to skip (too common to be interesting)
 # Global interrupt flag for signal handler access from nested functions
 _interrupted = False
 
 
-SKIP_WORDS = {
-    "a",
-    "an",
-    "the",
-    "and",
-    "or",
-    "but",
-    "in",
-    "on",
-    "at",
-    "to",
-    "for",
-    "of",
-    "with",
-    "by",
-    "from",
-    "as",
-    "is",
-    "was",
-    "are",
-    "were",
-    "been",
-    "be",
-    "have",
-    "has",
-    "had",
-    "do",
-    "does",
-    "did",
-    "will",
-    "would",
-    "could",
-    "should",
-    "may",
-    "might",
-    "must",
-    "shall",
-    "can",
-    "need",
-    "this",
-    "that",
-    "these",
-    "those",
-    "it",
-    "its",
-    "he",
-    "she",
-    "they",
-    "him",
-    "her",
-    "them",
-    "his",
-    "their",
-    "my",
-    "your",
-    "our",
-    "who",
-    "which",
-    "what",
-    "where",
-    "when",
-    "why",
-    "how",
-    "all",
-    "each",
-    "every",
-    "both",
-    "few",
-    "more",
-    "most",
-    "other",
-    "some",
-    "such",
-    "no",
-    "not",
-    "only",
-    "same",
-    "so",
-    "than",
-    "too",
-    "very",
-    "just",
-    "also",
-    "now",
-    "i",
-    "you",
-    "we",
-    "me",
-    "us",
-}
-
-
-@dataclass
+# Mirrors SKIP_WORDS in rust-ocr-clean, which applies it during extraction
+SKIP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "as",
+        "is",
+        "was",
+        "are",
+        "were",
+        "been",
+        "be",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "need",
+        "this",
+        "that",
+        "these",
+        "those",
+        "it",
+        "its",
+        "he",
+        "she",
+        "they",
+        "him",
+        "her",
+        "them",
+        "his",
+        "their",
+        "my",
+        "your",
+        "our",
+        "who",
+        "which",
+        "what",
+        "where",
+        "when",
+        "why",
+        "how",
+        "all",
+        "each",
+        "every",
+        "both",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "not",
+        "only",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "just",
+        "also",
+        "now",
+        "i",
+        "you",
+        "we",
+        "me",
+        "us",
+    }
+)
+
+
+@dataclass(slots=True)
 class VocabCandidate:
     """A vocabulary candidate with metadata."""
 
@@ -282,19 +255,23 @@ def extract_context(text: str, match_start: int, match_end: int, context_chars:
     return context
 
 
-def format_output(
+def write_output(
+    fp: TextIO,
     candidates: dict[str, VocabCandidate],
     min_freq: int,
     output_format: str,
     show_known: bool = False,
-) -> str:
-    """Format candidates for output."""
+) -> None:
+    """Format candidates for output, writing them to fp as they are formatted."""
     global _interrupted
 
-    # Filter candidates - check interrupt periodically for large datasets
-    filtered = []
+    # Filter candidates and split them into output sections in one pass -
+    # check interrupt periodically for large datasets
+    suspicious = []
+    capitalized = []
+    other = []
     check_interval = 100_000  # Check every 100k items
-    for i, (key, c) in enumerate(candidates.items()):
+    for i, c in enumerate(candidates.values()):
         if i % check_interval == 0 and _interrupted:
             break
         if c.frequency < min_freq:
@@ -302,16 +279,30 @@ def format_output(
         # By default, only show unknown words (not in dictionary)
         if not show_known and not c.is_unknown:
             continue
-        filtered.append(c)
+        if c.is_suspicious:
+            suspicious.append(c)
+        elif c.is_capitalized:
+            capitalized.append(c)
+        else:
+            other.append(c)
 
     if _interrupted:
-        return ""  # Early exit on interrupt
+        return  # Early exit on interrupt
+
+    # Each section by frequency descending
+    def by_frequency(c: VocabCandidate) -> int:
+        return -c.frequency
 
-    # Sort: suspicious first, then by frequency descending
-    filtered.sort(key=lambda c: (not c.is_suspicious, -c.frequency))
+    suspicious.sort(key=by_frequency)
+    capitalized.sort(key=by_frequency)
+    other.sort(key=by_frequency)
 
     if output_format == "json":
-        return json.dumps(
+        # Suspicious first, then the rest by frequency (two sorted runs, a cheap merge)
+        normal = capitalized + other
+        normal.sort(key=by_frequency)
+        filtered = suspicious + normal
+        json.dump(
             [
                 {
                     "word": c.word,
@@ -324,36 +315,37 @@ def format_output(
                 }
                 for c in filtered
             ],
+            fp,
             indent=2,
         )
+        return
+
+    def emit(line: str = "") -> None:
+        fp.write(line)
+        fp.write("\n")
 
     # Text format for human review
-    lines = []
-    lines.append("# Vocabulary Candidates for Review")
-    lines.append("#")
-    lines.append("# Format: FREQ | FLAGS | WORD | SAMPLE CONTEXT")
-    lines.append("# Flags: C=Capitalized, U=Unknown, ?=Suspicious (review carefully)")
-    lines.append("#")
-    lines.append("# Instructions:")
-    lines.append("#   1. Review each candidate")
-    lines.append("#   2. Delete lines that are OCR errors (don't protect them)")
-    lines.append("#   3. Keep lines that are legitimate words/names")
-    lines.append("#   4. Save as approved_vocab.txt (just the words, one per line)")
-    lines.append("#")
-    lines.append(f"# Total candidates: {len(filtered)}")
-    lines.append("#" + "=" * 78)
-    lines.append("")
-
-    # Separate suspicious from normal
-    suspicious = [c for c in filtered if c.is_suspicious]
-    normal = [c for c in filtered if not c.is_suspicious]
+    emit("# Vocabulary Candidates for Review")
+    emit("#")
+    emit("# Format: FREQ | FLAGS | WORD | SAMPLE CONTEXT")
+    emit("# Flags: C=Capitalized, U=Unknown, ?=Suspicious (review carefully)")
+    emit("#")
+    emit("# Instructions:")
+    emit("#   1. Review each candidate")
+    emit("#   2. Delete lines that are OCR errors (don't protect them)")
+    emit("#   3. Keep lines that are legitimate words/names")
+    emit("#   4. Save as approved_vocab.txt (just the words, one per line)")
+    emit("#")
+    emit(f"# Total candidates: {len(suspicious) + len(capitalized) + len(other)}")
+    emit("#" + "=" * 78)
+    emit()
 
     if suspicious:
-        lines.append("# ⚠️  SUSPICIOUS - Review carefully (likely OCR errors)")
-        lines.append(
+        emit("# ⚠️  SUSPICIOUS - Review carefully (likely OCR errors)")
+        emit(
             "# Category codes: M=mixed_case, R=repeated, G=garbage, C=confusable, X=modern, F=fragment"
         )
-        lines.append("#" + "-" * 78)
+        emit("#" + "-" * 78)
         for c in suspicious:
             flags = ""
             flags += "C" if c.is_capitalized else " "
@@ -362,38 +354,32 @@ def format_output(
             # Extract category code from suspicious_reason (e.g., "M:mixed_case" -> "M")
             cat = c.suspicious_reason.split(":")[0] if c.suspicious_reason else "-"
             context = c.contexts[0] if c.contexts else ""
-            lines.append(f"{c.frequency:6d} | {flags} | {cat:2s} | {c.word:20s} | {context}")
-        lines.append("")
+            emit(f"{c.frequency:6d} | {flags} | {cat:2s} | {c.word:20s} | {context}")
+        emit()
 
-    if normal:
-        lines.append("# Capitalized words (likely proper nouns)")
-        lines.append("#" + "-" * 78)
-        capitalized = [c for c in normal if c.is_capitalized]
+    if capitalized or other:
+        emit("# Capitalized words (likely proper nouns)")
+        emit("#" + "-" * 78)
         for c in capitalized:
             flags = "C"
             flags += "U" if c.is_unknown else " "
             flags += " "
             context = c.contexts[0] if c.contexts else ""
-            lines.append(f"{c.frequency:6d} | {flags} | {c.word:20s} | {context}")
-        lines.append("")
+            emit(f"{c.frequency:6d} | {flags} | {c.word:20s} | {context}")
+        emit()
 
-        lines.append("# Other unknown words (may be historical terms, technical vocab)")
-        lines.append("#" + "-" * 78)
-        other = [c for c in normal if not c.is_capitalized]
+        emit("# Other unknown words (may be historical terms, technical vocab)")
+        emit("#" + "-" * 78)
         for c in other:
             flags = " "
             flags += "U" if c.is_unknown else " "
             flags += " "
             context = c.contexts[0] if c.contexts else ""
-            lines.append(f"{c.frequency:6d} | {flags} | {c.word:20s} | {context}")
-
-    return "\n".join(lines)
+            emit(f"{c.frequency:6d} | {flags} | {c.word:20s} | {context}")
 
 
 def cmd_extract(args):
     """Extract vocabulary candidates from corpus."""
-    import fnmatch
-    import os
     import signal
     import time
 
@@ -470,30 +456,12 @@ def cmd_extract(args):
         if known_vocab:
             rust_ocr_clean.init_whitelist(list(known_vocab))
 
-        # Fast file discovery
-        print(f"Scanning {input_dir} for {args.pattern} files...", end="", flush=True)
+        # Determine thread count (default: all CPU cores, can be overridden)
+        num_threads = getattr(args, "threads", None) or os.cpu_count() or 1
 
-        def fast_find_files(directory: Path, pattern: str) -> list[Path]:
-            results = []
-            dirs_to_scan = [directory]
-            scanned = 0
-            while dirs_to_scan:
-                current_dir = dirs_to_scan.pop()
-                try:
-                    with os.scandir(current_dir) as it:
-                        for entry in it:
-                            if entry.is_dir(follow_symlinks=False):
-                                dirs_to_scan.append(Path(entry.path))
-                            elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
-                                results.append(Path(entry.path))
-                except PermissionError:
-                    continue
-                scanned += 1
-                if scanned % 500 == 0:
-                    print(".", end="", flush=True)
-            return results
-
-        files = fast_find_files(input_dir, args.pattern)
+        # Fast file discovery (parallel directory walk in Rust)
+        print(f"Scanning {input_dir} for {args.pattern} files...", end="", flush=True)
+        files = rust_ocr_clean.find_files(str(input_dir), args.pattern, num_threads)
         total_files = len(files)
         print(f" found {total_files:,} files", file=sys.stderr)
 
@@ -501,9 +469,6 @@ def cmd_extract(args):
             print(f"No files matching '{args.pattern}' found in {input_dir}", file=sys.stderr)
             sys.exit(1)
 
-        # Determine thread count (default 24, can be overridden)
-        num_threads = getattr(args, "threads", 24) or 24
-
         print(f"\n{'=' * 60}", file=sys.stderr)
         print(
             f"Vocabulary Extraction - Rust engine (parallel, {num_threads} threads)",
@@ -525,7 +490,7 @@ def cmd_extract(args):
                 break
 
             chunk_end = min(chunk_start + chunk_size, total_files)
-            chunk_paths = [str(f) for f in files[chunk_start:chunk_end]]
+            chunk_paths = files[chunk_start:chunk_end]
 
             # Parallel processing within chunk
             stats, batch_results = rust_extract_batch_parallel(
@@ -607,7 +572,8 @@ def cmd_extract(args):
 
         # Post-process: dictionary check for suspicious words
         # NOTE: Rust now does dictionary checks during extraction, but we do a final pass
-        # here to catch any edge cases with the is_known_word function
+        # here to catch any edge cases (a candidate's preferred form can change as
+        # chunks merge). All words are checked in one parallel Rust call.
         if not _interrupted and rust_ocr_clean.dictionaries_loaded():
             suspicious_to_check = [
                 c for c in candidates.values() if c.is_suspicious and c.frequency >= args.min_freq
@@ -617,32 +583,27 @@ def cmd_extract(args):
                     f"\nDictionary check for {len(suspicious_to_check):,} suspicious candidates...",
                     file=sys.stderr,
                 )
+                languages = rust_ocr_clean.known_word_languages(
+                    [c.word for c in suspicious_to_check]
+                )
                 cleared = 0
-                lang_counts: dict[str, int] = {}
-                for c in suspicious_to_check:
-                    if is_known_word(c.word):
+                # Track which languages recognized the cleared words
+                lang_counts: Counter[str] = Counter()
+                for c, langs in zip(suspicious_to_check, languages):
+                    if langs:
                         c.is_suspicious = False
                         c.is_unknown = False
                         cleared += 1
-                        # Track which languages recognized this word
-                        for lang in get_word_languages(c.word):
-                            lang_counts[lang] = lang_counts.get(lang, 0) + 1
+                        lang_counts.update(langs)
                 print(f"  Cleared {cleared:,} as known dictionary words", file=sys.stderr)
                 if lang_counts:
-                    # Sort by count descending
-                    sorted_langs = sorted(lang_counts.items(), key=lambda x: -x[1])
-                    lang_summary = ", ".join(f"{lang}: {count}" for lang, count in sorted_langs)
+                    lang_summary = ", ".join(
+                        f"{lang}: {count}" for lang, count in lang_counts.most_common()
+                    )
                     print(f"  By language: {lang_summary}", file=sys.stderr)
 
         # Generate output (skip if interrupted)
         if not _interrupted:
-            output = format_output(
-                candidates,
-                min_freq=args.min_freq,
-                output_format=args.format,
-                show_known=args.show_known,
-            )
-
             # Default output to parent of input dir
             input_path = Path(args.input_dir)
             if args.output:
@@ -653,7 +614,14 @@ def cmd_extract(args):
             # Don't overwrite existing files - add numeric suffix
             output_path = get_unique_path(output_path)
 
-            output_path.write_text(output, encoding="utf-8")
+            with open(output_path, "w", encoding="utf-8") as fp:
+                write_output(
+                    fp,
+                    candidates,
+                    min_freq=args.min_freq,
+                    output_format=args.format,
+                    show_known=args.show_known,
+                )
             print(f"\nOutput written to: {output_path}", file=sys.stderr)
         else:
             print("\nSkipped output generation due to interrupt.", file=sys.stderr)
@@ -4,7 +4,7 @@ This module provides high-performance OCR text cleanup, vocabulary extraction,
 document triage, and language detection functions implemented in Rust.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 
 # =============================================================================
 # Classes (PyO3 exported)
@@ -59,6 +59,10 @@ class CleanupResult:
     """Total number of substitutions made."""
     substitutions_by_category: dict[str, int]
     """Substitution counts by category (e.g., 'li_h_confusion': 45, 'long_s': 123)."""
+    garbage_issues: list[tuple[str, int]]
+    """Garbage patterns matched more than 5 times in the input, as (pattern, count).
+
+    Counting stops past the threshold, so count is capped at 6."""
 
 class LangDetectResult:
     """Result of language detection."""
@@ -114,9 +118,29 @@ def clean_text_with_categories(text: str) -> CleanupResult:
     """
     ...
 
+def check_garbage(text: str) -> list[tuple[str, int]]:
+    """Check text for unfixable garbage OCR patterns.
+
+    Args:
+        text: Input text to check.
+
+    Returns:
+        List of (pattern, count) for each pattern matching more than 5 times.
+        Counting stops there, so count is at most 6.
+    """
+    ...
+
 def clean_file_to_file(
     input_path: str, output_path: str
-) -> tuple[bool, int, int, dict[str, int], list[tuple[str, str, int, int, int]]]:
+) -> tuple[
+    bool,
+    int,
+    int,
+    dict[str, int],
+    list[tuple[str, str, int, int, int]],
+    list[tuple[str, int]],
+    int,
+]:
     """Clean a file and write result to output path.
 
     Pipeline: strip boilerplate -> OCR cleanup -> write output.
@@ -126,12 +150,15 @@ def clean_file_to_file(
         output_path: Path to write cleaned output.
 
     Returns:
-        Tuple of (was_modified, substitution_count, bytes_read, categories_dict, boilerplate_regions).
+        Tuple of (was_modified, substitution_count, bytes_read, categories_dict, boilerplate_regions,
+        garbage_issues, chars_read).
         - was_modified: True if any changes were made (boilerplate or OCR cleanup)
         - substitution_count: Number of OCR substitutions made
         - bytes_read: Size of input file in bytes
         - categories_dict: Maps category names (e.g., 'long_s', 'li_h_confusion') to counts
         - boilerplate_regions: List of (category, pattern_name, start_line, end_line, char_count)
+        - garbage_issues: List of (pattern, count) for flagged garbage patterns
+        - chars_read: Length of the decoded input text in characters
     """
     ...
 
@@ -221,6 +248,16 @@ class BatchStats:
     long_s_fixes: int
     boilerplate_files: int
     boilerplate_chars: int
+    files_flagged: int
+    substitutions_by_category: dict[str, int]
+
+class CorpusAnalysis:
+    """OCR error summary for a sampled corpus."""
+
+    files_analyzed: int
+    total_words: int
+    error_counts: dict[str, int]
+    garbage_files: list[str]
 
 class TriageResultWithLang:
     """Triage result with integrated language detection."""
@@ -253,19 +290,61 @@ class TriageBatchStats:
 # =============================================================================
 
 def clean_batch_parallel(
-    file_pairs: list[tuple[str, str]], num_threads: int | None = None
+    input_paths: list[str], output_paths: list[str], num_threads: int | None = None
 ) -> BatchStats:
     """Clean multiple files in parallel using Rayon.
 
     Args:
-        file_pairs: List of (input_path, output_path) tuples.
-        num_threads: Number of threads (default: 24).
+        input_paths: List of input file paths.
+        output_paths: List of output file paths, parallel to input_paths.
+        num_threads: Number of threads (default: all CPU cores).
 
     Returns:
         BatchStats with aggregated statistics.
     """
     ...
 
+def find_files(root: str, pattern: str, num_threads: int | None = None) -> list[str]:
+    """Recursively find files whose names match a glob pattern.
+
+    Subdirectories are walked in parallel with Rayon. Matching follows
+    fnmatch rules (case-sensitive); symlinked directories are not followed
+    and unreadable directories are skipped.
+
+    Args:
+        root: Directory to search.
+        pattern: File name pattern (e.g., '*.txt').
+        num_threads: Number of threads (default: all CPU cores).
+
+    Returns:
+        List of matching file paths.
+    """
+    ...
+
+def analyze_corpus(
+    root: str,
+    pattern: str,
+    sample_size: int,
+    seed: int | None = None,
+    num_threads: int | None = None,
+) -> CorpusAnalysis:
+    """Analyze a random sample of a corpus for OCR errors without modifying it.
+
+    Files are reservoir-sampled during a single directory walk (same matching
+    rules as find_files), then analyzed in parallel with Rayon.
+
+    Args:
+        root: Directory to search.
+        pattern: File name pattern (e.g., '*.txt').
+        sample_size: Maximum number of files to analyze.
+        seed: Sampling seed (default: random).
+        num_threads: Number of threads (default: all CPU cores).
+
+    Returns:
+        CorpusAnalysis with word count, error counts by category and garbage files.
+    """
+    ...
+
 def triage_batch_parallel(
     paths: list[str],
     num_threads: int | None = None,
@@ -277,7 +356,7 @@ def triage_batch_parallel(
 
     Args:
         paths: List of file paths to triage.
-        num_threads: Number of threads (default: 24).
+        num_threads: Number of threads (default: all CPU cores).
         lang_confidence_threshold: Minimum confidence for English (default: 0.5).
 
     Returns:
@@ -352,6 +431,8 @@ def detect_language_file(
 ) -> LangDetectResult:
     """Detect the language of a file.
 
+    Only the head of the file (enough bytes for the 10k-char sample) is read.
+
     Args:
         path: Path to file to analyze.
         confidence_threshold: Minimum confidence to consider English (default 0.5).
@@ -475,6 +556,18 @@ def word_languages(word: str) -> list[str]:
     """
     ...
 
+def known_word_languages(words: list[str]) -> list[list[str]]:
+    """word_languages for many words in one call, checked in parallel.
+
+    Args:
+        words: Words to check.
+
+    Returns:
+        Language codes recognizing each word, in order. A word is known
+        (is_known_word) exactly when its list is non-empty.
+    """
+    ...
+
 def dictionaries_loaded() -> bool:
     """Check if dictionaries have been initialized.
 
@@ -483,6 +576,68 @@ def dictionaries_loaded() -> bool:
     """
     ...
 
+def init_score_words(words: list[str]) -> int:
+    """Set the supplementary known words used by score_words.
+
+    Replaces any previously set words. Comparison is case-insensitive.
+
+    Args:
+        words: Known words (e.g., ocr_score's Dictionary.words).
+
+    Returns:
+        Number of unique words stored.
+    """
+    ...
+
+def score_words(words: list[str]) -> tuple[int, int, list[str], str]:
+    """Score extracted words for OCR quality in one call.
+
+    Number-like words (roman numerals, ordinals) are skipped. Remaining words
+    count as garbage if they match a garbage shape (5+ consonants, 4+ vowels,
+    4+ repeated characters, 3+ symbols), otherwise as unknown if found in
+    neither the score words nor the loaded dictionaries. The dominant language
+    is the en/de/fr/la dictionary that recognised the most of the first 1000
+    words past those checks, tallied during the same lookups.
+
+    Args:
+        words: Words to score.
+
+    Returns:
+        Tuple of (unknown_count, garbage_count, up to 20 most common unknown words,
+        dominant language code such as "en", or "unknown").
+    """
+    ...
+
+def score_text_words(text: str) -> tuple[int, int, int, list[str], str]:
+    """Extract words from text and score them in one call.
+
+    Words are letter runs with an optional contraction (single letters other
+    than a/i/o are dropped), then classified as in score_words.
+
+    Args:
+        text: Text to score.
+
+    Returns:
+        Tuple of (total_words, unknown_count, garbage_count, up to 20 most common
+        unknown words, dominant language code).
+    """
+    ...
+
+def score_file_words(path: str) -> tuple[int, int, int, list[str], str]:
+    """Read a file and score its words like score_text_words, without decoding it.
+
+    Args:
+        path: File to score.
+
+    Returns:
+        Tuple of (total_words, unknown_count, garbage_count, up to 20 most common
+        unknown words, dominant language code).
+
+    Raises:
+        IOError: If the file cannot be read.
+    """
+    ...
+
 def init_whitelist(words: list[str]) -> int:
     """Initialize the whitelist with known good words to skip during vocab extraction.
 
@@ -634,7 +789,23 @@ class StripBatchStats:
 def init_noise_words(vocab_path: str, categories: list[str] | None = None) -> int:
     """Initialize noise word set from vocab candidates file.
 
-    Filters to only specified categories (default: G and R).
+    Filters to only specified categories (default: G and R). Calling again
+    with the same unchanged file and categories reuses the loaded set.
+
+    Args:
+        vocab_path: Path to vocab candidates file.
+        categories: List of category codes to include (default: ["G", "R"]).
+
+    Returns:
+        Count of noise words loaded.
+    """
+    ...
+
+def init_noise_words_compact(vocab_path: str, categories: list[str] | None = None) -> int:
+    """Initialize the noise word set like init_noise_words, stored compactly.
+
+    Words are packed into one sorted buffer and found by binary search,
+    using a fraction of the memory of the default hash set.
 
     Args:
         vocab_path: Path to vocab candidates file.
@@ -645,6 +816,10 @@ def init_noise_words(vocab_path: str, categories: list[str] | None = None) -> in
     """
     ...
 
+def clear_noise_words() -> None:
+    """Unload the noise word set (stripping then leaves text unchanged)."""
+    ...
+
 def noise_words_count() -> int:
     """Get the count of currently loaded noise words.
 
@@ -676,13 +851,29 @@ def strip_noise_file(input_path: str, output_path: str) -> tuple[bool, int, int]
     """
     ...
 
+def count_noise_words_file(input_path: str) -> int:
+    """Count the noise words in a file without building the cleaned text.
+
+    Streams the file line by line without holding the GIL, so memory stays
+    bounded by the longest line.
+
+    Args:
+        input_path: Path to input file.
+
+    Returns:
+        Number of words strip_noise_file would strip.
+    """
+    ...
+
 def strip_noise_batch_parallel(
-    file_pairs: list[tuple[str, str]], num_threads: int
+    input_paths: list[str], output_paths: list[str] | None, num_threads: int
 ) -> StripBatchStats:
     """Batch strip noise words with Rayon parallelization.
 
     Args:
-        file_pairs: List of (input_path, output_path) tuples.
+        input_paths: List of input file paths.
+        output_paths: List of output file paths, parallel to input_paths,
+            or None to strip the inputs in place.
         num_threads: Number of threads to use.
 
     Returns:
@@ -691,7 +882,7 @@ def strip_noise_batch_parallel(
     ...
 
 def strip_noise_batch_parallel_logged(
-    file_pairs: list[tuple[str, str]], num_threads: int
+    input_paths: list[str], output_paths: list[str] | None, num_threads: int
 ) -> tuple[StripBatchStats, list[tuple[str, int]]]:
     """Batch strip noise words with per-file logging.
 
@@ -699,10 +890,185 @@ def strip_noise_batch_parallel_logged(
     (path, words_stripped) for files that were modified.
 
     Args:
-        file_pairs: List of (input_path, output_path) tuples.
+        input_paths: List of input file paths.
+        output_paths: List of output file paths, parallel to input_paths,
+            or None to strip the inputs in place.
         num_threads: Number of threads to use.
 
     Returns:
         Tuple of (StripBatchStats, list of (path, words_stripped) for modified files).
     """
     ...
+
+class CancelToken:
+    """Cancellation flag polled by long-running calls between files."""
+
+    def __init__(self) -> None: ...
+    def cancel(self) -> None:
+        """Ask the running call to stop. Safe to call from a signal handler."""
+        ...
+    def is_cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        ...
+
+def strip_noise_dir(
+    input_dir: str,
+    output_dir: str,
+    num_threads: int,
+    log_path: str | None = None,
+    progress: Callable[[int, int, StripBatchStats], bool | None] | None = None,
+    batch_size: int = 1000,
+    cancel: CancelToken | None = None,
+) -> tuple[StripBatchStats, int]:
+    """Strip noise words from every *.txt file under a directory in one call.
+
+    Files are found with the parallel directory walk and stripped on a
+    work-stealing thread pool without holding the GIL. Outputs mirror the input tree
+    under output_dir (pass input_dir again to modify files in place). When no files
+    are found, neither output_dir nor the log file is created.
+
+    Args:
+        input_dir: Directory to search for *.txt files.
+        output_dir: Output root (same as input_dir for in-place).
+        num_threads: Number of threads to use.
+        log_path: If set, write a JSONL line {"path", "words_stripped"} per
+            modified file (path relative to input_dir), in completion order.
+        progress: Called as progress(files_done, total_files, stats) once after
+            discovery (files_done=0) and every batch_size files with running
+            totals. Returning True skips files not yet started.
+        batch_size: Files between progress calls.
+        cancel: If cancelled (from any thread), files not yet started are
+            skipped and the call returns once in-flight files finish.
+
+    Returns:
+        Tuple of (StripBatchStats totals, total_files found).
+    """
+    ...
+
+# =============================================================================
+# SymSpell Correction Functions
+# =============================================================================
+
+def symspell_load_dictionary(
+    dictionary_path: str,
+    max_edit_distance: int = 2,
+    prefix_length: int = 7,
+    cache_path: str | None = None,
+) -> int:
+    """Load a SymSpell frequency dictionary, replacing any loaded one.
+
+    Args:
+        dictionary_path: File of "term count" lines (symspellpy's format).
+        max_edit_distance: Largest edit distance lookups may use.
+        prefix_length: Length of the word prefixes indexed by deletes.
+        cache_path: If set, the built delete index is loaded from this file
+            when it was made from the same dictionary text and settings, and
+            (re)written to it otherwise. Cache write failures are ignored.
+
+    Returns:
+        Number of dictionary words.
+    """
+    ...
+
+def symspell_set_skip_words(words: list[str]) -> int:
+    """Set the words symspell_correct_text never corrects (case-insensitive).
+
+    Returns:
+        Number of distinct skip words.
+    """
+    ...
+
+def symspell_correct_text(
+    text: str, max_edit_distance: int = 2, min_word_length: int = 4
+) -> tuple[str, int, int, int, dict[str, int]]:
+    """Correct OCR errors in text with the loaded SymSpell dictionary.
+
+    Runs without holding the GIL. Skip words, words shorter than
+    min_word_length or longer than 25 letters, words with digits and short
+    all-caps abbreviations are left alone. Corrections keep the word's case.
+
+    Args:
+        text: Text to correct.
+        max_edit_distance: Maximum edit distance for suggestions.
+        min_word_length: Shortest word considered for correction.
+
+    Returns:
+        Tuple of (corrected_text, total_words, corrected_words, skipped_words,
+        corrections), where corrections maps "word -> corrected" to counts.
+    """
+    ...
+
+class SymSpellBatchStats:
+    """Statistics from batch SymSpell correction."""
+
+    files_processed: int
+    files_modified: int
+    files_failed: int
+    total_words: int
+    corrected_words: int
+    skipped_words: int
+    corrections: dict[str, int]
+
+def symspell_correct_dir(
+    input_dir: str,
+    output_dir: str | None,
+    num_threads: int,
+    pattern: str = "*.txt",
+    max_edit_distance: int = 2,
+    min_word_length: int = 4,
+    progress: Callable[[int, int], bool | None] | None = None,
+    batch_size: int = 1000,
+    cancel: CancelToken | None = None,
+) -> tuple[SymSpellBatchStats, int]:
+    """Correct every file matching pattern under a directory in one call.
+
+    Files are found with the parallel directory walk and corrected as by
+    symspell_correct_text, with invalid UTF-8 replaced, without holding the GIL
+    or building a Python path list. Outputs mirror the input tree under output_dir.
+
+    Args:
+        input_dir: Directory to search.
+        output_dir: Output root, or None to only count corrections.
+        num_threads: Number of worker threads.
+        pattern: fnmatch-style pattern matched against file names only, at any
+            depth (unlike Path.rglob, a directory part never matches).
+        max_edit_distance: Maximum edit distance for suggestions.
+        min_word_length: Shortest word considered for correction.
+        progress: Called as progress(files_done, total_files) once after
+            discovery (files_done=0) and every batch_size files. Returning
+            True skips files not yet started.
+        batch_size: Files between progress calls.
+        cancel: If cancelled (from any thread), files not yet started are
+            skipped and the call returns once in-flight files finish.
+
+    Returns:
+        Tuple of (SymSpellBatchStats totals, total_files found).
+    """
+    ...
+
+def symspell_correct_file(
+    input_path: str,
+    output_path: str | None = None,
+    max_edit_distance: int = 2,
+    min_word_length: int = 4,
+) -> tuple[bool, int, int, int, dict[str, int]]:
+    """Correct a file with the loaded SymSpell dictionary.
+
+    Reads, corrects and writes in Rust without holding the GIL, so the text
+    never becomes a Python string. Invalid UTF-8 is replaced.
+
+    Args:
+        input_path: File to correct.
+        output_path: Where to write the result (parent directories are
+            created), or None to only count corrections.
+        max_edit_distance: Maximum edit distance for suggestions.
+        min_word_length: Shortest word considered for correction.
+
+    Returns:
+        Tuple of (was_modified, total_words, corrected_words, skipped_words,
+        corrections), as for symspell_correct_text.
+
+    Raises:
+        IOError: If the input cannot be read or the output cannot be written.
+    """
+    ...